@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import curses
+import functools
 import logging
 import os
 import re
 import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
+import time
 from pathlib import Path
-from typing import List, Any, Optional
+from typing import Callable, Iterator, List, Any, Optional, Sequence
 
 from .browser import BrowserCallbacks, entry_browser_screen
 from .editor import Entry, EntryEditor, Viewer, autoformat_value
@@ -21,10 +25,10 @@ from .layout import (
     next_spinner,
     status_message,
 )
-from .domain import DictionaryFile, EntryRef, Case
-from .menus import Menu, RootMenu, Submenu
+from .domain import DictionaryFile, Case
+from .menus import Menu, RootMenu, Submenu, build_completion_index, completion_matches
 from .commands import CommandCallbacks, command_suggestions, handle_command
-from .config import get_config, key_in, fzf_enabled
+from .config import get_config, fzf_enabled
 from .tools import (
     tools_screen,
     diagnostics_screen,
@@ -33,8 +37,11 @@ from .tools import (
 from .openfoam import (
     FileCheckResult,
     OpenFOAMError,
+    StatCache,
     discover_case_files,
     ensure_environment,
+    file_stamp,
+    keyword_index,
     list_keywords,
     list_subkeys,
     read_entry,
@@ -43,6 +50,26 @@ from .openfoam import (
 )
 
 
+_CHECK_POLL_MS = 150
+_CHECK_PUBLISH_S = 0.1
+_SUSPICIOUS_SCAN_LIMIT = 2 * 1024 * 1024
+# Banner and FoamFile block sit at the top; never read mesh-sized bodies.
+_HEADER_READ_BYTES = 4096
+# Header-version voting only samples small files.
+_HEADER_CANDIDATE_MAX_BYTES = 64 * 1024
+_INDEX_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+_CELLS_RE = re.compile(r"number of cells\s*:\s*(\d+)", re.IGNORECASE)
+_CELLS_FALLBACK_RE = re.compile(r"cells\s*:\s*(\d+)", re.IGNORECASE)
+_SKEW_RE = re.compile(r"max\s+skewness\s*=\s*([0-9eE.+-]+)", re.IGNORECASE)
+# The first hit decides: a banner "Version:" before FoamFile, or the FoamFile block.
+_HEADER_VERSION_RE = re.compile(
+    r"Version:\s*([^\s|]+)|^[ \t]*FoamFile\b[^{]*\{([^}]*)\}",
+    re.IGNORECASE | re.MULTILINE,
+)
+_FOAMFILE_VERSION_RE = re.compile(r"^\s*version\s+([^\s;]+)", re.IGNORECASE | re.MULTILINE)
+
+
 class Screen(Enum):
     MAIN_MENU = "main_menu"
     EDITOR = "editor"
@@ -55,31 +82,145 @@ class Screen(Enum):
     NO_FOAM_FILE = "no_foam_file"
 
 
+@dataclass(frozen=True, slots=True)
+class CheckSnapshot:
+    """
+    Progress of the background check. The worker publishes a new instance
+    by plain assignment, so readers never need the lock.
+    """
+
+    in_progress: bool = False
+    done: int = 0
+    total: int = 0
+    current: Optional[Path] = None
+
+
 @dataclass
 class AppState:
     no_foam: bool = False
     current_screen: Screen = Screen.MAIN_MENU
     last_action: Optional[str] = None
     check_lock: threading.Lock = field(default_factory=threading.Lock)
-    check_in_progress: bool = False
-    check_total: int = 0
-    check_done: int = 0
-    check_current: Optional[Path] = None
+    stat_cache: StatCache = field(default_factory=StatCache)
+    check_snapshot: CheckSnapshot = field(default_factory=CheckSnapshot)
     check_results: Optional[dict[Path, FileCheckResult]] = None
     check_thread: Optional[threading.Thread] = None
+    check_dirty: bool = False
+    check_results_version: int = 0
+    viewport: tuple[int, int] = (0, 0)
+    sections_cache: Optional[tuple[Path, tuple[int, ...], dict[str, list[Path]]]] = None
+    labels_cache: Optional[dict[Path, str]] = None
+    command_callbacks_cache: Optional[CommandCallbacks] = None
+    browser_callbacks_cache: Optional[BrowserCallbacks] = None
 
     def transition(self, screen: Screen, action: Optional[str] = None) -> None:
+        # Stats are only trusted within one screen; anything may change on disk
+        # while the user is elsewhere (editor, tools, shell).
+        self.stat_cache.invalidate_all()
         self.current_screen = screen
         if action is not None:
             self.last_action = action
 
     def check_status_line(self) -> str:
-        with self.check_lock:
-            if self.check_in_progress:
-                current = f" {self.check_current.name}" if self.check_current else ""
-                return f"{next_spinner()} check: {self.check_done}/{self.check_total}{current}"
+        snap = self.check_snapshot
+        if snap.in_progress:
+            current = f" {snap.current.name}" if snap.current else ""
+            return f"{next_spinner()} check: {snap.done}/{snap.total}{current}"
         return ""
 
+    def refresh_viewport(self, stdscr: Any) -> tuple[int, int]:
+        """
+        Re-read the terminal size; call on startup and on KEY_RESIZE.
+        """
+        self.viewport = stdscr.getmaxyx()
+        return self.viewport
+
+    def take_check_dirty(self) -> bool:
+        """
+        Return whether the check worker published new progress since the
+        last call, clearing the flag.
+        """
+        with self.check_lock:
+            dirty = self.check_dirty
+            self.check_dirty = False
+            return dirty
+
+    def get_sections(self, case_path: Path) -> dict[str, list[Path]]:
+        """
+        Return the discovered case files, rescanning only when the
+        case layout directories changed since the last scan.
+        """
+        signature = _sections_signature(case_path)
+        cached = self.sections_cache
+        if cached is not None and cached[0] == case_path and cached[1] == signature:
+            return cached[2]
+        sections = discover_case_files(case_path, stat_cache=self.stat_cache)
+        self.sections_cache = (case_path, signature, sections)
+        self.labels_cache = None
+        return sections
+
+    def file_labels(self, case_path: Path) -> dict[Path, str]:
+        """
+        Return case-relative POSIX labels for the discovered files,
+        computed once per sections scan.
+        """
+        sections = self.get_sections(case_path)
+        if self.labels_cache is None:
+            self.labels_cache = {
+                path: _relative_label(case_path, path)
+                for files in sections.values()
+                for path in files
+            }
+        return self.labels_cache
+
+    def invalidate_sections(self) -> None:
+        self.sections_cache = None
+        self.labels_cache = None
+
+    def command_callbacks(self) -> CommandCallbacks:
+        if self.command_callbacks_cache is None:
+            self.command_callbacks_cache = _command_callbacks()
+        return self.command_callbacks_cache
+
+    def browser_callbacks(self) -> BrowserCallbacks:
+        if self.browser_callbacks_cache is None:
+            self.browser_callbacks_cache = _browser_callbacks(self.command_callbacks())
+        return self.browser_callbacks_cache
+
+
+def _sections_signature(case_path: Path) -> tuple[tuple[str, int], ...]:
+    """
+    mtimes of every directory `discover_case_files` lists: the case,
+    system/, constant/ and each `0*` directory.
+    """
+    signature: list[tuple[str, int]] = []
+    for folder in (case_path, case_path / "system", case_path / "constant"):
+        try:
+            signature.append((folder.name, folder.stat().st_mtime_ns))
+        except OSError:
+            signature.append((folder.name, -1))
+    try:
+        with os.scandir(case_path) as it:
+            zero_dirs = [entry for entry in it if entry.name.startswith("0")]
+    except OSError:
+        zero_dirs = []
+    for entry in sorted(zero_dirs, key=lambda entry: entry.name):
+        try:
+            if entry.is_dir():
+                signature.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(signature)
+
+
+def _relative_label(case_path: Path, path: Path) -> str:
+    prefix = f"{case_path}{os.sep}"
+    text = str(path)
+    if text.startswith(prefix):
+        rel = text[len(prefix) :]
+        return rel if os.sep == "/" else rel.replace(os.sep, "/")
+    return path.relative_to(case_path).as_posix()
+
 
 def run_tui(case_dir: str, debug: bool = False, no_foam: bool = False) -> None:
     """
@@ -108,6 +249,7 @@ def _main(stdscr: Any, case_path: Path, debug: bool, state: AppState) -> None:
     fg = _color_from_name(cfg.colors.get("focus_fg", "black"), curses.COLOR_BLACK)
     bg = _color_from_name(cfg.colors.get("focus_bg", "cyan"), curses.COLOR_CYAN)
     curses.init_pair(1, fg, bg)
+    state.refresh_viewport(stdscr)
 
     if not state.no_foam:
         try:
@@ -134,7 +276,7 @@ def _main(stdscr: Any, case_path: Path, debug: bool, state: AppState) -> None:
 
 def _main_loop(stdscr: Any, case_path: Path, state: AppState) -> None:
     foam_case = Case(root=case_path)
-    sections = discover_case_files(foam_case.root)
+    sections = state.get_sections(foam_case.root)
     section_names = [name for name, files in sections.items() if files]
     if not section_names:
         stdscr.addstr("No OpenFOAM case files found.\n")
@@ -143,6 +285,11 @@ def _main_loop(stdscr: Any, case_path: Path, state: AppState) -> None:
         stdscr.getch()
         return
 
+    if not state.no_foam:
+        # Check in the background so results are ready when the user opens
+        # the check screen.
+        _start_check_thread(case_path, state, sections)
+
     next_screen: Optional[Screen] = Screen.MAIN_MENU
     while next_screen is not None:
         if next_screen == Screen.MAIN_MENU:
@@ -176,34 +323,27 @@ def _main_loop(stdscr: Any, case_path: Path, state: AppState) -> None:
         next_screen = Screen.MAIN_MENU
 
 
+_MAIN_MENU: tuple[tuple[str, Optional[Screen]], ...] = (
+    ("Editor", Screen.EDITOR),
+    ("Check syntax", Screen.CHECK),
+    ("Tools", Screen.TOOLS),
+    ("Diagnostics", Screen.DIAGNOSTICS),
+    ("Quit", None),
+)
+_MAIN_MENU_WITH_SEARCH = (*_MAIN_MENU[:-1], ("Global search", Screen.SEARCH), _MAIN_MENU[-1])
+
+
 def _main_menu_screen(
     stdscr: Any, case_path: Path, state: AppState
 ) -> Optional[Screen]:
     state.transition(Screen.MAIN_MENU)
-    has_fzf = fzf_enabled()
-
-    menu_options = [
-        "Editor",
-        "Check syntax",
-        "Tools",
-        "Diagnostics",
-    ]
-    check_index = 1
-    tools_index = 2
-    diag_index = 3
-
-    search_index: Optional[int] = None
-    if has_fzf:
-        search_index = len(menu_options)
-        menu_options.append("Global search")
-
-    quit_index = len(menu_options)
-    menu_options.append("Quit")
+    entries = _MAIN_MENU_WITH_SEARCH if fzf_enabled() else _MAIN_MENU
+    menu_options = [label for label, _screen in entries]
 
-    case_meta = _case_metadata(case_path)
+    case_meta = _case_metadata(case_path, state.stat_cache)
     banner_lines = case_banner_lines(case_meta)
     overview_lines = case_overview_lines(case_meta)
-    callbacks = _command_callbacks()
+    callbacks = state.command_callbacks()
     root_menu = RootMenu(
         stdscr,
         "Main menu",
@@ -214,17 +354,9 @@ def _main_menu_screen(
         command_suggestions=lambda: command_suggestions(case_path),
     )
     choice = root_menu.navigate()
-    if choice == -1 or choice == quit_index:
+    if choice == -1:
         return None
-    if choice == check_index:
-        return Screen.CHECK
-    if choice == tools_index:
-        return Screen.TOOLS
-    if choice == diag_index:
-        return Screen.DIAGNOSTICS
-    if search_index is not None and choice == search_index:
-        return Screen.SEARCH
-    return Screen.EDITOR
+    return entries[choice][1]
 
 
 def _select_case_file(
@@ -239,7 +371,7 @@ def _select_case_file(
         return None
 
     while True:
-        callbacks = _command_callbacks()
+        callbacks = state.command_callbacks()
         section_menu = Menu(
             stdscr,
             "Editor – select section",
@@ -257,9 +389,10 @@ def _select_case_file(
             _show_message(stdscr, f"No files found in section {section}.")
             continue
 
-        file_labels = [f.relative_to(case_path).as_posix() for f in files]
+        rel_labels = state.file_labels(case_path)
+        file_labels = [rel_labels.get(f) or _relative_label(case_path, f) for f in files]
         while True:
-            callbacks = _command_callbacks()
+            callbacks = state.command_callbacks()
             file_menu = Menu(
                 stdscr,
                 f"{section} files",
@@ -274,7 +407,7 @@ def _select_case_file(
 
 
 def _editor_screen(stdscr: Any, case_path: Path, state: AppState) -> None:
-    sections = discover_case_files(case_path)
+    sections = state.get_sections(case_path)
     while True:
         state.transition(Screen.EDITOR)
         file_path = _select_case_file(stdscr, case_path, state, sections)
@@ -285,7 +418,7 @@ def _editor_screen(stdscr: Any, case_path: Path, state: AppState) -> None:
             _no_foam_file_screen(stdscr, case_path, file_path, state)
         else:
             state.transition(Screen.ENTRY_BROWSER, action="entry_browser")
-            callbacks = _browser_callbacks(case_path, state)
+            callbacks = state.browser_callbacks()
             entry_browser_screen(stdscr, case_path, file_path, state, callbacks)
 
 
@@ -302,7 +435,7 @@ def _file_screen(stdscr: Any, case_path: Path, file_path: Path, state: AppState)
         return
 
     options = ["Edit entry", "View file", "Back"]
-    callbacks = _command_callbacks()
+    callbacks = state.command_callbacks()
     submenu = Submenu(
         stdscr,
         f"{file_path.relative_to(case_path)}",
@@ -325,7 +458,7 @@ def _no_foam_file_screen(
 ) -> None:
     options = ["View file", "Open in $EDITOR", "Back"]
     while True:
-        callbacks = _command_callbacks()
+        callbacks = state.command_callbacks()
         menu = Menu(
             stdscr,
             f"{file_path.relative_to(case_path)}",
@@ -340,6 +473,7 @@ def _no_foam_file_screen(
             _view_file_screen(stdscr, file_path)
         elif choice == 1:
             _open_file_in_editor(stdscr, file_path)
+            state.invalidate_sections()
 
 
 def _edit_entry_screen(
@@ -354,7 +488,7 @@ def _edit_entry_screen(
         _show_message(stdscr, "No entries found in file.")
         return
 
-    callbacks = _command_callbacks()
+    callbacks = state.command_callbacks()
     entry_menu = Menu(
         stdscr,
         "Select entry to edit",
@@ -373,7 +507,7 @@ def _edit_entry_screen(
     subkeys = list_subkeys(file_path, full_key)
     if subkeys:
         # Submenu to choose between browsing sub-entries or editing this entry directly.
-        callbacks = _command_callbacks()
+        callbacks = state.command_callbacks()
         submenu = Menu(
             stdscr,
             f"{full_key} is a dictionary",
@@ -406,7 +540,7 @@ def _edit_entry_screen(
 
     def on_save(new_value: str) -> bool:
         formatted = autoformat_value(new_value)
-        return write_entry(file_path, full_key, formatted)
+        return write_entry(file_path, full_key, formatted, stat_cache=state.stat_cache)
 
     editor = EntryEditor(
         stdscr,
@@ -421,120 +555,92 @@ def _edit_entry_screen(
 
 def _view_file_screen(stdscr: Any, file_path: Path) -> None:
     try:
-        content = file_path.read_text()
+        with file_path.open("rb") as handle:
+            content = handle.read().decode("utf-8", errors="replace")
     except OSError as exc:
         _show_message(stdscr, f"Failed to read file: {exc}")
         return
 
-    warnings = _find_suspicious_lines(content)
-    if warnings:
-        warning_text = "\n".join(["Suspicious lines detected:"] + warnings + ["", content])
+    header_lines: list[str] = []
+    if len(content) > _SUSPICIOUS_SCAN_LIMIT:
+        # Large files are usually mesh/field data where the heuristics are noise.
+        header_lines = ["Suspicious-line scan skipped for large file.", ""]
     else:
-        warning_text = content
+        warnings = _find_suspicious_lines(content)
+        if warnings:
+            header_lines = ["Suspicious lines detected:", *warnings, ""]
 
-    viewer = Viewer(stdscr, warning_text)
+    viewer = Viewer(stdscr, content, header_lines)
     viewer.display()
 
 
+_COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)
+_HEADER_SKIP_PREFIXES = ("/*", "*", "|", "\\", "//")
+
+
+def _blank_comment(match: re.Match[str]) -> str:
+    # Keep the newlines so line numbers in warnings still match the file.
+    return "\n" * match.group().count("\n")
+
+
 def _find_suspicious_lines(content: str) -> list[str]:
     warnings: list[str] = []
     brace_depth = 0
-    header_done = False
-    in_block_comment = False
-
-    lines = content.splitlines()
 
-    def next_significant_line(idx: int) -> Optional[str]:
-        for j in range(idx + 1, len(lines)):
-            candidate = lines[j].strip()
-            if not candidate:
-                continue
-            if candidate.startswith("//"):
-                continue
-            if candidate.startswith("/*") or candidate.startswith("*"):
-                continue
-            return candidate
-        return None
-    for idx, raw in enumerate(lines, 1):
+    raw_lines = content.splitlines()
+    # An unterminated block comment hides everything after it.
+    content = _COMMENT_RE.sub(_blank_comment, content)
+    open_comment = content.find("/*")
+    if open_comment != -1:
+        content = content[:open_comment]
+    lines = [line.strip() for line in content.splitlines()]
+    lines.extend("" for _ in range(len(raw_lines) - len(lines)))
+
+    # next_sig[i] is the first non-blank cleaned line after line i.
+    next_sig: list[Optional[str]] = [None] * len(lines)
+    following: Optional[str] = None
+    for i in range(len(lines) - 1, -1, -1):
+        next_sig[i] = following
+        if lines[i]:
+            following = lines[i]
+
+    # Resolve the banner/FoamFile header up front so the body loop
+    # below carries no per-line header state.
+    body_start = len(lines)
+    for i, raw in enumerate(raw_lines):
         stripped = raw.strip()
-
-        if not header_done:
-            lower = stripped.lower()
-            if (
-                not stripped
-                or stripped.startswith("/*")
-                or stripped.startswith("*")
-                or stripped.startswith("|")
-                or stripped.startswith("\\")
-                or stripped.startswith("//")
-            ):
-                continue
-            if "foamfile" in lower:
-                header_done = True
-                continue
-            header_done = True
-
-        line = raw
-
-        # Remove block comments while keeping text outside them.
-        cleaned = ""
-        remainder = line
-        while remainder:
-            if in_block_comment:
-                end = remainder.find("*/")
-                if end == -1:
-                    remainder = ""
-                    break
-                remainder = remainder[end + 2 :]
-                in_block_comment = False
-                continue
-            start = remainder.find("/*")
-            if start == -1:
-                cleaned += remainder
-                break
-            cleaned += remainder[:start]
-            remainder = remainder[start + 2 :]
-            end = remainder.find("*/")
-            if end == -1:
-                in_block_comment = True
-                remainder = ""
-            else:
-                remainder = remainder[end + 2 :]
-
-        line = cleaned
-        if in_block_comment:
-            # Inside a multi-line block comment; nothing to check on this line.
+        if not stripped or stripped.startswith(_HEADER_SKIP_PREFIXES):
             continue
+        is_foamfile = len(stripped) >= 8 and "foamfile" in stripped.lower()
+        body_start = i + 1 if is_foamfile else i
+        break
 
-        # Strip single-line comments.
-        if "//" in line:
-            line = line.split("//", 1)[0]
-
-        stripped_line = line.strip()
+    for idx, stripped_line in enumerate(lines[body_start:], body_start + 1):
         if not stripped_line:
             continue
 
         # Track brace balance to flag premature closing braces.
-        for ch in line:
-            if ch == "{":
-                brace_depth += 1
-            elif ch == "}":
-                brace_depth -= 1
-                if brace_depth < 0:
-                    warnings.append(f"Line {idx}: unexpected '}}'.")
-                    brace_depth = 0
+        closes = stripped_line.count("}")
+        if closes > brace_depth:
+            for ch in stripped_line:
+                if ch == "{":
+                    brace_depth += 1
+                elif ch == "}":
+                    brace_depth -= 1
+                    if brace_depth < 0:
+                        warnings.append(f"Line {idx}: unexpected '}}'.")
+                        brace_depth = 0
+        else:
+            brace_depth += stripped_line.count("{") - closes
 
         # Skip blank lines and comments/includes when checking semicolons.
         if stripped_line.startswith("#include") or stripped_line.startswith("#ifdef"):
             continue
-        if "{" in line and "}" in line:
-            continue
-        if stripped_line.endswith(";") or stripped_line.endswith("{") or stripped_line.endswith("}"):
+        if "{" in stripped_line and closes:
             continue
-        if stripped_line.endswith("(") or stripped_line.endswith(")"):
+        if stripped_line.endswith((";", "{", "}", "(", ")")):
             continue
-        next_line = next_significant_line(idx - 1)
-        if next_line == "{":
+        if next_sig[idx - 1] == "{":
             continue
 
         warnings.append(f"Line {idx}: missing ';'? -> {stripped_line[:60]}")
@@ -553,13 +659,15 @@ def _show_message(stdscr: Any, message: str) -> None:
     stdscr.getch()
 
 
-def _prompt_command(stdscr: Any, suggestions: Optional[list[str]]) -> str:
+def _prompt_command(stdscr: Any, suggestions: Optional[Sequence[str]]) -> str:
     height, width = stdscr.getmaxyx()
     buffer: list[str] = []
     cursor = 0
     last_matches: list[str] = []
     match_index = 0
     last_buffer = ""
+    pending: Optional[int] = None
+    completion_index: Optional[list[tuple[str, int]]] = None
 
     def render() -> None:
         try:
@@ -574,7 +682,10 @@ def _prompt_command(stdscr: Any, suggestions: Optional[list[str]]) -> str:
 
     render()
     while True:
-        key = stdscr.getch()
+        if pending is not None:
+            key, pending = pending, None
+        else:
+            key = stdscr.getch()
 
         if key in (curses.KEY_ENTER, 10, 13):
             return "".join(buffer).strip()
@@ -597,10 +708,11 @@ def _prompt_command(stdscr: Any, suggestions: Optional[list[str]]) -> str:
             render()
             continue
         if key == 9:  # TAB
-            pool = suggestions or []
+            if completion_index is None:
+                completion_index = build_completion_index(suggestions or [])
             current = "".join(buffer)
             if current != last_buffer:
-                last_matches = [s for s in pool if s.startswith(current)]
+                last_matches = completion_matches(completion_index, current)
                 match_index = 0
                 last_buffer = current
             if last_matches:
@@ -611,8 +723,21 @@ def _prompt_command(stdscr: Any, suggestions: Optional[list[str]]) -> str:
                 render()
             continue
         if 32 <= key <= 126:
-            buffer.insert(cursor, chr(key))
-            cursor += 1
+            # Drain a pasted burst before redrawing the prompt once.
+            burst = [chr(key)]
+            stdscr.nodelay(True)
+            try:
+                while True:
+                    key = stdscr.getch()
+                    if not 32 <= key <= 126:
+                        break
+                    burst.append(chr(key))
+            finally:
+                stdscr.nodelay(False)
+            if key != -1:
+                pending = key
+            buffer[cursor:cursor] = burst
+            cursor += len(burst)
             render()
 
 
@@ -626,18 +751,13 @@ def _command_callbacks() -> CommandCallbacks:
     )
 
 
-def _browser_callbacks(case_path: Path, state: AppState) -> BrowserCallbacks:
-    cmd_callbacks = _command_callbacks()
-
-    def handle_cmd(stdscr: Any, path: Path, app_state: AppState, cmd: str) -> Optional[str]:
-        return handle_command(stdscr, path, app_state, cmd, cmd_callbacks)
-
+def _browser_callbacks(cmd_callbacks: CommandCallbacks) -> BrowserCallbacks:
     return BrowserCallbacks(
         show_message=_show_message,
         view_file=_view_file_screen,
         prompt_command=_prompt_command,
         command_suggestions=command_suggestions,
-        handle_command=handle_cmd,
+        handle_command=functools.partial(handle_command, callbacks=cmd_callbacks),
         mode_status=_mode_status,
     )
 
@@ -658,61 +778,94 @@ def _mode_status(state: AppState) -> str:
     return f"mode: {mode}{suffix}"
 
 
-def _start_check_thread(case_path: Path, state: AppState) -> None:
+def _start_check_thread(
+    case_path: Path,
+    state: AppState,
+    sections: Optional[dict[str, list[Path]]] = None,
+) -> None:
+    if sections is None:
+        sections = state.get_sections(case_path)
+    state.check_snapshot = CheckSnapshot(in_progress=True)
+
     def worker() -> None:
-        sections = discover_case_files(case_path)
         total = sum(len(files) for files in sections.values())
+        state.check_snapshot = CheckSnapshot(in_progress=True, total=total)
         with state.check_lock:
-            state.check_in_progress = True
-            state.check_total = total
-            state.check_done = 0
-            state.check_current = None
             state.check_results = {}
+            state.check_results_version += 1
+
+        # Progress is accumulated locally and published to the UI at most
+        # every _CHECK_PUBLISH_S so the lock is not taken once per file.
+        done = 0
+        current: Optional[Path] = None
+        pending: dict[Path, FileCheckResult] = {}
+        last_publish = 0.0
+
+        def publish() -> None:
+            nonlocal last_publish
+            now = time.monotonic()
+            if now - last_publish < _CHECK_PUBLISH_S:
+                return
+            last_publish = now
+            state.check_snapshot = CheckSnapshot(True, done, total, current)
+            with state.check_lock:
+                if pending:
+                    if state.check_results is None:
+                        state.check_results = {}
+                    state.check_results.update(pending)
+                    state.check_results_version += 1
+                state.check_dirty = True
+            pending.clear()
 
         def progress_callback(path: Path) -> None:
-            with state.check_lock:
-                state.check_done += 1
-                state.check_current = path
+            nonlocal done, current
+            done += 1
+            current = path
+            publish()
 
         def result_callback(path: Path, result: FileCheckResult) -> None:
-            with state.check_lock:
-                if state.check_results is None:
-                    state.check_results = {}
-                state.check_results[path] = result
+            pending[path] = result
+            publish()
 
         try:
             results = verify_case(
-                case_path, progress=progress_callback, result_callback=result_callback
+                case_path,
+                progress=progress_callback,
+                result_callback=result_callback,
+                sections=sections,
             )
         except (OpenFOAMError, OSError):
             results = {}
+        pending.clear()
         with state.check_lock:
             state.check_results = results
-            state.check_in_progress = False
+            state.check_results_version += 1
+            state.check_dirty = True
+        state.check_snapshot = CheckSnapshot(False, done, total, current)
 
     thread = threading.Thread(target=worker, daemon=True)
     state.check_thread = thread
     thread.start()
 
 
+_COLOR_MAP = {
+    "black": curses.COLOR_BLACK,
+    "red": curses.COLOR_RED,
+    "green": curses.COLOR_GREEN,
+    "yellow": curses.COLOR_YELLOW,
+    "blue": curses.COLOR_BLUE,
+    "magenta": curses.COLOR_MAGENTA,
+    "cyan": curses.COLOR_CYAN,
+    "white": curses.COLOR_WHITE,
+}
+
+
 def _color_from_name(value: str, default: int) -> int:
-    mapping = {
-        "black": curses.COLOR_BLACK,
-        "red": curses.COLOR_RED,
-        "green": curses.COLOR_GREEN,
-        "yellow": curses.COLOR_YELLOW,
-        "blue": curses.COLOR_BLUE,
-        "magenta": curses.COLOR_MAGENTA,
-        "cyan": curses.COLOR_CYAN,
-        "white": curses.COLOR_WHITE,
-    }
-    return mapping.get(value.strip().lower(), default)
+    return _COLOR_MAP.get(value.strip().lower(), default)
 
 
 def _check_syntax_screen(stdscr: Any, case_path: Path, state: AppState) -> None:
-    if state.check_in_progress:
-        pass
-    if state.check_results is None and not state.check_in_progress:
+    if state.check_results is None and not state.check_snapshot.in_progress:
         _start_check_thread(case_path, state)
 
     _check_syntax_menu(stdscr, case_path, state)
@@ -720,7 +873,8 @@ def _check_syntax_screen(stdscr: Any, case_path: Path, state: AppState) -> None:
 
 def _check_syntax_menu(stdscr: Any, case_path: Path, state: AppState) -> None:
     cfg = get_config()
-    sections = discover_case_files(case_path)
+    sections = state.get_sections(case_path)
+    rel_labels = state.file_labels(case_path)
     files: list[Path] = []
     for group in sections.values():
         files.extend(group)
@@ -730,37 +884,64 @@ def _check_syntax_menu(stdscr: Any, case_path: Path, state: AppState) -> None:
 
     current = 0
     scroll = 0
-    stdscr.timeout(200)
+    dirty = True
+    labels_version = -1
+    height, _ = state.refresh_viewport(stdscr)
+    visible = max(0, height - 3 - 1)
+    up_keys = cfg.keys_up | {curses.KEY_UP}
+    down_keys = cfg.keys_down | {curses.KEY_DOWN}
+    top_keys = cfg.keys_top
+    bottom_keys = cfg.keys_bottom
+    back_keys = cfg.keys_back
+    help_keys = cfg.keys_help
+    command_keys = cfg.keys_command
+    select_keys = cfg.keys_select
     try:
         while True:
-            labels, checks = _check_labels(case_path, files, state)
-            status = _status_with_check(state, "Check syntax")
-            status = f"{status} | {_mode_status(state)}" if status else _mode_status(state)
-            _draw_check_menu(stdscr, labels, checks, current, scroll, status)
+            if state.take_check_dirty():
+                dirty = True
+            if dirty:
+                with state.check_lock:
+                    version = state.check_results_version
+                if version != labels_version:
+                    labels, checks = _check_labels(case_path, files, state, rel_labels)
+                    labels_version = version
+                status = _status_with_check(state, "Check syntax")
+                status = f"{status} | {_mode_status(state)}" if status else _mode_status(state)
+                _draw_check_menu(stdscr, labels, checks, current, scroll, status)
+                dirty = False
+            # Only poll while the worker can still publish progress; otherwise
+            # block until the next keypress instead of waking up periodically.
+            polling = state.check_snapshot.in_progress or state.check_dirty
+            stdscr.timeout(_CHECK_POLL_MS if polling else -1)
             key = stdscr.getch()
             if key == -1:
                 continue
-            if key in (curses.KEY_UP,) or key_in(key, cfg.keys.get("up", [])):
+            dirty = True
+            if key == curses.KEY_RESIZE:
+                height, _ = state.refresh_viewport(stdscr)
+                visible = max(0, height - 3 - 1)
+            elif key in up_keys:
                 current = (current - 1) % len(labels)
-            elif key in (curses.KEY_DOWN,) or key_in(key, cfg.keys.get("down", [])):
+            elif key in down_keys:
                 current = (current + 1) % len(labels)
-            elif key_in(key, cfg.keys.get("top", [])):
+            elif key in top_keys:
                 current = 0
-            elif key_in(key, cfg.keys.get("bottom", [])):
+            elif key in bottom_keys:
                 current = len(labels) - 1
-            elif key_in(key, cfg.keys.get("back", [])):
+            elif key in back_keys:
                 return
-            elif key_in(key, cfg.keys.get("help", [])):
+            elif key in help_keys:
                 _show_message(
                     stdscr,
                     "Check syntax menu\n\nEnter: view result, q/h: back\n\nProgress is shown in the status bar.",
                 )
-            elif key_in(key, cfg.keys.get("command", [])):
-                callbacks = _command_callbacks()
+            elif key in command_keys:
+                callbacks = state.command_callbacks()
                 command = _prompt_command(stdscr, command_suggestions(case_path))
                 if command and handle_command(stdscr, case_path, state, command, callbacks) == "quit":
                     return
-            elif key_in(key, cfg.keys.get("select", [])):
+            elif key in select_keys:
                 file_path = files[current]
                 check = checks[current]
                 rel = file_path.relative_to(case_path)
@@ -770,19 +951,23 @@ def _check_syntax_menu(stdscr: Any, case_path: Path, state: AppState) -> None:
                 if _show_check_result(stdscr, rel, check):
                     _view_file_screen(stdscr, file_path)
 
-            scroll = _menu_scroll(current, scroll, stdscr, len(labels), header_rows=3)
+            scroll = _menu_scroll(current, scroll, visible, len(labels))
     finally:
         stdscr.timeout(-1)
 
 
 def _check_labels(
-    case_path: Path, files: list[Path], state: AppState
+    case_path: Path,
+    files: list[Path],
+    state: AppState,
+    rel_labels: Optional[dict[Path, str]] = None,
 ) -> tuple[list[str], list[Optional[FileCheckResult]]]:
     labels: list[str] = []
     checks: list[Optional[FileCheckResult]] = []
     results = state.check_results or {}
+    rel_labels = rel_labels or {}
     for file_path in files:
-        rel = file_path.relative_to(case_path)
+        rel = rel_labels.get(file_path) or _relative_label(case_path, file_path)
         check = results.get(file_path)
         checks.append(check)
         if check is None or not check.checked:
@@ -805,38 +990,39 @@ def _draw_check_menu(
     scroll: int,
     status: str,
 ) -> None:
-    stdscr.clear()
+    # erase() lets curses diff against the previous frame; clear() would
+    # force a full terminal repaint on every redraw.
+    stdscr.erase()
     height, width = stdscr.getmaxyx()
     header = "Check syntax – select file"
+    limit = max(1, width - 1)
     try:
-        stdscr.addstr(0, 0, header[: max(1, width - 1)])
-        stdscr.addstr(1, 0, "Enter: view result  q/h: back"[: max(1, width - 1)])
+        stdscr.addstr(0, 0, header[:limit])
+        stdscr.addstr(1, 0, "Enter: view result  q/h: back"[:limit])
     except curses.error:
         pass
 
     start_row = 3
     visible = max(0, height - start_row - 1)
-    for idx in range(scroll, min(len(labels), scroll + visible)):
-        prefix = ">> " if idx == current else "   "
-        line = f"{prefix}{labels[idx]}"
-        is_checked = checks[idx] is not None and checks[idx].checked
-        try:
-            if is_checked:
-                stdscr.attron(curses.A_BOLD)
-            stdscr.addstr(start_row + (idx - scroll), 0, line[: max(1, width - 1)])
-            if is_checked:
-                stdscr.attroff(curses.A_BOLD)
-        except curses.error:
-            break
+    end = min(len(labels), scroll + visible)
+    rows = [
+        f"{'>> ' if idx == current else '   '}{labels[idx]}"[:limit]
+        for idx in range(scroll, end)
+    ]
+    try:
+        if rows:
+            stdscr.addstr(start_row, 0, "\n".join(rows))
+        for idx in range(scroll, end):
+            check = checks[idx]
+            if check is not None and check.checked:
+                stdscr.chgat(start_row + idx - scroll, 0, limit, curses.A_BOLD)
+    except curses.error:
+        pass
 
     draw_status_bar(stdscr, status)
 
 
-def _menu_scroll(
-    current: int, scroll: int, stdscr: Any, total: int, header_rows: int
-) -> int:
-    height, _ = stdscr.getmaxyx()
-    visible = max(0, height - header_rows - 1)
+def _menu_scroll(current: int, scroll: int, visible: int, total: int) -> int:
     if visible <= 0:
         return 0
     if current < scroll:
@@ -850,7 +1036,7 @@ def _menu_scroll(
 
 
 def _show_progress(stdscr: Any, message: str) -> None:
-    stdscr.clear()
+    stdscr.erase()
     try:
         stdscr.addstr(message + "\n")
     except curses.error:
@@ -867,7 +1053,7 @@ def _show_check_result(stdscr: Any, rel_path: Path, result: FileCheckResult) ->
     elif result.warnings:
         status = "Warnings"
 
-    stdscr.clear()
+    stdscr.erase()
     line = f"{rel_path}: {status}"
     try:
         stdscr.addstr(line + "\n\n")
@@ -886,15 +1072,37 @@ def _show_check_result(stdscr: Any, rel_path: Path, result: FileCheckResult) ->
         else:
             stdscr.addstr("No issues detected.\n\n")
         stdscr.addstr("Press 'v' to view file or any other key to return.\n")
-        stdscr.refresh()
     except curses.error:
-        stdscr.refresh()
+        pass
+    stdscr.refresh()
 
     ch = stdscr.getch()
     return ch in (ord("v"), ord("V"))
 
 
 
+def _run_fzf(lines: list[str]) -> Optional[str]:
+    """
+    Pipe newline-terminated lines into fzf and return its output, or None
+    if the user cancelled.
+    """
+    # Binary pipes: skip the text wrapper and decode only fzf's selection.
+    proc = subprocess.Popen(["fzf"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        # The with block closes stdin even when fzf hangs up mid-write.
+        with proc.stdin:
+            proc.stdin.writelines(line.encode("utf-8") for line in lines)
+    except BrokenPipeError:
+        # fzf exits as soon as a selection is made, even mid-stream.
+        pass
+    output = proc.stdout.read()
+    proc.stdout.close()
+    if proc.wait() != 0:
+        return None
+    return output.decode("utf-8", errors="replace")
+
+
 def _global_search_screen(stdscr: Any, case_path: Path, state: AppState) -> None:
     """
     Global search wrapper around `fzf`.
@@ -908,53 +1116,54 @@ def _global_search_screen(stdscr: Any, case_path: Path, state: AppState) -> None
         return
 
     foam_case = Case(root=case_path)
-    sections = discover_case_files(foam_case.root)
-    entries: list[EntryRef] = []
-
-    for _section, files in sections.items():
-        for file_path in files:
-            status_message(stdscr, f"Indexing {file_path.relative_to(case_path)}...")
-            dict_file = DictionaryFile(foam_case.root, file_path)
+    sections = state.get_sections(foam_case.root)
+    # One "rel_path<TAB>key" line per entry, formatted once and streamed to fzf.
+    lines: list[str] = []
+    files = [file_path for group in sections.values() for file_path in group]
+    keys_by_file: dict[Path, list[str]] = {}
+
+    # list_keywords is a foamDictionary subprocess per file; run them
+    # concurrently since each thread just waits on its child process.
+    with ThreadPoolExecutor(max_workers=_INDEX_WORKERS) as pool:
+        futures = {pool.submit(list_keywords, file_path): file_path for file_path in files}
+        for done, future in enumerate(as_completed(futures), 1):
+            status_message(stdscr, f"Indexing {done}/{len(files)}...")
             try:
-                keys = list_keywords(file_path)
+                keys_by_file[futures[future]] = future.result()
             except OpenFOAMError as exc:
                 if state.no_foam:
+                    pool.shutdown(cancel_futures=True)
                     _show_message(
                         stdscr,
                         f"Global search failed: {exc} (no-foam mode may disable OpenFOAM tools)",
                     )
                     return
-                continue
-            for key in keys:
-                entries.append(EntryRef(dict_file, key))
 
-    if not entries:
+    for file_path in files:
+        keys = keys_by_file.get(file_path)
+        if not keys:
+            continue
+        prefix = f"{DictionaryFile(foam_case.root, file_path).rel}\t"
+        lines.extend(f"{prefix}{key}\n" for key in keys)
+
+    if not lines:
         _show_message(stdscr, "No entries found for global search.")
         return
 
-    # Prepare lines for fzf: rel_path<TAB>key
-    fzf_input = "\n".join(f"{ref.file.rel}\t{ref.key}" for ref in entries)
-
     # Temporarily suspend curses UI while running fzf.
     curses.def_prog_mode()
     curses.endwin()
     try:
-        result = subprocess.run(
-            ["fzf"],
-            input=fzf_input,
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        result = _run_fzf(lines)
     finally:
         # Restore curses mode and refresh the screen.
         curses.reset_prog_mode()
         stdscr.clear()
         stdscr.refresh()
 
-    if result.returncode != 0:
+    if result is None:
         return
-    selected = result.stdout.strip()
+    selected = result.strip()
     if not selected:
         return
 
@@ -964,22 +1173,17 @@ def _global_search_screen(stdscr: Any, case_path: Path, state: AppState) -> None
     rel_str, full_key = parts
     file_path = case_path / rel_str
 
+    # Try to locate the key at top level.
+    base_key = full_key.split(".")[-1]
     try:
-        keys = list_keywords(file_path)
+        initial_index = keyword_index(file_path, base_key) or 0
     except OpenFOAMError as exc:
         _show_message(stdscr, f"Failed to load keys for {rel_str}: {exc}")
         return
 
-    # Try to locate the key at top level.
-    base_key = full_key.split(".")[-1]
-    try:
-        initial_index = keys.index(base_key)
-    except ValueError:
-        initial_index = 0
-
     # Jump into the entry browser at the selected key; from there user can
     # edit and navigate as if they arrived via the normal editor path.
-    callbacks = _browser_callbacks(case_path, state)
+    callbacks = state.browser_callbacks()
     entry_browser_screen(
         stdscr,
         case_path,
@@ -991,7 +1195,7 @@ def _global_search_screen(stdscr: Any, case_path: Path, state: AppState) -> None
 
 
 def _open_file_in_editor(stdscr: Any, file_path: Path) -> None:
-    editor = os.environ.get("EDITOR") or "vi"
+    editor = get_config().editor
     curses.endwin()
     try:
         subprocess.run([editor, str(file_path)], check=False)
@@ -1002,17 +1206,57 @@ def _open_file_in_editor(stdscr: Any, file_path: Path) -> None:
         stdscr.refresh()
 
 
-def _case_metadata(case_path: Path) -> dict[str, str]:
+# Detector results keyed by (detector, path) -> (mtime stamp, value), so
+# metadata refreshes only re-read files that changed on disk.
+_META_CACHE: dict[tuple[str, Path], tuple[Any, Any]] = {}
+
+
+def _cached_meta(key: tuple[str, Path], stamp: Any, compute: Callable[[], Any]) -> Any:
+    hit = _META_CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    value = compute()
+    _META_CACHE[key] = (stamp, value)
+    return value
+
+
+def _case_metadata(
+    case_path: Path, stat_cache: Optional[StatCache] = None
+) -> dict[str, str]:
+    if stat_cache is None:
+        stat_cache = StatCache()
+    system_dir = case_path / "system"
+    checkmesh_log = _latest_checkmesh_log(case_path)
+    stamp = (
+        file_stamp(system_dir / "controlDict", stat_cache),
+        file_stamp(system_dir / "decomposeParDict", stat_cache),
+        checkmesh_log,
+        file_stamp(checkmesh_log, stat_cache) if checkmesh_log else None,
+        *(
+            getattr(stat_cache.stat(folder), "st_mtime_ns", None)
+            for folder in (case_path, system_dir, case_path / "constant", case_path / "0")
+        ),
+    )
+    return dict(
+        _cached_meta(
+            ("case", case_path),
+            stamp,
+            lambda: _compute_case_metadata(case_path, stat_cache),
+        )
+    )
+
+
+def _compute_case_metadata(case_path: Path, stat_cache: StatCache) -> dict[str, str]:
     latest_time = _latest_time(case_path)
     status = "ran" if latest_time not in ("0", "0.0", "") else "clean"
-    parallel = _detect_parallel_settings(case_path)
-    mesh = _detect_mesh_stats(case_path)
+    parallel = _detect_parallel_settings(case_path, stat_cache)
+    mesh = _detect_mesh_stats(case_path, stat_cache)
     return {
         "case_name": case_path.name,
         "case_path": str(case_path),
-        "solver": _detect_solver(case_path),
+        "solver": _detect_solver(case_path, stat_cache),
         "foam_version": _detect_openfoam_version(),
-        "case_header_version": _detect_case_header_version(case_path),
+        "case_header_version": _detect_case_header_version(case_path, stat_cache),
         "latest_time": latest_time,
         "status": status,
         "mesh": mesh,
@@ -1020,10 +1264,15 @@ def _case_metadata(case_path: Path) -> dict[str, str]:
     }
 
 
-def _detect_solver(case_path: Path) -> str:
+def _detect_solver(case_path: Path, stat_cache: Optional[StatCache] = None) -> str:
     control_dict = case_path / "system" / "controlDict"
-    if not control_dict.is_file():
+    stamp = file_stamp(control_dict, stat_cache or StatCache())
+    if stamp is None:
         return "unknown"
+    return _cached_meta(("solver", control_dict), stamp, lambda: _read_solver(control_dict))
+
+
+def _read_solver(control_dict: Path) -> str:
     try:
         value = read_entry(control_dict, "application")
     except OpenFOAMError:
@@ -1035,10 +1284,19 @@ def _detect_solver(case_path: Path) -> str:
     return solver or "unknown"
 
 
-def _detect_parallel_settings(case_path: Path) -> str:
+def _detect_parallel_settings(
+    case_path: Path, stat_cache: Optional[StatCache] = None
+) -> str:
     decompose_dict = case_path / "system" / "decomposeParDict"
-    if not decompose_dict.is_file():
+    stamp = file_stamp(decompose_dict, stat_cache or StatCache())
+    if stamp is None:
         return "n/a"
+    return _cached_meta(
+        ("parallel", decompose_dict), stamp, lambda: _read_parallel_settings(decompose_dict)
+    )
+
+
+def _read_parallel_settings(decompose_dict: Path) -> str:
     number = _read_optional_entry(decompose_dict, "numberOfSubdomains")
     method = _read_optional_entry(decompose_dict, "method")
     if number and method:
@@ -1050,10 +1308,17 @@ def _detect_parallel_settings(case_path: Path) -> str:
     return "n/a"
 
 
-def _detect_mesh_stats(case_path: Path) -> str:
+def _detect_mesh_stats(case_path: Path, stat_cache: Optional[StatCache] = None) -> str:
     log_path = _latest_checkmesh_log(case_path)
     if log_path is None:
         return "unknown"
+    stamp = file_stamp(log_path, stat_cache or StatCache())
+    if stamp is None:
+        return "unknown"
+    return _cached_meta(("mesh", log_path), stamp, lambda: _read_mesh_stats(log_path))
+
+
+def _read_mesh_stats(log_path: Path) -> str:
     try:
         text = log_path.read_text(errors="ignore")
     except OSError:
@@ -1071,24 +1336,36 @@ def _detect_mesh_stats(case_path: Path) -> str:
 
 
 def _latest_checkmesh_log(case_path: Path) -> Optional[Path]:
-    candidates = list(case_path.glob("log.checkMesh*"))
-    if not candidates:
+    best: Optional[str] = None
+    best_mtime = 0.0
+    try:
+        with os.scandir(case_path) as it:
+            for entry in it:
+                if not entry.name.startswith("log.checkMesh"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if best is None or mtime > best_mtime:
+                    best, best_mtime = entry.path, mtime
+    except OSError:
         return None
-    return max(candidates, key=lambda path: path.stat().st_mtime)
+    return Path(best) if best is not None else None
 
 
 def _parse_cells_count(text: str) -> Optional[str]:
-    match = re.search(r"(?i)number of cells\\s*:\\s*(\\d+)", text)
+    match = _CELLS_RE.search(text)
     if match:
         return match.group(1)
-    match = re.search(r"(?i)cells\\s*:\\s*(\\d+)", text)
+    match = _CELLS_FALLBACK_RE.search(text)
     if match:
         return match.group(1)
     return None
 
 
 def _parse_max_skewness(text: str) -> Optional[str]:
-    match = re.search(r"(?i)max\\s+skewness\\s*=\\s*([0-9eE.+-]+)", text)
+    match = _SKEW_RE.search(text)
     if match:
         return match.group(1)
     return None
@@ -1101,7 +1378,12 @@ def _read_optional_entry(file_path: Path, key: str) -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_openfoam_version() -> str:
+    """
+    Report the sourced OpenFOAM version. The environment is fixed for the
+    life of the process, so the lookup (and any foamVersion call) runs once.
+    """
     for env in ("WM_PROJECT_VERSION", "FOAM_VERSION"):
         version = os.environ.get(env)
         if version:
@@ -1121,112 +1403,115 @@ def _detect_openfoam_version() -> str:
     return version or "unknown"
 
 
-def _detect_case_header_version(case_path: Path) -> str:
-    versions: list[str] = []
+def _detect_case_header_version(
+    case_path: Path, stat_cache: Optional[StatCache] = None
+) -> str:
+    if stat_cache is None:
+        stat_cache = StatCache()
+    counts: Counter[str] = Counter()
     control_dict = case_path / "system" / "controlDict"
-    control_version = _extract_header_version(control_dict)
+    control_version = _extract_header_version(control_dict, stat_cache)
     if control_version:
-        versions.append(control_version)
+        counts[control_version] += 1
 
-    sample_files = _case_header_candidates(case_path, max_files=20)
-    for path in sample_files:
-        if path == control_dict:
-            continue
-        version = _extract_header_version(path)
+    candidates = [
+        path for path in _case_header_candidates(case_path) if path != control_dict
+    ]
+    for index, path in enumerate(candidates):
+        if _header_vote_decided(counts, control_version, len(candidates) - index):
+            break
+        version = _extract_header_version(path, stat_cache)
         if version:
-            versions.append(version)
+            counts[version] += 1
 
-    if not versions:
+    if not counts:
         return "unknown"
 
-    counts: dict[str, int] = {}
-    for version in versions:
-        counts[version] = counts.get(version, 0) + 1
-
-    best_count = max(counts.values())
+    best_count = counts.most_common(1)[0][1]
     best_versions = [v for v, count in counts.items() if count == best_count]
     if control_version and control_version in best_versions:
         return control_version
     return sorted(best_versions)[0]
 
 
-def _parse_header_comment_version(text: str) -> Optional[str]:
+def _header_vote_decided(
+    counts: Counter[str], control_version: Optional[str], remaining: int
+) -> bool:
     """
-    Extract the version string from the ASCII banner that precedes FoamFile.
+    True when the unread files can no longer change the voting result.
     """
-    version_pattern = re.compile(r"Version:\s*([^\s|]+)", re.IGNORECASE)
-    for line in text.splitlines():
-        lower = line.lower()
-        if "foamfile" in lower:
-            break
-        match = version_pattern.search(line)
-        if match:
-            value = match.group(1).strip().strip("|")
-            if value:
-                return value
-    return None
-
-
-def _parse_foamfile_block_version(text: str) -> Optional[str]:
+    ranked = counts.most_common(2)
+    if not ranked:
+        return False
+    leader, lead = ranked[0]
+    margin = lead - (ranked[1][1] if len(ranked) > 1 else 0)
+    # A final tie still goes to controlDict, so it only needs to avoid being passed.
+    if leader == control_version:
+        return margin >= remaining
+    return margin > remaining
+
+
+def _extract_header_version(
+    path: Path, stat_cache: Optional[StatCache] = None
+) -> Optional[str]:
     """
-    Fallback: read the 'version' entry inside the FoamFile dictionary block.
+    Return the banner `Version:` if it precedes FoamFile, else the
+    `version` entry inside the FoamFile block.
     """
-    inside_block = False
-    for line in text.splitlines():
-        stripped = line.strip()
-        lower = stripped.lower()
-        if lower.startswith("foamfile"):
-            inside_block = True
-            continue
-        if inside_block and stripped.startswith("}"):
-            break
-        if inside_block and lower.startswith("version"):
-            parts = stripped.split()
-            if len(parts) >= 2:
-                value = parts[1].rstrip(";")
-                if value:
-                    return value
-    return None
-
-
-def _extract_header_version(path: Path) -> Optional[str]:
-    if not path.is_file():
+    if not (stat_cache or StatCache()).is_file(path):
         return None
     try:
-        text = path.read_text()
+        with path.open("rb") as handle:
+            head = handle.read(_HEADER_READ_BYTES)
     except OSError:
         return None
-    header_version = _parse_header_comment_version(text)
-    if header_version:
-        return header_version
-    return _parse_foamfile_block_version(text)
+    match = _HEADER_VERSION_RE.search(head.decode("utf-8", errors="ignore"))
+    if match is None:
+        return None
+    if match.group(1):
+        return match.group(1)
+    block = _FOAMFILE_VERSION_RE.search(match.group(2))
+    return block.group(1) if block else None
 
 
-def _case_header_candidates(case_path: Path, max_files: int = 20) -> list[Path]:
-    candidates: list[Path] = []
+def _case_header_candidates(case_path: Path, max_files: int = 20) -> Iterator[Path]:
+    """
+    Lazily yield small files from system/, constant/ and 0/ in name order.
+    """
+    count = 0
     for rel in ("system", "constant", "0"):
         folder = case_path / rel
-        if not folder.is_dir():
+        # DirEntry.is_file() reuses the d_type from readdir, so no per-file stat.
+        try:
+            with os.scandir(folder) as it:
+                entries = [entry for entry in it if entry.is_file()]
+        except OSError:
             continue
-        for entry in sorted(folder.iterdir()):
-            if entry.is_file():
-                candidates.append(entry)
-            if len(candidates) >= max_files:
-                return candidates
-    return candidates
+        entries.sort(key=lambda entry: entry.name)
+        for entry in entries:
+            try:
+                if entry.stat().st_size > _HEADER_CANDIDATE_MAX_BYTES:
+                    continue
+            except OSError:
+                continue
+            yield Path(entry.path)
+            count += 1
+            if count >= max_files:
+                return
 
 
 def _latest_time(case_path: Path) -> str:
     latest_value = 0.0
     found = False
-    for entry in case_path.iterdir():
-        if not entry.is_dir():
-            continue
-        try:
-            value = float(entry.name)
-        except ValueError:
-            continue
-        if not found or value > latest_value:
-            latest_value = value
-            found = True
+    with os.scandir(case_path) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            try:
+                value = float(entry.name)
+            except ValueError:
+                continue
+            if not found or value > latest_value:
+                latest_value = value
+                found = True
     return f"{latest_value:g}" if found else "0"
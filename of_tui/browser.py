@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import curses
 import os
+import re
 import subprocess
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Callable
+from typing import Any, Optional, Callable, Sequence
 
-from .config import get_config, key_in, fzf_enabled
+from .config import get_config, fzf_enabled
 from .editor import Entry, EntryEditor, autoformat_value
-from .entry_meta import get_entry_metadata, refresh_entry_cache
+from .entry_meta import (
+    EntryCache,
+    entry_haystack,
+    get_entry_metadata,
+    refresh_entry_cache,
+)
 from .layout import draw_status_bar, status_message
-from .openfoam import OpenFOAMError, list_keywords, read_entry, write_entry
+from .openfoam import (
+    OpenFOAMError,
+    keyword_positions,
+    list_keywords,
+    read_entry,
+    write_entry,
+)
 from .validation import Validator
 
 
@@ -20,8 +32,8 @@ from .validation import Validator
 class BrowserCallbacks:
     show_message: Callable[[Any, str], None]
     view_file: Callable[[Any, Path], None]
-    prompt_command: Callable[[Any, Optional[list[str]]], str]
-    command_suggestions: Callable[[Path], list[str]]
+    prompt_command: Callable[[Any, Optional[Sequence[str]]], str]
+    command_suggestions: Callable[[Path], Sequence[str]]
     handle_command: Callable[[Any, Path, Any, str], Optional[str]]
     mode_status: Callable[[Any], str]
 
@@ -39,16 +51,17 @@ def entry_browser_screen(
     """
     base_entry: Optional[str] = None
     stack: list[tuple[Optional[str], list[str], int]] = []
-    cache: dict[str, tuple[str, str, list[str], list[str], list[str]]] = {}
+    cache: EntryCache = {}
     list_scroll = 0
+    file_label = file_path.relative_to(case_path).as_posix()
+    case_name = case_path.name
+    windows: dict[str, Any] = {}
 
     try:
         status_message(stdscr, f"Loading entries for {file_path.name}...")
         keywords = list_keywords(file_path)
     except OpenFOAMError as exc:
-        callbacks.show_message(
-            stdscr, f"Error reading {file_path.relative_to(case_path)}: {exc}"
-        )
+        callbacks.show_message(stdscr, f"Error reading {file_label}: {exc}")
         return
 
     if not keywords:
@@ -57,8 +70,17 @@ def entry_browser_screen(
 
     index = 0 if initial_index is None else max(0, min(initial_index, len(keywords) - 1))
 
+    cfg = get_config()
+    up_keys = cfg.keys_up | {curses.KEY_UP}
+    down_keys = cfg.keys_down | {curses.KEY_DOWN}
+    top_keys = cfg.keys_top
+    bottom_keys = cfg.keys_bottom
+    back_keys = cfg.keys_back | {curses.KEY_LEFT}
+    search_keys = cfg.keys_search
+    help_keys = cfg.keys_help
+    command_keys = cfg.keys_command
+
     while True:
-        cfg = get_config()
         key = keywords[index]
         full_key = key if base_entry is None else f"{base_entry}.{key}"
 
@@ -72,8 +94,8 @@ def entry_browser_screen(
 
         _draw_entry_browser(
             stdscr,
-            case_path,
-            file_path,
+            case_name,
+            file_label,
             base_entry,
             keywords,
             index,
@@ -85,19 +107,20 @@ def entry_browser_screen(
             comments,
             info_lines,
             callbacks.mode_status(state),
+            windows,
         )
 
         key_code = stdscr.getch()
 
-        if key_code in (curses.KEY_UP,) or key_in(key_code, cfg.keys.get("up", [])):
+        if key_code in up_keys:
             index = (index - 1) % len(keywords)
-        elif key_code in (curses.KEY_DOWN,) or key_in(key_code, cfg.keys.get("down", [])):
+        elif key_code in down_keys:
             index = (index + 1) % len(keywords)
-        elif key_in(key_code, cfg.keys.get("top", [])):
+        elif key_code in top_keys:
             index = 0
-        elif key_in(key_code, cfg.keys.get("bottom", [])):
+        elif key_code in bottom_keys:
             index = len(keywords) - 1
-        elif key_code in (curses.KEY_LEFT,) or key_in(key_code, cfg.keys.get("back", [])):
+        elif key_code in back_keys:
             if stack:
                 base_entry, keywords, index = stack.pop()
             else:
@@ -136,17 +159,18 @@ def entry_browser_screen(
                 callbacks,
             )
         elif key_code == curses.KEY_RESIZE:
+            windows.clear()
             continue
-        elif key_in(key_code, cfg.keys.get("search", [])):
+        elif key_code in search_keys:
             new_index = _entry_browser_search(
                 stdscr, file_path, case_path, cache, keywords, index, callbacks
             )
             if new_index is not None:
                 index = new_index
             continue
-        elif key_in(key_code, cfg.keys.get("help", [])):
+        elif key_code in help_keys:
             _entry_browser_help(stdscr, callbacks)
-        elif key_in(key_code, cfg.keys.get("command", [])):
+        elif key_code in command_keys:
             command = callbacks.prompt_command(stdscr, callbacks.command_suggestions(case_path))
             if not command:
                 continue
@@ -156,8 +180,8 @@ def entry_browser_screen(
 
 def _draw_entry_browser(
     stdscr: Any,
-    case_path: Path,
-    file_path: Path,
+    case_name: str,
+    file_label: str,
     base_entry: Optional[str],
     keys: list[str],
     current_index: int,
@@ -169,139 +193,51 @@ def _draw_entry_browser(
     comments: list[str],
     info_lines: list[str],
     status_suffix: str,
+    windows: Optional[dict[str, Any]] = None,
 ) -> None:
     stdscr.clear()
     height, width = stdscr.getmaxyx()
     split_col = max(20, width // 2)
-    left_width = split_col - 1
-    right_width = width - split_col - 1
-
-    try:
-        left_win = stdscr.derwin(max(1, height - 1), split_col, 0, 0)
-        right_win = stdscr.derwin(max(1, height - 1), max(1, width - split_col), 0, split_col)
-    except curses.error:
-        left_win = stdscr
-        right_win = stdscr
+    left_width = max(1, split_col - 1)
+    right_width = max(1, width - split_col - 1)
+    last_row = height - 1
 
+    left_win, right_win = _browser_windows(stdscr, windows, height, width, split_col)
     left_win.erase()
     right_win.erase()
 
-    try:
-        file_label = file_path.relative_to(case_path).as_posix()
-        left_win.addstr(0, 0, file_label[: max(1, left_width)])
-        level_label = base_entry or "(top level)"
-        left_win.addstr(1, 0, level_label[: max(1, left_width)])
-        left_win.addstr(
-            2,
-            0,
-            "j/k: move  l: edit  o: edit section  v: view  h: back"[
-                : max(1, left_width)
-            ],
-        )
-    except curses.error:
-        pass
+    _put(left_win, 0, file_label, left_width)
+    _put(left_win, 1, base_entry or "(top level)", left_width)
+    _put(left_win, 2, "j/k: move  l: edit  o: edit section  v: view  h: back", left_width)
 
     start_row = 4
-    list_rows = max(0, height - 1 - start_row)
+    list_rows = max(0, last_row - start_row)
     for offset, k in enumerate(keys[list_scroll : list_scroll + list_rows]):
-        idx = list_scroll + offset
-        if start_row + offset >= height - 1:
-            break
-        prefix = ">> " if idx == current_index else "   "
-        label = (prefix + k)[: max(1, left_width)]
-        try:
-            left_win.addstr(start_row + offset, 0, label)
-        except curses.error:
-            break
-
-    try:
-        right_win.addstr(0, 0, "Entry preview"[: max(1, right_width)])
-        right_win.addstr(
-            1,
-            0,
-            f"Path: {full_key}"[: max(1, right_width)],
-        )
-        right_win.addstr(
-            2,
-            0,
-            f"Type: {type_label}"[: max(1, right_width)],
-        )
-    except curses.error:
-        pass
-
-    row = 4
-    try:
-        right_win.addstr(row, 0, "Current value:"[: max(1, right_width)])
-    except curses.error:
-        pass
-    row += 1
-    for line in value.splitlines() or [value]:
-        if row >= height - 1:
-            break
-        try:
-            right_win.addstr(row, 0, line[: max(1, right_width)])
-        except curses.error:
-            break
-        row += 1
-
-    if comments and row < height - 1:
-        try:
-            right_win.addstr(row, 0, "Comments:"[: max(1, right_width)])
-        except curses.error:
-            pass
-        row += 1
-        for c in comments:
-            if row >= height - 1:
-                break
-            try:
-                right_win.addstr(
-                    row,
-                    0,
-                    c[: max(1, right_width)],
-                )
-            except curses.error:
-                break
-            row += 1
-
-    if info_lines and row < height - 1:
-        try:
-            right_win.addstr(row, 0, "Info:"[: max(1, right_width)])
-        except curses.error:
-            pass
-        row += 1
-        for line in info_lines:
-            if row >= height - 1:
-                break
-            try:
-                right_win.addstr(
-                    row,
-                    0,
-                    line[: max(1, right_width)],
-                )
-            except curses.error:
-                break
-            row += 1
-
-    if subkeys and row < height - 1:
-        try:
-            right_win.addstr(row, 0, "Sub-keys:"[: max(1, right_width)])
-        except curses.error:
-            pass
-        row += 1
-        for sk in subkeys:
-            if row >= height - 1:
-                break
-            try:
-                right_win.addstr(
-                    row,
-                    0,
-                    f"- {sk}"[: max(1, right_width)],
-                )
-            except curses.error:
-                break
-            row += 1
-
-    base = f"case: {case_path.name} | file: {file_path.relative_to(case_path)} | path: {full_key}"
+        prefix = ">> " if list_scroll + offset == current_index else "   "
+        _put(left_win, start_row + offset, prefix + k, left_width)
+
+    right_lines = [
+        "Entry preview",
+        f"Path: {full_key}",
+        f"Type: {type_label}",
+        "",
+        "Current value:",
+    ]
+    right_lines.extend(value.splitlines() or [value])
+    if comments:
+        right_lines.append("Comments:")
+        right_lines.extend(comments)
+    if info_lines:
+        right_lines.append("Info:")
+        right_lines.extend(info_lines)
+    if subkeys:
+        right_lines.append("Sub-keys:")
+        right_lines.extend(f"- {sk}" for sk in subkeys)
+    for row, line in enumerate(right_lines[: max(0, last_row)]):
+        if line:
+            _put(right_win, row, line, right_width)
+
+    base = f"case: {case_name} | file: {file_label} | path: {full_key}"
     status = f"{base} | {status_suffix}" if status_suffix else base
     draw_status_bar(stdscr, status)
 
@@ -314,6 +250,37 @@ def _draw_entry_browser(
         stdscr.refresh()
 
 
+def _browser_windows(
+    stdscr: Any,
+    windows: Optional[dict[str, Any]],
+    height: int,
+    width: int,
+    split_col: int,
+) -> tuple[Any, Any]:
+    """
+    Return the left/right panes, reusing cached sub-windows while the
+    terminal size is unchanged.
+    """
+    if windows is not None and windows.get("dims") == (height, width):
+        return windows["left"], windows["right"]
+    try:
+        left_win = stdscr.derwin(max(1, height - 1), split_col, 0, 0)
+        right_win = stdscr.derwin(max(1, height - 1), max(1, width - split_col), 0, split_col)
+    except curses.error:
+        left_win = stdscr
+        right_win = stdscr
+    if windows is not None:
+        windows.update(dims=(height, width), left=left_win, right=right_win)
+    return left_win, right_win
+
+
+def _put(win: Any, row: int, text: str, width: int) -> None:
+    try:
+        win.addnstr(row, 0, text, width)
+    except curses.error:
+        pass
+
+
 def _entry_browser_scroll(index: int, list_scroll: int, stdscr: Any, total: int) -> int:
     height, _ = stdscr.getmaxyx()
     list_rows = max(0, height - 1 - 4)
@@ -335,7 +302,7 @@ def _entry_browser_external_edit(
     stdscr: Any,
     file_path: Path,
     case_path: Path,
-    cache: dict[str, tuple[str, str, list[str], list[str], list[str]]],
+    cache: EntryCache,
     full_key: str,
     callbacks: BrowserCallbacks,
 ) -> bool:
@@ -362,7 +329,7 @@ def _entry_browser_inline_edit(
     stdscr: Any,
     file_path: Path,
     case_path: Path,
-    cache: dict[str, tuple[str, str, list[str], list[str], list[str]]],
+    cache: EntryCache,
     full_key: str,
     value: str,
     validator: Validator,
@@ -392,7 +359,7 @@ def _entry_browser_search(
     stdscr: Any,
     file_path: Path,
     case_path: Path,
-    cache: dict[str, tuple[str, str, list[str], list[str], list[str]]],
+    cache: EntryCache,
     keywords: list[str],
     index: int,
     callbacks: BrowserCallbacks,
@@ -427,7 +394,7 @@ def _entry_browser_help(stdscr: Any, callbacks: BrowserCallbacks) -> None:
 def _search_entries(
     file_path: Path,
     case_path: Path,
-    cache: dict[str, tuple[str, str, list[str], list[str], list[str]]],
+    cache: EntryCache,
     keywords: list[str],
     current_index: int,
     query: str,
@@ -436,18 +403,12 @@ def _search_entries(
     if not keywords:
         return None
 
-    q = query.lower()
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
 
     n = len(keywords)
     for step in range(1, n + 1):
         idx = (current_index + direction * step) % n
-        key = keywords[idx]
-        full_key = key
-        value, _type_label, _subkeys, comments, _info_lines, _validator = get_entry_metadata(
-            cache, file_path, case_path, full_key
-        )
-        haystack = " ".join([key, value] + comments).lower()
-        if q in haystack:
+        if pattern.search(entry_haystack(cache, file_path, case_path, keywords[idx])):
             return idx
 
     return None
@@ -457,7 +418,7 @@ def _fzf_pick_entry_in_file(stdscr: Any, keywords: list[str]) -> Optional[int]:
     if not keywords:
         return None
 
-    fzf_input = "\n".join(keywords)
+    fzf_input = "\n".join(keywords).encode("utf-8")
 
     curses.def_prog_mode()
     curses.endwin()
@@ -465,7 +426,6 @@ def _fzf_pick_entry_in_file(stdscr: Any, keywords: list[str]) -> Optional[int]:
         result = subprocess.run(
             ["fzf"],
             input=fzf_input,
-            text=True,
             capture_output=True,
             check=False,
         )
@@ -477,45 +437,51 @@ def _fzf_pick_entry_in_file(stdscr: Any, keywords: list[str]) -> Optional[int]:
     if result.returncode != 0:
         return None
 
-    selected = result.stdout.strip()
+    selected = result.stdout.decode("utf-8", errors="replace").strip()
     if not selected:
         return None
 
-    try:
-        return keywords.index(selected)
-    except ValueError:
-        return None
+    return keyword_positions(keywords).get(selected)
 
 
 def _open_in_external_editor(
     stdscr: Any, initial_text: str, callbacks: BrowserCallbacks
 ) -> Optional[str]:
-    editor = os.environ.get("EDITOR") or "vi"
+    editor = get_config().editor
 
     try:
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-            tmp.write(initial_text)
+        fd, name = tempfile.mkstemp(text=True)
     except OSError as exc:
         callbacks.show_message(stdscr, f"Failed to create temp file for editor: {exc}")
         return None
+    tmp_path = Path(name)
 
-    curses.endwin()
     try:
-        subprocess.run([editor, str(tmp_path)], check=False)
-    finally:
-        stdscr.clear()
-        stdscr.refresh()
+        try:
+            with os.fdopen(fd, "w") as tmp:
+                tmp.write(initial_text)
+        except OSError as exc:
+            callbacks.show_message(stdscr, f"Failed to create temp file for editor: {exc}")
+            return None
 
-    try:
-        edited = tmp_path.read_text()
-    except OSError as exc:
-        callbacks.show_message(stdscr, f"Failed to read edited value: {exc}")
-        return None
+        curses.endwin()
+        try:
+            subprocess.run([editor, name], check=False)
+        except OSError as exc:
+            callbacks.show_message(stdscr, f"Failed to run {editor}: {exc}")
+            return None
+        finally:
+            stdscr.clear()
+            stdscr.refresh()
+
+        # Reopen by name: many editors save by renaming a new file over it.
+        try:
+            return tmp_path.read_text()
+        except OSError as exc:
+            callbacks.show_message(stdscr, f"Failed to read edited value: {exc}")
+            return None
     finally:
         try:
             tmp_path.unlink()
         except OSError:
             pass
-
-    return edited
@@ -18,13 +18,19 @@ class CommandCallbacks:
     show_message: Callable[[Any, str], None]
 
 
-def command_suggestions(case_path: Path) -> list[str]:
+def command_suggestions(case_path: Path) -> tuple[str, ...]:
+    """
+    Completion candidates for the command line.
+
+    Tool names come from list_tool_commands, which caches them until a
+    preset file changes.
+    """
     base = ["check", "tools", "diag", "run", "nofoam", "no-foam", "quit", "help"]
     tool_names = list_tool_commands(case_path)
     base += [f"tool {name}" for name in tool_names]
     base += [f"run {name}" for name in tool_names]
     base += tool_names
-    return sorted(set(base))
+    return tuple(sorted(set(base)))
 
 
 def handle_command(
@@ -42,67 +48,124 @@ def handle_command(
 
     parts = cmd.split()
     name = parts[0].lower()
-    normalized = name.replace("-", "").replace("_", "")
-    if name in ("q", "quit", "exit"):
-        return "quit"
-    if name in ("check", "syntax"):
-        callbacks.check_syntax(stdscr, case_path, state)
-        return "handled"
-    if name in ("tools", "tool"):
-        if len(parts) > 1:
-            tool_name = " ".join(parts[1:])
-            if run_tool_by_name(stdscr, case_path, tool_name):
-                return "handled"
-            callbacks.show_message(stdscr, f"Unknown tool: {tool_name}")
-            return "handled"
-        callbacks.tools_screen(stdscr, case_path)
-        return "handled"
-    if name in ("diag", "diagnostics"):
-        callbacks.diagnostics_screen(stdscr, case_path)
-        return "handled"
-    if name in ("run", "solver"):
-        if len(parts) > 1:
-            tool_name = " ".join(parts[1:])
-            if run_tool_by_name(stdscr, case_path, tool_name):
-                return "handled"
-            callbacks.show_message(stdscr, f"Unknown tool: {tool_name}")
-            return "handled"
-        callbacks.run_current_solver(stdscr, case_path)
-        return "handled"
-    if normalized in ("nofoam", "foam"):
-        desired = None
-        if len(parts) > 1:
-            arg = parts[1].lower()
-            if arg in ("on", "true", "1", "yes"):
-                desired = True
-            elif arg in ("off", "false", "0", "no"):
-                desired = False
-        if desired is None:
-            desired = not state.no_foam
-        if not desired:
-            try:
-                ensure_environment()
-            except OpenFOAMError as exc:
-                callbacks.show_message(stdscr, f"Cannot enable foam mode: {exc}")
-                state.no_foam = True
-                return "handled"
-        state.no_foam = desired
-        if state.no_foam:
-            os.environ["OF_TUI_NO_FOAM"] = "1"
-        else:
-            os.environ.pop("OF_TUI_NO_FOAM", None)
-        mode_label = "no-foam" if state.no_foam else "foam"
-        callbacks.show_message(stdscr, f"Mode set to {mode_label}.")
-        return "handled"
-    if name in ("help", "?"):
-        callbacks.show_message(
-            stdscr,
-            "Commands: :check, :tools, :diag, :run, :nofoam, :tool <name>, :quit",
-        )
-        return "handled"
+    if name.replace("-", "").replace("_", "") in ("nofoam", "foam"):
+        name = "nofoam"
+    handler = _HANDLERS.get(_ALIASES.get(name, name))
+    if handler is not None:
+        return handler(stdscr, case_path, state, parts, callbacks)
 
     if run_tool_by_name(stdscr, case_path, cmd):
         return "handled"
 
     callbacks.show_message(stdscr, f"Unknown command: {command}")
     return "handled"
+
+
+CommandHandler = Callable[[Any, Path, Any, list[str], CommandCallbacks], Optional[str]]
+
+
+def _quit_command(
+    _stdscr: Any, _case_path: Path, _state: Any, _parts: list[str], _callbacks: CommandCallbacks
+) -> Optional[str]:
+    return "quit"
+
+
+def _check_command(
+    stdscr: Any, case_path: Path, state: Any, _parts: list[str], callbacks: CommandCallbacks
+) -> Optional[str]:
+    callbacks.check_syntax(stdscr, case_path, state)
+    return "handled"
+
+
+def _tools_command(
+    stdscr: Any, case_path: Path, _state: Any, parts: list[str], callbacks: CommandCallbacks
+) -> Optional[str]:
+    if len(parts) > 1:
+        return _run_named_tool(stdscr, case_path, parts, callbacks)
+    callbacks.tools_screen(stdscr, case_path)
+    return "handled"
+
+
+def _diag_command(
+    stdscr: Any, case_path: Path, _state: Any, _parts: list[str], callbacks: CommandCallbacks
+) -> Optional[str]:
+    callbacks.diagnostics_screen(stdscr, case_path)
+    return "handled"
+
+
+def _run_command(
+    stdscr: Any, case_path: Path, _state: Any, parts: list[str], callbacks: CommandCallbacks
+) -> Optional[str]:
+    if len(parts) > 1:
+        return _run_named_tool(stdscr, case_path, parts, callbacks)
+    callbacks.run_current_solver(stdscr, case_path)
+    return "handled"
+
+
+def _run_named_tool(
+    stdscr: Any, case_path: Path, parts: list[str], callbacks: CommandCallbacks
+) -> Optional[str]:
+    tool_name = " ".join(parts[1:])
+    if not run_tool_by_name(stdscr, case_path, tool_name):
+        callbacks.show_message(stdscr, f"Unknown tool: {tool_name}")
+    return "handled"
+
+
+def _nofoam_command(
+    stdscr: Any, _case_path: Path, state: Any, parts: list[str], callbacks: CommandCallbacks
+) -> Optional[str]:
+    desired = None
+    if len(parts) > 1:
+        arg = parts[1].lower()
+        if arg in ("on", "true", "1", "yes"):
+            desired = True
+        elif arg in ("off", "false", "0", "no"):
+            desired = False
+    if desired is None:
+        desired = not state.no_foam
+    if not desired:
+        try:
+            ensure_environment()
+        except OpenFOAMError as exc:
+            callbacks.show_message(stdscr, f"Cannot enable foam mode: {exc}")
+            state.no_foam = True
+            return "handled"
+    state.no_foam = desired
+    if state.no_foam:
+        os.environ["OF_TUI_NO_FOAM"] = "1"
+    else:
+        os.environ.pop("OF_TUI_NO_FOAM", None)
+    mode_label = "no-foam" if state.no_foam else "foam"
+    callbacks.show_message(stdscr, f"Mode set to {mode_label}.")
+    return "handled"
+
+
+def _help_command(
+    stdscr: Any, _case_path: Path, _state: Any, _parts: list[str], callbacks: CommandCallbacks
+) -> Optional[str]:
+    callbacks.show_message(
+        stdscr,
+        "Commands: :check, :tools, :diag, :run, :nofoam, :tool <name>, :quit",
+    )
+    return "handled"
+
+
+_ALIASES = {
+    "q": "quit",
+    "exit": "quit",
+    "syntax": "check",
+    "tool": "tools",
+    "solver": "run",
+    "diagnostics": "diag",
+    "?": "help",
+}
+
+_HANDLERS: dict[str, CommandHandler] = {
+    "quit": _quit_command,
+    "check": _check_command,
+    "tools": _tools_command,
+    "diag": _diag_command,
+    "run": _run_command,
+    "nofoam": _nofoam_command,
+    "help": _help_command,
+}
@@ -3,16 +3,23 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Any, cast
+import functools
 import os
 import shutil
 import tomllib
 
 
-@dataclass
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+KEY_ACTIONS = ("up", "down", "select", "back", "help", "command", "search", "top", "bottom")
+
+
+@dataclass(slots=True)
 class Config:
     fzf: str = "auto"
     use_runfunctions: bool = True
     use_cleanfunctions: bool = True
+    editor: str = "vi"
     colors: Dict[str, str] = field(
         default_factory=lambda: {"focus_fg": "black", "focus_bg": "cyan"}
     )
@@ -29,6 +36,26 @@ class Config:
             "bottom": ["G"],
         }
     )
+    # Key codes per action, derived from `keys` by refresh_key_codes().
+    keys_up: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_down: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_select: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_back: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_help: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_command: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_search: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_top: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+    keys_bottom: frozenset[int] = field(default=frozenset(), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.refresh_key_codes()
+
+    def refresh_key_codes(self) -> None:
+        """
+        Rebuild the `keys_<action>` code sets after `keys` changes.
+        """
+        for action in KEY_ACTIONS:
+            setattr(self, f"keys_{action}", key_codes(self.keys.get(action, [])))
 
 
 _CONFIG: Optional[Config] = None
@@ -52,9 +79,15 @@ def fzf_enabled() -> bool:
     cfg = get_config()
     if cfg.fzf == "off":
         return False
-    if cfg.fzf == "on":
-        return shutil.which("fzf") is not None
-    return shutil.which("fzf") is not None
+    return _which_fzf() is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _which_fzf() -> Optional[str]:
+    """
+    Locate fzf on $PATH once per session.
+    """
+    return shutil.which("fzf")
 
 
 def key_in(key: int, labels: List[str]) -> bool:
@@ -70,20 +103,37 @@ def key_in(key: int, labels: List[str]) -> bool:
     return False
 
 
+def key_codes(labels: List[str]) -> frozenset[int]:
+    """
+    Return the key codes matched by `key_in` for the given labels.
+    """
+    codes: set[int] = set()
+    for label in labels:
+        if label == "\n":
+            codes.update((10, 13))
+        elif len(label) == 1:
+            codes.add(ord(label))
+    return frozenset(codes)
+
+
 def _load_config() -> Config:
     cfg = Config()
     path = config_path()
     if path.is_file():
-        try:
-            raw = tomllib.loads(path.read_text())
-        except (OSError, tomllib.TOMLDecodeError):
-            raw = {}
-        _apply_file_config(cfg, raw)
+        _apply_file_config(cfg, _parse_config_file(path))
 
     _apply_env_overrides(cfg)
+    cfg.refresh_key_codes()
     return cfg
 
 
+def _parse_config_file(path: Path) -> Dict[str, Any]:
+    try:
+        return tomllib.loads(path.read_text())
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
 def _apply_file_config(cfg: Config, raw: Dict[str, Any]) -> None:
     fzf_value = raw.get("fzf")
     if isinstance(fzf_value, str):
@@ -109,18 +159,32 @@ def _apply_file_config(cfg: Config, raw: Dict[str, Any]) -> None:
         for key, value in keys.items():
             if isinstance(key, str) and isinstance(value, list):
                 if all(isinstance(item, str) for item in value):
-                    cfg.keys[key] = cast(List[str], value)
+                    cfg.keys[key] = list(cast(List[str], value))
 
 
 def _apply_env_overrides(cfg: Config) -> None:
+    env_editor = os.environ.get("EDITOR")
+    if env_editor:
+        cfg.editor = env_editor
+
     env_fzf = os.environ.get("OF_TUI_FZF")
     if env_fzf:
         cfg.fzf = env_fzf.strip().lower()
 
-    env_run = os.environ.get("OF_TUI_USE_RUNFUNCTIONS")
+    env_run = _env_flag("OF_TUI_USE_RUNFUNCTIONS")
     if env_run is not None:
-        cfg.use_runfunctions = env_run.strip() in ("1", "true", "yes", "on")
+        cfg.use_runfunctions = env_run
 
-    env_clean = os.environ.get("OF_TUI_USE_CLEANFUNCTIONS")
+    env_clean = _env_flag("OF_TUI_USE_CLEANFUNCTIONS")
     if env_clean is not None:
-        cfg.use_cleanfunctions = env_clean.strip() in ("1", "true", "yes", "on")
+        cfg.use_cleanfunctions = env_clean
+
+
+def _env_flag(name: str) -> Optional[bool]:
+    """
+    Read a boolean environment variable; None when it is unset.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return None
+    return value.strip().lower() in _TRUE_VALUES
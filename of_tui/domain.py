@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 
@@ -14,7 +15,7 @@ class DictionaryFile:
     root: Path
     path: Path
 
-    @property
+    @cached_property
     def rel(self) -> Path:
         return self.path.relative_to(self.root)
 
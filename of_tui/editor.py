@@ -7,7 +7,7 @@ from curses import textpad
 from dataclasses import dataclass
 from typing import Callable, List, Optional, Any
 
-from .config import get_config, key_in
+from .config import get_config
 
 
 def autoformat_value(value: str) -> str:
@@ -361,14 +361,20 @@ class EntryEditor:
 
 
 class Viewer:
-    def __init__(self, stdscr: Any, content: str) -> None:
+    def __init__(
+        self, stdscr: Any, content: str, header_lines: Optional[List[str]] = None
+    ) -> None:
         self.stdscr = stdscr
         self.content = content
+        self.header_lines = header_lines or []
 
     def display(self) -> None:
         lines = self.content.splitlines()
+        if self.header_lines:
+            lines[:0] = self.header_lines
         start_line = 0
         search_term: Optional[str] = None
+        cfg = get_config()
 
         while True:
             self.stdscr.erase()
@@ -398,7 +404,7 @@ class Viewer:
                 # Recompute layout on next iteration.
                 continue
 
-            if key_in(key, get_config().keys.get("search", [])):
+            if key in cfg.keys_search:
                 # Simple search prompt.
                 curses.echo()
                 self.stdscr.clear()
@@ -425,16 +431,16 @@ class Viewer:
                                 break
                 continue
 
-            if key_in(key, get_config().keys.get("back", [])):
+            if key in cfg.keys_back:
                 return
-            if key_in(key, get_config().keys.get("top", [])):
+            if key in cfg.keys_top:
                 start_line = 0
-            if key_in(key, get_config().keys.get("bottom", [])):
+            if key in cfg.keys_bottom:
                 start_line = max(0, len(lines) - (height - 3))
-            if key in (curses.KEY_DOWN,) or key_in(key, get_config().keys.get("down", [])):
+            if key in (curses.KEY_DOWN,) or key in cfg.keys_down:
                 if end_line < len(lines):
                     start_line += 1
-            if key in (curses.KEY_UP,) or key_in(key, get_config().keys.get("up", [])):
+            if key in (curses.KEY_UP,) or key in cfg.keys_up:
                 if start_line > 0:
                     start_line -= 1
 
@@ -1,21 +1,40 @@
 from __future__ import annotations
 
+import functools
+import re
 from pathlib import Path
 from typing import Optional
 
 from .openfoam import (
     OpenFOAMError,
+    dictionary_entries,
+    file_stamp,
+    get_entry_bundle,
     get_entry_comments,
     get_entry_enum_values,
     get_entry_info,
-    list_subkeys,
     read_entry,
 )
 from .validation import Validator, as_float, as_int, bool_flag, non_empty, vector_values
 
+# Substring hints for _guess_validator, checked in this order.
+_BOOL_KEY_RE = re.compile("on|off|switch|enable|disable")
+_INT_KEY_RE = re.compile("iter|step|n|count")
+_FLOAT_KEY_RE = re.compile("tol|dt|time|coeff|alpha|beta")
+_VECTOR_BODY_RE = re.compile(r"[-+.,\deE\s]+")
+
+# (file, boundaryField.<patch>) -> (file stamp, (type, value)).
+_PATCH_BC_CACHE: dict[
+    tuple[Path, str], tuple[tuple[int, int], tuple[Optional[str], Optional[str]]]
+] = {}
+
+# full_key -> (value, type_label, subkeys, comments, info_lines, validator,
+# haystack), where haystack is the lower-cased search text for the entry.
+EntryCache = dict[str, tuple[str, str, list[str], list[str], list[str], Validator, str]]
+
 
 def get_entry_metadata(
-    cache: dict[str, tuple[str, str, list[str], list[str], list[str]]],
+    cache: EntryCache,
     file_path: Path,
     case_path: Path,
     full_key: str,
@@ -26,18 +45,19 @@ def get_entry_metadata(
     navigating.
     """
     if full_key in cache:
-        value, type_label, subkeys, comments, info_lines = cache[full_key]
-        validator, _ = choose_validator(full_key, value)
+        value, type_label, subkeys, comments, info_lines, validator, _ = cache[full_key]
         return value, type_label, subkeys, comments, info_lines, validator
 
     try:
-        value = read_entry(file_path, full_key)
+        bundle = get_entry_bundle(file_path, full_key)
     except OpenFOAMError:
         value = "<error reading value>"
+        subkeys: list[str] = []
+        comments = get_entry_comments(file_path, full_key)
+    else:
+        value, subkeys, comments = bundle.value, bundle.subkeys, bundle.comments
 
     validator, type_label = choose_validator(full_key, value)
-    subkeys = list_subkeys(file_path, full_key)
-    comments = get_entry_comments(file_path, full_key)
     info_lines = get_entry_info(file_path, full_key)
     info_lines.extend(boundary_condition_info(file_path, full_key))
 
@@ -58,12 +78,15 @@ def get_entry_metadata(
         # Surface allowed values in the info pane as well.
         info_lines = info_lines + [f"Allowed values: {', '.join(enum_values)}"]
 
-    cache[full_key] = (value, type_label, subkeys, comments, info_lines)
+    cache[full_key] = (
+        value, type_label, subkeys, comments, info_lines, validator,
+        _search_haystack(full_key, value, comments),
+    )
     return value, type_label, subkeys, comments, info_lines, validator
 
 
 def refresh_entry_cache(
-    cache: dict[str, tuple[str, str, list[str], list[str], list[str]]],
+    cache: EntryCache,
     file_path: Path,
     case_path: Path,
     full_key: str,
@@ -73,16 +96,37 @@ def refresh_entry_cache(
     OpenFOAM errors so the UI remains responsive.
     """
     try:
-        value = read_entry(file_path, full_key)
+        bundle = get_entry_bundle(file_path, full_key)
     except OpenFOAMError:
         return
 
+    _invalidate_patch_bc(file_path, full_key)
+    value, subkeys, comments = bundle.value, bundle.subkeys, bundle.comments
     validator, type_label = choose_validator(full_key, value)
-    subkeys = list_subkeys(file_path, full_key)
-    comments = get_entry_comments(file_path, full_key)
     info_lines = get_entry_info(file_path, full_key)
     info_lines.extend(boundary_condition_info(file_path, full_key))
-    cache[full_key] = (value, type_label, subkeys, comments, info_lines)
+    cache[full_key] = (
+        value, type_label, subkeys, comments, info_lines, validator,
+        _search_haystack(full_key, value, comments),
+    )
+
+
+def entry_haystack(
+    cache: EntryCache,
+    file_path: Path,
+    case_path: Path,
+    full_key: str,
+) -> str:
+    """
+    Return the lower-cased search text (key, value, comments) for an entry.
+    """
+    if full_key not in cache:
+        get_entry_metadata(cache, file_path, case_path, full_key)
+    return cache[full_key][6]
+
+
+def _search_haystack(key: str, value: str, comments: list[str]) -> str:
+    return " ".join([key, value, *comments]).lower()
 
 
 def boundary_condition_info(file_path: Path, full_key: str) -> list[str]:
@@ -99,13 +143,12 @@ def boundary_condition_info(file_path: Path, full_key: str) -> list[str]:
     patch = parts[idx + 1]
     patch_key = ".".join(parts[: idx + 2])
 
-    bc_type = _read_optional_entry(file_path, f"{patch_key}.type")
+    bc_type, bc_value = _patch_bc(file_path, patch_key)
     if bc_type:
         info.append(f"BC {patch} type: {bc_type}")
     else:
         info.append(f"BC {patch}: missing required entry 'type'")
 
-    bc_value = _read_optional_entry(file_path, f"{patch_key}.value")
     if bc_value:
         info.append(f"BC {patch} value: {bc_value}")
     else:
@@ -114,6 +157,59 @@ def boundary_condition_info(file_path: Path, full_key: str) -> list[str]:
     return info
 
 
+def _patch_bc(file_path: Path, patch_key: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    Return a boundary patch's (type, value) from a single foamDictionary
+    read of the whole patch, reused until the file changes.
+    """
+    stamp = file_stamp(file_path)
+    hit = _PATCH_BC_CACHE.get((file_path, patch_key))
+    if hit is not None and stamp is not None and hit[0] == stamp:
+        return hit[1]
+    try:
+        fields = _top_level_fields(read_entry(file_path, patch_key))
+    except OpenFOAMError:
+        fields = {}
+    result = (fields.get("type"), fields.get("value"))
+    if stamp is not None:
+        _PATCH_BC_CACHE[(file_path, patch_key)] = (stamp, result)
+    return result
+
+
+def _invalidate_patch_bc(file_path: Path, full_key: str) -> None:
+    for cached_file, patch_key in list(_PATCH_BC_CACHE):
+        if cached_file != file_path:
+            continue
+        if full_key.startswith(patch_key) or patch_key.startswith(full_key):
+            del _PATCH_BC_CACHE[(cached_file, patch_key)]
+
+
+def _top_level_fields(text: str) -> dict[str, str]:
+    """
+    Map the direct entries of a `name { ... }` dictionary to their
+    "value;" text; nested dictionaries are skipped.
+    """
+    fields: dict[str, str] = {}
+    for keyword, value in dictionary_entries(text):
+        if value.endswith(";") and value != ";":
+            fields.setdefault(keyword, value)
+    return fields
+
+
+def _looks_like_vector(value: str) -> bool:
+    """
+    Cheap check that the text between the outer parentheses is numeric-ish.
+    """
+    start = value.find("(")
+    if start < 0:
+        return False
+    end = value.rfind(")")
+    if end <= start:
+        return False
+    return _VECTOR_BODY_RE.fullmatch(value, start + 1, end) is not None
+
+
+@functools.lru_cache(maxsize=4096)
 def choose_validator(key: str, value: str) -> tuple[Validator, str]:
     """
     Choose a validator based on both key name and current value.
@@ -125,7 +221,7 @@ def choose_validator(key: str, value: str) -> tuple[Validator, str]:
     # fall back to scalar / key-based heuristics (e.g. schemes like
     # "div(tauMC) Gauss linear" are not vectors even though they have
     # parentheses in the name).
-    if "(" in value and ")" in value:
+    if _looks_like_vector(value):
         vec_error = vector_values(value)
         if vec_error is None:
             return vector_values, "vector"
@@ -162,22 +258,16 @@ def choose_validator(key: str, value: str) -> tuple[Validator, str]:
     return validator, label
 
 
-def _read_optional_entry(file_path: Path, key: str) -> Optional[str]:
-    try:
-        return read_entry(file_path, key).strip()
-    except OpenFOAMError:
-        return None
-
-
+@functools.lru_cache(maxsize=1024)
 def _guess_validator(key: str) -> Validator:
     """
     Simple heuristic to choose a validator based on key name.
     """
     lower = key.lower()
-    if any(tok in lower for tok in ("on", "off", "switch", "enable", "disable")):
+    if _BOOL_KEY_RE.search(lower):
         return bool_flag
-    if any(tok in lower for tok in ("iter", "step", "n", "count")):
+    if _INT_KEY_RE.search(lower):
         return as_int
-    if any(tok in lower for tok in ("tol", "dt", "time", "coeff", "alpha", "beta")):
+    if _FLOAT_KEY_RE.search(lower):
         return as_float
     return non_empty
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import bisect
 import curses
 import subprocess
-from typing import List, Any, Callable, Optional
+from typing import List, Any, Callable, Optional, Sequence
 
-from .config import get_config, key_in, fzf_enabled
+from .config import get_config, fzf_enabled
 
 
 def _show_help(stdscr: Any) -> None:
@@ -25,71 +26,101 @@ def _show_help(stdscr: Any) -> None:
     stdscr.getch()
 
 
-def _prompt_command(stdscr: Any, suggestions: Optional[List[str]]) -> str:
+def _prompt_command(stdscr: Any, suggestions: Optional[Sequence[str]]) -> str:
     height, width = stdscr.getmaxyx()
-    buffer: list[str] = []
-    cursor = 0
+    # Text left of the cursor, and text right of it stored in reverse, so
+    # typing, deleting and cursor moves are all appends/pops at the ends.
+    left: list[str] = []
+    right: list[str] = []
     last_matches: list[str] = []
     match_index = 0
     last_buffer = ""
+    last_rendered: Optional[tuple[str, int]] = None
+    completion_index: Optional[list[tuple[str, int]]] = None
+
+    def text() -> str:
+        return "".join(left) + "".join(reversed(right))
 
     def render() -> None:
+        nonlocal last_rendered
+        frame = (text(), len(left))
+        if frame == last_rendered:
+            return
         try:
             stdscr.move(height - 1, 0)
             stdscr.clrtoeol()
-            display = ":" + "".join(buffer)
+            display = ":" + frame[0]
             stdscr.addstr(height - 1, 0, display[: max(1, width - 1)])
-            stdscr.move(height - 1, min(width - 1, 1 + cursor))
+            stdscr.move(height - 1, min(width - 1, 1 + frame[1]))
             stdscr.refresh()
         except curses.error:
             pass
+        last_rendered = frame
 
     render()
     while True:
         key = stdscr.getch()
 
         if key in (curses.KEY_ENTER, 10, 13):
-            return "".join(buffer).strip()
+            return text().strip()
         if key in (27,):  # ESC
             return ""
         if key in (curses.KEY_BACKSPACE, 127, 8):
-            if cursor > 0:
-                buffer.pop(cursor - 1)
-                cursor -= 1
+            if left:
+                left.pop()
             render()
             continue
         if key == curses.KEY_LEFT:
-            if cursor > 0:
-                cursor -= 1
+            if left:
+                right.append(left.pop())
             render()
             continue
         if key == curses.KEY_RIGHT:
-            if cursor < len(buffer):
-                cursor += 1
+            if right:
+                left.append(right.pop())
             render()
             continue
         if key == 9:  # TAB
-            pool = suggestions or []
-            current = "".join(buffer)
+            if completion_index is None:
+                completion_index = build_completion_index(suggestions or [])
+            current = text()
             if current != last_buffer:
-                last_matches = [s for s in pool if s.startswith(current)]
+                last_matches = completion_matches(completion_index, current)
                 match_index = 0
                 last_buffer = current
             if last_matches:
                 completion = last_matches[match_index % len(last_matches)]
-                buffer = list(completion)
-                cursor = len(buffer)
+                left = list(completion)
+                right = []
                 match_index += 1
                 render()
             continue
         if 32 <= key <= 126:
-            buffer.insert(cursor, chr(key))
-            cursor += 1
+            left.append(chr(key))
             render()
 
 
 
-def _fzf_pick_option(stdscr: Any, options: List[str]) -> Optional[int]:
+def build_completion_index(pool: Sequence[str]) -> list[tuple[str, int]]:
+    """
+    Sort suggestions once (remembering their original positions) so prefix
+    lookups can bisect instead of scanning the whole pool.
+    """
+    return sorted((suggestion, idx) for idx, suggestion in enumerate(pool))
+
+
+def completion_matches(index: list[tuple[str, int]], prefix: str) -> list[str]:
+    """
+    Return suggestions starting with `prefix`, in their original order.
+    """
+    lo = bisect.bisect_left(index, (prefix, -1))
+    hi = bisect.bisect_left(index, (prefix + "\U0010ffff", -1), lo)
+    return [suggestion for suggestion, _ in sorted(index[lo:hi], key=lambda item: item[1])]
+
+
+def _fzf_pick_option(
+    stdscr: Any, options: Sequence[str], positions: Optional[dict[str, int]] = None
+) -> Optional[int]:
     """
     Use fzf to pick an option from the given list.
 
@@ -99,34 +130,35 @@ def _fzf_pick_option(stdscr: Any, options: List[str]) -> Optional[int]:
     if not options or not fzf_enabled():
         return None
 
-    fzf_input = "\n".join(options)
+    fzf_input = "\n".join(options).encode("utf-8")
 
     curses.def_prog_mode()
     curses.endwin()
     try:
-        result = subprocess.run(
-            ["fzf"],
-            input=fzf_input,
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        proc = subprocess.Popen(["fzf"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        output, _ = proc.communicate(fzf_input)
     finally:
         curses.reset_prog_mode()
         stdscr.clear()
         stdscr.refresh()
 
-    if result.returncode != 0:
+    if proc.returncode != 0:
         return None
 
-    selected = result.stdout.strip()
+    selected = output.decode("utf-8", errors="replace").strip()
     if not selected:
         return None
 
-    try:
-        return options.index(selected)
-    except ValueError:
-        return None
+    if positions is None:
+        positions = _option_positions(options)
+    return positions.get(selected)
+
+
+def _option_positions(options: Sequence[str]) -> dict[str, int]:
+    positions: dict[str, int] = {}
+    for idx, option in enumerate(options):
+        positions.setdefault(option, idx)
+    return positions
 
 
 class Menu:
@@ -134,11 +166,11 @@ class Menu:
         self,
         stdscr: Any,
         title: str,
-        options: List[str],
+        options: Sequence[str],
         extra_lines: Optional[List[str]] = None,
         banner_lines: Optional[List[str]] = None,
         command_handler: Optional[Callable[[str], Optional[str]]] = None,
-        command_suggestions: Optional[Callable[[], List[str]]] = None,
+        command_suggestions: Optional[Callable[[], Sequence[str]]] = None,
         hint_provider: Optional[Callable[[int], Optional[str]]] = None,
     ) -> None:
         self.stdscr = stdscr
@@ -151,33 +183,47 @@ class Menu:
         self.command_suggestions = command_suggestions
         self.hint_provider = hint_provider
         self._scroll = 0
+        self._positions_cache: Optional[tuple[tuple[int, int], dict[str, int]]] = None
+        self._render_cache: Optional[
+            tuple[tuple[Any, ...], list[Optional[str]], list[tuple[str, str]]]
+        ] = None
+        self._last_frame: Optional[tuple[Any, ...]] = None
 
     def display(self) -> None:
-        self.stdscr.clear()
         height, width = self.stdscr.getmaxyx()
+        frame = (
+            self.current_option,
+            self._scroll,
+            width,
+            height,
+            self.title,
+            id(self.banner_lines),
+            len(self.banner_lines),
+            id(self.extra_lines),
+            len(self.extra_lines),
+            id(self.options),
+            len(self.options),
+        )
+        if frame == self._last_frame:
+            # Nothing visible changed since the last frame; skip the redraw.
+            return
+        if self._last_frame is None:
+            # First frame, or another screen drew over us: force a full repaint.
+            self.stdscr.clear()
+        else:
+            # Let curses diff against the previous frame and send only changes.
+            self.stdscr.erase()
         row = 0
         show_status = self.hint_provider is not None
+        header_rows, option_lines = self._rendered_lines(width)
 
         # Header
         try:
-            for line in self.banner_lines:
+            for text in header_rows:
                 if row >= height:
                     break
-                self.stdscr.addstr(row, 0, line[: max(1, width - 1)])
-                row += 1
-            if row < height:
-                row += 1
-            if row < height:
-                self.stdscr.addstr(row, 0, self.title[: max(1, width - 1)])
-                row += 1
-            if row < height:
-                row += 1
-            for line in self.extra_lines:
-                if row >= height:
-                    break
-                self.stdscr.addstr(row, 0, line[: max(1, width - 1)])
-                row += 1
-            if self.extra_lines and row < height:
+                if text is not None:
+                    self.stdscr.addstr(row, 0, text)
                 row += 1
         except curses.error:
             # Ignore drawing errors on very small terminals.
@@ -196,17 +242,14 @@ class Menu:
                 self._scroll = max_scroll
 
             for idx in range(self._scroll, min(len(self.options), self._scroll + available)):
-                prefix = "  >> " if idx == self.current_option else "     "
-                max_label_len = max(1, width - 1 - len(prefix))
-                label = self.options[idx][:max_label_len]
-                line = f"{prefix}{label}"
+                selected_line, plain_line = option_lines[idx]
                 try:
                     if idx == self.current_option:
                         self.stdscr.attron(curses.color_pair(1))
-                        self.stdscr.addstr(row, 0, line[: max(1, width - 1)])
+                        self.stdscr.addstr(row, 0, selected_line)
                         self.stdscr.attroff(curses.color_pair(1))
                     else:
-                        self.stdscr.addstr(row, 0, line[: max(1, width - 1)])
+                        self.stdscr.addstr(row, 0, plain_line)
                 except curses.error:
                     break
                 row += 1
@@ -225,42 +268,110 @@ class Menu:
                 pass
 
         self.stdscr.refresh()
+        self._last_frame = frame
+
+    def invalidate(self) -> None:
+        """
+        Force the next `display` call to redraw, e.g. after another screen
+        has drawn over the menu.
+        """
+        self._last_frame = None
+
+    def _rendered_lines(
+        self, width: int
+    ) -> tuple[list[Optional[str]], list[tuple[str, str]]]:
+        """
+        Width-clipped header rows (None for spacers) and (selected, plain)
+        option lines, rebuilt only when the width changes or one of the
+        line lists is replaced or resized.
+        """
+        key = (
+            width,
+            self.title,
+            id(self.banner_lines),
+            len(self.banner_lines),
+            id(self.extra_lines),
+            len(self.extra_lines),
+            id(self.options),
+            len(self.options),
+        )
+        if self._render_cache is not None and self._render_cache[0] == key:
+            return self._render_cache[1], self._render_cache[2]
+
+        limit = max(1, width - 1)
+        header_rows: list[Optional[str]] = [line[:limit] for line in self.banner_lines]
+        header_rows += [None, self.title[:limit], None]
+        header_rows += [line[:limit] for line in self.extra_lines]
+        if self.extra_lines:
+            header_rows.append(None)
+
+        label_limit = max(1, width - 1 - 5)
+        option_lines = [
+            (f"  >> {option[:label_limit]}"[:limit], f"     {option[:label_limit]}"[:limit])
+            for option in self.options
+        ]
+        self._render_cache = (key, header_rows, option_lines)
+        return header_rows, option_lines
+
+    def _positions(self) -> dict[str, int]:
+        """
+        Option -> first index, rebuilt when the option list is replaced.
+        """
+        key = (id(self.options), len(self.options))
+        if self._positions_cache is None or self._positions_cache[0] != key:
+            self._positions_cache = (key, _option_positions(self.options))
+        return self._positions_cache[1]
 
     def _handle_navigation_key(self, key: int, cfg: Any) -> Optional[str]:
-        if key in (curses.KEY_UP,) or key_in(key, cfg.keys.get("up", [])):
-            self.current_option = (self.current_option - 1) % len(self.options)
+        count = len(self.options)
+        current = self.current_option
+        if key == curses.KEY_UP or key in cfg.keys_up:
+            self.current_option = current - 1 if current else count - 1
             return "continue"
-        if key in (curses.KEY_DOWN,) or key_in(key, cfg.keys.get("down", [])):
-            self.current_option = (self.current_option + 1) % len(self.options)
+        if key == curses.KEY_DOWN or key in cfg.keys_down:
+            self.current_option = current + 1 if current + 1 < count else 0
             return "continue"
-        if key_in(key, cfg.keys.get("top", [])):
+        if key in cfg.keys_top:
             self.current_option = 0
             return "continue"
-        if key_in(key, cfg.keys.get("bottom", [])):
-            self.current_option = len(self.options) - 1
+        if key in cfg.keys_bottom:
+            self.current_option = count - 1
             return "continue"
-        if key_in(key, cfg.keys.get("command", [])):
+        if key in cfg.keys_command:
             return "command"
-        if key_in(key, cfg.keys.get("search", [])):
+        if key in cfg.keys_search:
             return "search"
         if key == curses.KEY_RESIZE:
+            self.invalidate()
             return "continue"
-        if key_in(key, cfg.keys.get("help", [])):
+        if key in cfg.keys_help:
             _show_help(self.stdscr)
+            self.invalidate()
             return "continue"
-        if key in (curses.KEY_ENTER,) or key_in(key, cfg.keys.get("select", [])):
+        if key == curses.KEY_ENTER or key in cfg.keys_select:
             return "select"
-        if key_in(key, cfg.keys.get("back", [])):
+        if key in cfg.keys_back:
             return "back"
         return None
 
     def navigate(self) -> int:
+        return self._navigate(quit_on_q=True)
+
+    def _select_index(self) -> int:
+        """
+        Value returned from `navigate` when the current option is selected.
+        """
+        return self.current_option
+
+    def _navigate(self, quit_on_q: bool = False) -> int:
         cfg = get_config()
+        # Other screens may have drawn since this menu was last shown.
+        self.invalidate()
         while True:
             self.display()
             key = self.stdscr.getch()
 
-            if key == ord("q"):
+            if quit_on_q and key == ord("q"):
                 return -1
 
             action = self._handle_navigation_key(key, cfg)
@@ -269,6 +380,7 @@ class Menu:
                     continue
                 suggestions = self.command_suggestions() if self.command_suggestions else None
                 command = _prompt_command(self.stdscr, suggestions)
+                self.invalidate()
                 if not command:
                     continue
                 result = self.command_handler(command)
@@ -276,18 +388,15 @@ class Menu:
                     return -1
                 continue
             if action == "search":
-                idx = _fzf_pick_option(self.stdscr, self.options)
+                idx = _fzf_pick_option(self.stdscr, self.options, self._positions())
+                self.invalidate()
                 if idx is not None:
                     self.current_option = idx
                 continue
             if action == "select":
-                return self.current_option
+                return self._select_index()
             if action == "back":
                 return -1
-            if action == "continue":
-                continue
-            if key == ord("q"):
-                return -1
 
 
 class Submenu(Menu):
@@ -297,7 +406,7 @@ class Submenu(Menu):
         title: str,
         options: List[str],
         command_handler: Optional[Callable[[str], Optional[str]]] = None,
-        command_suggestions: Optional[Callable[[], List[str]]] = None,
+        command_suggestions: Optional[Callable[[], Sequence[str]]] = None,
         hint_provider: Optional[Callable[[int], Optional[str]]] = None,
     ) -> None:
         super().__init__(
@@ -310,36 +419,13 @@ class Submenu(Menu):
         )
 
     def navigate(self) -> int:
-        cfg = get_config()
-        while True:
-            self.display()
-            key = self.stdscr.getch()
+        return self._navigate()
 
-            action = self._handle_navigation_key(key, cfg)
-            if action == "command":
-                if self.command_handler is None:
-                    continue
-                suggestions = self.command_suggestions() if self.command_suggestions else None
-                command = _prompt_command(self.stdscr, suggestions)
-                if not command:
-                    continue
-                result = self.command_handler(command)
-                if result == "quit":
-                    return -1
-                continue
-            if action == "search":
-                idx = _fzf_pick_option(self.stdscr, self.options)
-                if idx is not None:
-                    self.current_option = idx
-                continue
-            if action == "select":
-                if self.current_option == len(self.options) - 1:
-                    return -1
-                return self.current_option
-            if action == "back":
-                return -1
-            if action == "continue":
-                continue
+    def _select_index(self) -> int:
+        # The trailing "Go back" entry behaves like back.
+        if self.current_option == len(self.options) - 1:
+            return -1
+        return self.current_option
 
 
 class RootMenu(Menu):
@@ -355,7 +441,7 @@ class RootMenu(Menu):
         extra_lines: Optional[List[str]] = None,
         banner_lines: Optional[List[str]] = None,
         command_handler: Optional[Callable[[str], Optional[str]]] = None,
-        command_suggestions: Optional[Callable[[], List[str]]] = None,
+        command_suggestions: Optional[Callable[[], Sequence[str]]] = None,
         hint_provider: Optional[Callable[[int], Optional[str]]] = None,
     ) -> None:
         super().__init__(
@@ -370,31 +456,4 @@ class RootMenu(Menu):
         )
 
     def navigate(self) -> int:
-        cfg = get_config()
-        while True:
-            self.display()
-            key = self.stdscr.getch()
-
-            action = self._handle_navigation_key(key, cfg)
-            if action == "command":
-                if self.command_handler is None:
-                    continue
-                suggestions = self.command_suggestions() if self.command_suggestions else None
-                command = _prompt_command(self.stdscr, suggestions)
-                if not command:
-                    continue
-                result = self.command_handler(command)
-                if result == "quit":
-                    return -1
-                continue
-            if action == "search":
-                idx = _fzf_pick_option(self.stdscr, self.options)
-                if idx is not None:
-                    self.current_option = idx
-                continue
-            if action == "select":
-                return self.current_option
-            if action == "back":
-                return -1
-            if action == "continue":
-                continue
+        return self._navigate()
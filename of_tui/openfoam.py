@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 import shutil
+import stat
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -13,6 +15,63 @@ class OpenFOAMError(RuntimeError):
     pass
 
 
+class StatCache:
+    """
+    Memoize `os.stat` results by path until invalidated.
+
+    Missing paths are cached too, so repeated existence checks on
+    optional files (decomposeParDict, 0/ ...) cost a single syscall.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Path, Optional[os.stat_result]] = {}
+
+    def stat(self, path: Path) -> Optional[os.stat_result]:
+        try:
+            return self._entries[path]
+        except KeyError:
+            pass
+        try:
+            result: Optional[os.stat_result] = path.stat()
+        except OSError:
+            result = None
+        self._entries[path] = result
+        return result
+
+    def is_file(self, path: Path) -> bool:
+        result = self.stat(path)
+        return result is not None and stat.S_ISREG(result.st_mode)
+
+    def is_dir(self, path: Path) -> bool:
+        result = self.stat(path)
+        return result is not None and stat.S_ISDIR(result.st_mode)
+
+    def invalidate(self, path: Path) -> None:
+        self._entries.pop(path, None)
+
+    def invalidate_all(self) -> None:
+        self._entries.clear()
+
+
+def file_stamp(
+    path: Path, stat_cache: Optional[StatCache] = None
+) -> Optional[tuple[int, int]]:
+    """
+    Return a regular file's (mtime_ns, size) cache stamp, or None when it
+    is missing.
+    """
+    if stat_cache is not None:
+        info = stat_cache.stat(path)
+    else:
+        try:
+            info = path.stat()
+        except OSError:
+            return None
+    if info is None or not stat.S_ISREG(info.st_mode):
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
 def ensure_environment() -> None:
     """
     Ensure OpenFOAM utilities are available.
@@ -49,14 +108,56 @@ def run_foam_dictionary(
     return result
 
 
+# file path -> ((mtime_ns, size), keywords, keyword -> first index) for the
+# last successful listing.
+_KEYWORD_CACHE: Dict[Path, tuple[tuple[int, int], List[str], Dict[str, int]]] = {}
+
+
 def list_keywords(file_path: Path) -> List[str]:
     """
     List top-level keywords for a dictionary file.
+
+    Results are reused until the file's mtime or size changes.
     """
+    stamp = file_stamp(file_path)
+    cached = _KEYWORD_CACHE.get(file_path)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return list(cached[1])
+
     result = run_foam_dictionary(file_path, ["-keywords"])
     if result.returncode != 0:
         raise OpenFOAMError(result.stderr.strip() or "Failed to list keywords.")
-    return [line for line in result.stdout.splitlines() if line.strip()]
+    keywords = [line for line in result.stdout.splitlines() if line.strip()]
+    if stamp is not None:
+        _KEYWORD_CACHE[file_path] = (stamp, keywords, keyword_positions(keywords))
+    return list(keywords)
+
+
+def keyword_index(file_path: Path, keyword: str) -> Optional[int]:
+    """
+    Return the position of a top-level keyword, or None when absent.
+
+    Uses the mapping memoized alongside `list_keywords` results.
+    """
+    stamp = file_stamp(file_path)
+    cached = _KEYWORD_CACHE.get(file_path)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return cached[2].get(keyword)
+    return keyword_positions(list_keywords(file_path)).get(keyword)
+
+
+def keyword_positions(keywords: Sequence[str]) -> Dict[str, int]:
+    """
+    Map each keyword to the index of its first occurrence.
+    """
+    positions: Dict[str, int] = {}
+    for idx, key in enumerate(keywords):
+        positions.setdefault(key, idx)
+    return positions
+
+
+def invalidate_keyword_cache(file_path: Path) -> None:
+    _KEYWORD_CACHE.pop(file_path, None)
 
 
 def list_subkeys(file_path: Path, entry: str) -> List[str]:
@@ -217,11 +318,123 @@ def normalize_scalar_token(value: str) -> str:
 
 
 def read_entry(file_path: Path, key: str) -> str:
+    return _entry_value(_read_entry_text(file_path, key), key)
+
+
+@dataclass
+class EntryBundle:
+    value: str
+    subkeys: List[str] = field(default_factory=list)
+    comments: List[str] = field(default_factory=list)
+
+
+def get_entry_bundle(file_path: Path, key: str) -> EntryBundle:
+    """
+    Read an entry's value, sub-keys and comments with a single
+    foamDictionary call.
+
+    Sub-keys are parsed from the printed entry instead of running
+    `-keywords` separately; comments come from the file itself.
+    """
+    text = _read_entry_text(file_path, key)
+    return EntryBundle(
+        value=_entry_value(text, key),
+        subkeys=dictionary_keywords(text),
+        comments=get_entry_comments(file_path, key),
+    )
+
+
+def dictionary_keywords(text: str) -> List[str]:
+    """
+    Keywords of the direct entries of a printed `name { ... }` dictionary,
+    in file order. Returns an empty list for non-dictionary entries.
+    """
+    return [keyword for keyword, _value in dictionary_entries(text)]
+
+
+def dictionary_entries(text: str) -> List[tuple[str, str]]:
+    """
+    Direct entries of a printed `name { ... }` dictionary as (keyword,
+    value) pairs in file order.
+
+    Values keep their terminating `;`, or their braces for sub-dictionaries.
+    Comments, quoted strings and `#` directives are skipped over. Returns
+    an empty list for non-dictionary entries.
+    """
+    text, structure = _mask_comments_and_strings(text)
+    start = structure.find("{")
+    end = structure.rfind("}")
+    if start < 0 or end <= start or len(text[:start].split()) > 1:
+        return []
+    entries: List[tuple[str, str]] = []
+    depth = 0
+    begin = start + 1
+    for pos in range(start + 1, end):
+        ch = structure[pos]
+        if ch in "({[":
+            depth += 1
+        elif ch in ")}]":
+            depth -= 1
+            if ch == "}" and depth == 0:
+                _append_entry(entries, text[begin : pos + 1])
+                begin = pos + 1
+        elif ch == ";" and depth == 0:
+            _append_entry(entries, text[begin : pos + 1])
+            begin = pos + 1
+        elif ch == "\n" and depth == 0 and text[begin:pos].lstrip().startswith("#"):
+            # `#include "file"` and friends end at the line break.
+            begin = pos + 1
+    return entries
+
+
+def _mask_comments_and_strings(text: str) -> tuple[str, str]:
+    """
+    Return `text` with comments blanked out, plus a copy that also blanks
+    the inside of quoted strings; both keep the original offsets.
+    """
+    cleaned = list(text)
+    structure = list(text)
+    pos = 0
+    while pos < len(text):
+        ch = text[pos]
+        if ch == '"':
+            close = pos + 1
+            while close < len(text) and text[close] != '"':
+                close += 2 if text[close] == "\\" else 1
+            close = min(close, len(text))
+            structure[pos + 1 : close] = " " * (close - pos - 1)
+            pos = close + 1
+            continue
+        if text.startswith("//", pos):
+            close = text.find("\n", pos)
+            close = len(text) if close < 0 else close
+        elif text.startswith("/*", pos):
+            close = text.find("*/", pos + 2)
+            close = len(text) if close < 0 else close + 2
+        else:
+            pos += 1
+            continue
+        cleaned[pos:close] = structure[pos:close] = " " * (close - pos)
+        pos = close
+    return "".join(cleaned), "".join(structure)
+
+
+def _append_entry(entries: List[tuple[str, str]], statement: str) -> None:
+    # `statement` ends with its `;` or closing brace; the keyword never does.
+    body = statement.strip()
+    parts = body[:-1].split(None, 1)
+    if parts and not parts[0].startswith("#"):
+        entries.append((parts[0], body[len(parts[0]) :].strip()))
+
+
+def _read_entry_text(file_path: Path, key: str) -> str:
     result = run_foam_dictionary(file_path, ["-entry", key])
     if result.returncode != 0:
         raise OpenFOAMError(result.stderr.strip() or f"Failed to read entry {key}.")
-    text = result.stdout.strip()
+    return result.stdout.strip()
+
 
+def _entry_value(text: str, key: str) -> str:
     # Heuristic: for simple scalar entries foamDictionary may echo
     # `key value;`. In that case we only want the value part for
     # editing and for -set operations. For multi-line entries or
@@ -238,36 +451,45 @@ def read_entry(file_path: Path, key: str) -> str:
     return text
 
 
-def write_entry(file_path: Path, key: str, value: str) -> bool:
+def write_entry(
+    file_path: Path, key: str, value: str, stat_cache: Optional[StatCache] = None
+) -> bool:
     result = run_foam_dictionary(file_path, ["-entry", key, "-set", value])
+    invalidate_keyword_cache(file_path)
+    if stat_cache is not None:
+        stat_cache.invalidate(file_path)
     return result.returncode == 0
 
 
-def discover_case_files(case_dir: Path) -> Dict[str, List[Path]]:
+def discover_case_files(
+    case_dir: Path, stat_cache: Optional[StatCache] = None
+) -> Dict[str, List[Path]]:
     """
     Discover candidate dictionary files in an OpenFOAM case.
 
     Returns a mapping: section -> list of files.
     Sections: "system", "constant", "0*".
     """
+    if stat_cache is None:
+        stat_cache = StatCache()
     case_dir = case_dir.resolve()
     sections = {"system": [], "constant": [], "0*": []}  # type: Dict[str, List[Path]]
 
     system_dir = case_dir / "system"
-    if system_dir.is_dir():
+    if stat_cache.is_dir(system_dir):
         sections["system"] = sorted(
-            p for p in system_dir.iterdir() if p.is_file()
+            p for p in system_dir.iterdir() if stat_cache.is_file(p)
         )
 
     constant_dir = case_dir / "constant"
-    if constant_dir.is_dir():
+    if stat_cache.is_dir(constant_dir):
         sections["constant"] = sorted(
-            p for p in constant_dir.iterdir() if p.is_file()
+            p for p in constant_dir.iterdir() if stat_cache.is_file(p)
         )
 
     zero_dirs: List[Path] = []
     for entry in case_dir.iterdir():
-        if not entry.is_dir():
+        if not stat_cache.is_dir(entry):
             continue
         name = entry.name
         if not name.startswith("0"):
@@ -284,7 +506,7 @@ def discover_case_files(case_dir: Path) -> Dict[str, List[Path]]:
 
     zero_files: List[Path] = []
     for d in zero_dirs:
-        zero_files.extend(p for p in d.iterdir() if p.is_file())
+        zero_files.extend(p for p in d.iterdir() if stat_cache.is_file(p))
     sections["0*"] = sorted(zero_files)
 
     return sections
@@ -301,6 +523,7 @@ def verify_case(
     case_dir: Path,
     progress: Optional[Callable[[Path], None]] = None,
     result_callback: Optional[Callable[[Path, FileCheckResult], None]] = None,
+    sections: Optional[Dict[str, List[Path]]] = None,
 ) -> Dict[Path, FileCheckResult]:
     """
     Run a correctness check over all discovered dictionary files.
@@ -309,9 +532,12 @@ def verify_case(
     this inspects each entry recursively to detect missing required
     sub-entries (as hinted by `foamDictionary -info`) and invalid
     enum values (compared against `foamDictionary -list`).
+
+    Pass ``sections`` to reuse an earlier `discover_case_files` scan.
     """
 
-    sections = discover_case_files(case_dir)
+    if sections is None:
+        sections = discover_case_files(case_dir)
     results: Dict[Path, FileCheckResult] = {}
     all_files: List[Path] = []
     for files in sections.values():
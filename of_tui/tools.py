@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import curses
+import functools
+import hashlib
 import os
 import shlex
 import re
+import shutil
 import subprocess
+import tempfile
+import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional, Union
 
 from .editor import Viewer
 from .menus import Menu
-from .openfoam import read_entry, OpenFOAMError
+from .openfoam import file_stamp, read_entry, OpenFOAMError
 from .config import get_config
 
 
@@ -24,6 +30,117 @@ class LastToolRun:
 
 _LAST_TOOL_RUN: Optional[LastToolRun] = None
 
+# Variables that would make a non-interactive bash source startup files.
+_SHELL_ENV_DROP = frozenset({"BASH_ENV", "ENV"})
+
+_LATEST_TIME_TOKEN = "{{latestTime}}"
+
+# Value tails of checkMesh summary lines; lines are picked with plain str tests.
+_CHECKMESH_INT_RE = re.compile(r"\d+")
+_CHECKMESH_FLOAT_RE = re.compile(r"[0-9eE.+-]+")
+_CHECKMESH_FAILED_RE = re.compile(r"failed\s+(\d+)\s+mesh checks")
+
+# Characters that make shlex.split differ from a plain whitespace split.
+_SHLEX_SPECIAL = frozenset("'\"\\")
+
+# bash -c command lines that source an OpenFOAM helper script first.
+_RUN_APPLICATION_CMD = '. "{wm_dir}/bin/tools/RunFunctions"; runApplication {args}'
+_CLEAN_FUNCTION_CMD = '. "{wm_dir}/bin/tools/CleanFunctions"; {function}'
+
+# Placeholder dictionary written when no helper can generate one.
+_STUB_DICT_TEMPLATE = (
+    "/*--------------------------------*- C++ -*----------------------------------*\\\n"
+    "| OpenFOAM {tool_name} dictionary (stub)                           |\n"
+    "\\*---------------------------------------------------------------------------*/\n"
+    "FoamFile\n"
+    "{{\n"
+    "    version     2.0;\n"
+    "    format      ascii;\n"
+    "    class       dictionary;\n"
+    "    object      {object_name};\n"
+    "}}\n"
+    "\n"
+    "// TODO: fill in tool configuration.\n"
+)
+
+# Menu labels and status-bar hints for tools_screen entries after the simple
+# tools; both line up with _SPECIAL_ACTIONS.
+_SPECIAL_LABELS = (
+    "Job status (poll)",
+    "foamJob (run job)",
+    "foamEndJob (stop job)",
+    "Run .sh script",
+    "foamDictionary (prompt)",
+    "postProcess (prompt)",
+    "foamCalc (prompt)",
+    "topoSet (prompt)",
+    "Tool dicts (postProcess/topoSet/foamCalc)",
+    "Run current solver (runApplication)",
+    "Remove all logs (CleanFunctions)",
+    "Clean time directories (CleanFunctions)",
+    "Clean case (CleanFunctions)",
+)
+_SPECIAL_HINTS = (
+    "Poll foamCheckJobs/foamPrintJobs output",
+    "Run foamJob with custom args",
+    "Stop job via foamEndJob",
+    "Run a shell script from case folder",
+    "Run foamDictionary interactively",
+    "Run postProcess with args (uses postProcessDict)",
+    "Run foamCalc with args (uses foamCalcDict)",
+    "Run topoSet with args (uses topoSetDict)",
+    "Create/open tool dictionaries",
+    "Run solver from system/controlDict",
+    "Remove log.* files",
+    "Remove time directories",
+    "Clean case (logs + time dirs)",
+)
+
+# diagnostics_screen tools (name, command), then its fixed menu entries.
+_DIAG_TOOLS = (
+    ("foamSystemCheck", ("foamSystemCheck",)),
+    ("foamInstallationTest", ("foamInstallationTest",)),
+    ("checkMesh", ("checkMesh",)),
+)
+_DIAG_MENU_LABELS = (*(name for name, _ in _DIAG_TOOLS), "View logs", "Back")
+
+# Helpers polled by job_status_poll_screen, and the marker each is followed
+# by (with its exit status) in the shared shell's output.
+_JOB_POLL_TOOLS = ("foamCheckJobs", "foamPrintJobs")
+_JOB_POLL_MARK = "__of_tui_job_exit__="
+
+# Trailing lines kept per stream by _run_streaming.
+_STREAM_LINE_LIMIT = 5000
+
+# Read size when copying spilled tool output into a log file.
+_LOG_COPY_BYTES = 1 << 16
+
+# Bytes of a tool dictionary read for its preview.
+_DICT_PREVIEW_BYTES = 1 << 20
+
+# (tool name, PATH) -> absolute executable path, or None when not on PATH.
+_TOOL_PATH_CACHE: dict[tuple[str, str], Optional[str]] = {}
+
+# Characters dropped from tool names: anything but word chars, "-", "." and ":".
+_TOOL_NAME_STRIP_RE = re.compile(r"[^\w.:-]")
+
+# preset file -> ((mtime_ns, size), parsed presets).
+_PRESET_CACHE: dict[Path, tuple[tuple[int, int], tuple[tuple[str, list[str]], ...]]] = {}
+# Bumped whenever a preset file is (re)parsed or disappears.
+_PRESET_GENERATION = 0
+
+# case path -> (preset generation, sorted tool command names).
+_ALIAS_KEYS_CACHE: dict[Path, tuple[int, list[str]]] = {}
+
+# controlDict -> ((mtime_ns, size), raw application entry).
+_APPLICATION_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+
+# case path -> (case directory mtime_ns, latest time name).
+_LATEST_TIME_CACHE: dict[Path, tuple[int, str]] = {}
+
+# log path -> (content digest, (mtime_ns, size)) of the last write.
+_LOG_DIGESTS: dict[Path, tuple[bytes, tuple[int, int]]] = {}
+
 
 def _no_foam_hint() -> str:
     if os.environ.get("OF_TUI_NO_FOAM") == "1":
@@ -65,47 +182,75 @@ def _maybe_job_hint(name: str) -> Optional[str]:
 def _load_presets_from_path(cfg_path: Path) -> list[tuple[str, list[str]]]:
     """
     Load tool presets from a colon-delimited config file.
+
+    Parsed presets are reused until the file's mtime or size changes.
     """
-    presets: list[tuple[str, list[str]]] = []
-    if not cfg_path.is_file():
-        return presets
+    global _PRESET_GENERATION
+    stamp = file_stamp(cfg_path)
+    if stamp is None:
+        if _PRESET_CACHE.pop(cfg_path, None) is not None:
+            _PRESET_GENERATION += 1
+        return []
+    cached = _PRESET_CACHE.get(cfg_path)
+    if cached is not None and cached[0] == stamp:
+        return list(cached[1])
 
+    presets: list[tuple[str, list[str]]] = []
     try:
-        for raw_line in cfg_path.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if ":" not in line:
-                continue
-            name, cmd_str = line.split(":", 1)
-            name = name.strip()
-            cmd_str = cmd_str.strip()
-            if not name or not cmd_str:
-                continue
-            try:
-                cmd = shlex.split(cmd_str)
-            except ValueError:
-                continue
-            presets.append((name, cmd))
+        text = cfg_path.read_text()
     except OSError:
         return presets
 
+    # Whitespace-only stub files skip line splitting altogether.
+    for raw_line in () if text.isspace() else text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if ":" not in line:
+            continue
+        name, cmd_str = line.split(":", 1)
+        name = name.strip()
+        cmd_str = cmd_str.strip()
+        if not name or not cmd_str:
+            continue
+        try:
+            cmd = shlex.split(cmd_str)
+        except ValueError:
+            continue
+        presets.append((name, cmd))
+
+    _PRESET_CACHE[cfg_path] = (stamp, tuple(presets))
+    _PRESET_GENERATION += 1
     return presets
 
 
 def _normalize_tool_name(name: str) -> str:
-    lowered = name.strip().lower()
-    return "".join(ch for ch in lowered if ch.isalnum() or ch in ("-", "_", ".", ":"))
+    return _TOOL_NAME_STRIP_RE.sub("", name.strip().lower())
 
 
 def list_tool_commands(case_path: Path) -> list[str]:
-    return sorted(set(_tool_alias_keys(case_path)))
+    """
+    Sorted, de-duplicated tool command names, rebuilt only after a preset
+    file for any case changes.
+    """
+    # Loading refreshes the preset stamps and bumps the generation on change.
+    load_tool_presets(case_path)
+    load_postprocessing_presets(case_path)
+    cached = _ALIAS_KEYS_CACHE.get(case_path)
+    if cached is not None and cached[0] == _PRESET_GENERATION:
+        return list(cached[1])
+    commands = sorted(set(_tool_alias_keys(case_path)))
+    _ALIAS_KEYS_CACHE[case_path] = (_PRESET_GENERATION, commands)
+    return list(commands)
 
 
 def run_tool_by_name(stdscr: Any, case_path: Path, name: str) -> bool:
-    aliases = _tool_aliases(stdscr, case_path)
     key = _normalize_tool_name(name)
-    handler = aliases.get(key)
+    special = _SPECIAL_HANDLERS.get(key)
+    if special is not None:
+        special(stdscr, case_path)
+        return True
+    handler = _tool_aliases(stdscr, case_path).get(key)
     if handler is None:
         return False
     handler()
@@ -121,18 +266,7 @@ def _tool_aliases(stdscr: Any, case_path: Path) -> dict[str, Callable[[], None]]
     def run_simple(name: str, cmd: list[str]) -> Callable[[], None]:
         return lambda: _run_simple_tool(stdscr, case_path, name, list(cmd))
 
-    base_tools = [
-        ("blockMesh", ["blockMesh"]),
-        ("decomposePar", ["decomposePar"]),
-        ("reconstructPar", ["reconstructPar"]),
-        ("foamListTimes", ["foamListTimes"]),
-    ]
-    extra_tools = load_tool_presets(case_path)
-    job_tools = [
-        ("foamCheckJobs", ["foamCheckJobs"]),
-        ("foamPrintJobs", ["foamPrintJobs"]),
-    ]
-    post_tools = load_postprocessing_presets(case_path)
+    base_tools, extra_tools, job_tools, post_tools = _gather_tool_lists(case_path)
 
     for name, cmd in base_tools + extra_tools + job_tools:
         add(name, run_simple(name, cmd))
@@ -142,78 +276,84 @@ def _tool_aliases(stdscr: Any, case_path: Path) -> dict[str, Callable[[], None]]
         add(f"post.{name}", run_simple(name, cmd))
         add(f"post:{name}", run_simple(name, cmd))
 
-    add("rerun", lambda: rerun_last_tool(stdscr, case_path))
-    add("last", lambda: rerun_last_tool(stdscr, case_path))
-    add("foamjob", lambda: foam_job_prompt(stdscr, case_path))
-    add("foamendjob", lambda: foam_end_job_prompt(stdscr, case_path))
-    add("jobstatus", lambda: job_status_poll_screen(stdscr, case_path))
-    add("job_status", lambda: job_status_poll_screen(stdscr, case_path))
-    add("runscript", lambda: run_shell_script_screen(stdscr, case_path))
-    add("foamdictionary", lambda: foam_dictionary_prompt(stdscr, case_path))
-    add("postprocess", lambda: post_process_prompt(stdscr, case_path))
-    add("foamcalc", lambda: foam_calc_prompt(stdscr, case_path))
-    add("toposet", lambda: topo_set_prompt(stdscr, case_path))
-    add("tool_dicts", lambda: tool_dicts_screen(stdscr, case_path))
-    add("tooldicts", lambda: tool_dicts_screen(stdscr, case_path))
-    add("runcurrentsolver", lambda: run_current_solver(stdscr, case_path))
-    add("removelogs", lambda: remove_all_logs(stdscr, case_path))
-    add("cleantimedirs", lambda: clean_time_directories(stdscr, case_path))
-    add("cleancase", lambda: clean_case(stdscr, case_path))
-
     return aliases
 
 
 def _tool_alias_keys(case_path: Path) -> list[str]:
     keys: list[str] = []
 
+    base_tools, extra_tools, job_tools, post_tools = _gather_tool_lists(case_path)
+
+    for name, _ in base_tools + extra_tools + job_tools:
+        keys.append(_normalize_tool_name(name))
+
+    for name, _ in post_tools:
+        keys.append(_normalize_tool_name(name))
+        keys.append(_normalize_tool_name(f"post.{name}"))
+        keys.append(_normalize_tool_name(f"post:{name}"))
+
+    keys.extend(_SPECIAL_HANDLERS)
+
+    return keys
+
+
+def _gather_tool_lists(case_path: Path) -> tuple[
+    list[tuple[str, list[str]]],
+    list[tuple[str, list[str]]],
+    list[tuple[str, list[str]]],
+    list[tuple[str, list[str]]],
+]:
+    """
+    Return (base, preset, job, post-processing) tools, loading each preset
+    file once for the caller.
+    """
     base_tools = [
         ("blockMesh", ["blockMesh"]),
         ("decomposePar", ["decomposePar"]),
         ("reconstructPar", ["reconstructPar"]),
         ("foamListTimes", ["foamListTimes"]),
     ]
-    extra_tools = load_tool_presets(case_path)
     job_tools = [
         ("foamCheckJobs", ["foamCheckJobs"]),
         ("foamPrintJobs", ["foamPrintJobs"]),
     ]
-    post_tools = load_postprocessing_presets(case_path)
+    return (
+        base_tools,
+        load_tool_presets(case_path),
+        job_tools,
+        load_postprocessing_presets(case_path),
+    )
 
-    for name, _ in base_tools + extra_tools + job_tools:
-        keys.append(_normalize_tool_name(name))
 
-    for name, _ in post_tools:
-        keys.append(_normalize_tool_name(name))
-        keys.append(_normalize_tool_name(f"post.{name}"))
-        keys.append(_normalize_tool_name(f"post:{name}"))
+@functools.lru_cache(maxsize=64)
+def _split_args(arg_line: str) -> tuple[str, ...]:
+    """
+    Split a prompt's argument line like a shell; repeated lines are cached.
+    """
+    if _SHLEX_SPECIAL.isdisjoint(arg_line):
+        return tuple(arg_line.split())
+    return tuple(shlex.split(arg_line))
 
-    keys.extend(
-        [
-            _normalize_tool_name("rerun"),
-            _normalize_tool_name("last"),
-            _normalize_tool_name("foamJob"),
-            _normalize_tool_name("foamEndJob"),
-            _normalize_tool_name("runScript"),
-            _normalize_tool_name("foamDictionary"),
-            _normalize_tool_name("postProcess"),
-            _normalize_tool_name("foamCalc"),
-            _normalize_tool_name("topoSet"),
-            _normalize_tool_name("tool_dicts"),
-            _normalize_tool_name("toolDicts"),
-            _normalize_tool_name("runCurrentSolver"),
-            _normalize_tool_name("removeLogs"),
-            _normalize_tool_name("cleanTimeDirs"),
-            _normalize_tool_name("cleanCase"),
-        ]
-    )
 
-    return keys
+def _prompt_line(stdscr: Any, label: str, clear: bool = True) -> str:
+    """
+    Show `label` (on a cleared screen unless `clear` is False) and read one
+    echoed line of input, stripped.
+    """
+    curses.echo()
+    try:
+        if clear:
+            stdscr.clear()
+        stdscr.addstr(label)
+        stdscr.refresh()
+        return stdscr.getstr().decode(errors="replace").strip()
+    finally:
+        curses.noecho()
 
 
 def _show_message(stdscr: Any, message: str) -> None:
     stdscr.clear()
-    stdscr.addstr(message + "\n")
-    stdscr.addstr("Press any key to continue.\n")
+    stdscr.addstr(f"{message}\nPress any key to continue.\n")
     stdscr.refresh()
     stdscr.getch()
 
@@ -244,8 +384,7 @@ def _run_simple_tool(stdscr: Any, case_path: Path, name: str, cmd: list[str]) ->
     expanded = _expand_command(cmd, case_path)
     wm_dir = os.environ.get("WM_PROJECT_DIR")
     if wm_dir and get_config().use_runfunctions:
-        cmd_str = " ".join(shlex.quote(part) for part in expanded)
-        shell_cmd = f'. "{wm_dir}/bin/tools/RunFunctions"; runApplication {cmd_str}'
+        shell_cmd = _RUN_APPLICATION_CMD.format(wm_dir=wm_dir, args=shlex.join(expanded))
         _record_last_tool(name, "shell", shell_cmd)
         _run_shell_tool(stdscr, case_path, name, shell_cmd)
         return
@@ -263,35 +402,23 @@ def _run_simple_tool(stdscr: Any, case_path: Path, name: str, cmd: list[str]) ->
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run {name}: {exc}"))
         return
 
-    status = "OK" if result.returncode == 0 else "ERROR"
-    summary_lines = [
-        f"$ cd {case_path}",
-        f"$ {' '.join(cmd)}",
-        "",
-        f"status: {status} (exit code {result.returncode})",
-        "",
-    ]
-    hint = _maybe_job_hint(name)
-    if hint:
-        summary_lines.append(hint)
-        summary_lines.append("")
-    summary_lines += [
-        "stdout:",
-        result.stdout or "(empty)",
-        "",
-        "stderr:",
-        result.stderr or "(empty)",
-    ]
-    viewer = Viewer(stdscr, "\n".join(summary_lines))
+    viewer = Viewer(
+        stdscr,
+        _command_output_text(
+            case_path,
+            " ".join(cmd),
+            result.returncode,
+            result.stdout,
+            result.stderr,
+            _maybe_job_hint(name),
+        ),
+    )
     viewer.display()
 
 
 def _run_shell_tool(stdscr: Any, case_path: Path, name: str, shell_cmd: str) -> None:
     shell_cmd = _expand_shell_command(shell_cmd, case_path)
     _record_last_tool(name, "shell", shell_cmd)
-    env = os.environ.copy()
-    env.pop("BASH_ENV", None)
-    env.pop("ENV", None)
     try:
         result = subprocess.run(
             ["bash", "--noprofile", "--norc", "-c", shell_cmd],
@@ -299,72 +426,72 @@ def _run_shell_tool(stdscr: Any, case_path: Path, name: str, shell_cmd: str) ->
             capture_output=True,
             text=True,
             check=False,
-            env=env,
+            env=_shell_env(),
         )
     except OSError as exc:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run {name}: {exc}"))
         return
 
-    status = "OK" if result.returncode == 0 else "ERROR"
-    summary_lines = [
-        f"$ cd {case_path}",
-        f"$ bash --noprofile --norc -c {shell_cmd}",
-        "",
-        f"status: {status} (exit code {result.returncode})",
-        "",
-    ]
-    hint = _maybe_job_hint(name)
-    if hint:
-        summary_lines.append(hint)
-        summary_lines.append("")
-    summary_lines += [
-        "stdout:",
-        result.stdout or "(empty)",
-        "",
-        "stderr:",
-        result.stderr or "(empty)",
-    ]
-    viewer = Viewer(stdscr, "\n".join(summary_lines))
+    viewer = Viewer(
+        stdscr,
+        _command_output_text(
+            case_path,
+            f"bash --noprofile --norc -c {shell_cmd}",
+            result.returncode,
+            result.stdout,
+            result.stderr,
+            _maybe_job_hint(name),
+        ),
+    )
     viewer.display()
 
 
+def _command_output_text(
+    case_path: Path,
+    command: str,
+    returncode: int,
+    stdout: str,
+    stderr: str,
+    hint: Optional[str] = None,
+) -> str:
+    """
+    Viewer text for a finished tool run: command, status, hint and output.
+    """
+    status = "OK" if returncode == 0 else "ERROR"
+    hint_block = f"{hint}\n\n" if hint else ""
+    return (
+        f"$ cd {case_path}\n$ {command}\n\n"
+        f"status: {status} (exit code {returncode})\n\n"
+        f"{hint_block}stdout:\n{stdout or '(empty)'}\n\n"
+        f"stderr:\n{stderr or '(empty)'}"
+    )
+
+
+def _shell_env() -> dict[str, str]:
+    """
+    Environment for `bash -c` tools, without the startup-file hooks.
+
+    Built per call in one filtering pass: `:nofoam` edits os.environ at
+    runtime, and checking it for changes would cost as much as the copy.
+    """
+    return {key: value for key, value in os.environ.items() if key not in _SHELL_ENV_DROP}
+
+
 def tools_screen(stdscr: Any, case_path: Path) -> None:
     """
     Tools menu with common solvers/utilities, job helpers, logs, and
     optional shell scripts, all in a single flat list.
     """
-    base_tools = [
-        ("blockMesh", ["blockMesh"]),
-        ("decomposePar", ["decomposePar"]),
-        ("reconstructPar", ["reconstructPar"]),
-        ("foamListTimes", ["foamListTimes"]),
-    ]
-    extra_tools = load_tool_presets(case_path)
-    job_tools = [
-        ("foamCheckJobs", ["foamCheckJobs"]),
-        ("foamPrintJobs", ["foamPrintJobs"]),
-    ]
-    post_tools = [
-        (f"[post] {name}", cmd) for name, cmd in load_postprocessing_presets(case_path)
-    ]
+    base_tools, extra_tools, job_tools, post_presets = _gather_tool_lists(case_path)
+    post_tools = [(f"[post] {name}", cmd) for name, cmd in post_presets]
 
     simple_tools = base_tools + extra_tools + job_tools + post_tools
 
-    labels = ["Re-run last tool"] + [name for name, _ in simple_tools] + [
-        "Job status (poll)",
-        "foamJob (run job)",
-        "foamEndJob (stop job)",
-        "Run .sh script",
-        "foamDictionary (prompt)",
-        "postProcess (prompt)",
-        "foamCalc (prompt)",
-        "topoSet (prompt)",
-        "Tool dicts (postProcess/topoSet/foamCalc)",
-        "Run current solver (runApplication)",
-        "Remove all logs (CleanFunctions)",
-        "Clean time directories (CleanFunctions)",
-        "Clean case (CleanFunctions)",
-    ]
+    labels = ["Re-run last tool", *(name for name, _ in simple_tools), *_SPECIAL_LABELS]
+
+    # The Tools menu has no command prompt, so the environment (and with it
+    # the status suffix) cannot change while it is open.
+    status = tool_status_mode()
 
     def hint_for(idx: int) -> str:
         if idx == 0:
@@ -372,31 +499,16 @@ def tools_screen(stdscr: Any, case_path: Path) -> None:
                 base = "Re-run last tool (none yet)"
             else:
                 base = f"Re-run last tool: {_LAST_TOOL_RUN.name}"
-            return f"{base} | {tool_status_mode()}"
+            return f"{base} | {status}"
         simple_index = idx - 1
         if 0 <= simple_index < len(simple_tools):
             name, _cmd = simple_tools[simple_index]
             if name.startswith("[post]"):
-                return f"Post-processing preset: {name} | {tool_status_mode()}"
-            return f"Run tool: {name} | {tool_status_mode()}"
+                return f"Post-processing preset: {name} | {status}"
+            return f"Run tool: {name} | {status}"
         special = idx - 1 - len(simple_tools)
-        hints = [
-            "Poll foamCheckJobs/foamPrintJobs output",
-            "Run foamJob with custom args",
-            "Stop job via foamEndJob",
-            "Run a shell script from case folder",
-            "Run foamDictionary interactively",
-            "Run postProcess with args (uses postProcessDict)",
-            "Run foamCalc with args (uses foamCalcDict)",
-            "Run topoSet with args (uses topoSetDict)",
-            "Create/open tool dictionaries",
-            "Run solver from system/controlDict",
-            "Remove log.* files",
-            "Remove time directories",
-            "Clean case (logs + time dirs)",
-        ]
-        if 0 <= special < len(hints):
-            return f"{hints[special]} | {tool_status_mode()}"
+        if 0 <= special < len(_SPECIAL_HINTS):
+            return f"{_SPECIAL_HINTS[special]} | {status}"
         return ""
 
     menu = Menu(stdscr, "Tools", labels + ["Back"], hint_provider=hint_for)
@@ -414,34 +526,10 @@ def tools_screen(stdscr: Any, case_path: Path) -> None:
         _run_simple_tool(stdscr, case_path, name, cmd)
         return
 
-    # Offsets into special actions.
+    # Offsets into special actions, in the same order as the labels above.
     special_index = choice - 1 - len(simple_tools)
-    if special_index == 0:
-        job_status_poll_screen(stdscr, case_path)
-    elif special_index == 1:
-        foam_job_prompt(stdscr, case_path)
-    elif special_index == 2:
-        foam_end_job_prompt(stdscr, case_path)
-    elif special_index == 3:
-        run_shell_script_screen(stdscr, case_path)
-    elif special_index == 4:
-        foam_dictionary_prompt(stdscr, case_path)
-    elif special_index == 5:
-        post_process_prompt(stdscr, case_path)
-    elif special_index == 6:
-        foam_calc_prompt(stdscr, case_path)
-    elif special_index == 7:
-        topo_set_prompt(stdscr, case_path)
-    elif special_index == 8:
-        tool_dicts_screen(stdscr, case_path)
-    elif special_index == 9:
-        run_current_solver(stdscr, case_path)
-    elif special_index == 10:
-        remove_all_logs(stdscr, case_path)
-    elif special_index == 11:
-        clean_time_directories(stdscr, case_path)
-    elif special_index == 12:
-        clean_case(stdscr, case_path)
+    if 0 <= special_index < len(_SPECIAL_ACTIONS):
+        _SPECIAL_ACTIONS[special_index](stdscr, case_path)
 
 
 def logs_screen(stdscr: Any, case_path: Path) -> None:
@@ -498,21 +586,8 @@ def job_status_poll_screen(stdscr: Any, case_path: Path) -> None:
                 except curses.error:
                     pass
 
-            output_lines: list[str] = []
-            for tool in ("foamCheckJobs", "foamPrintJobs"):
-                try:
-                    result = subprocess.run(
-                        [tool],
-                        cwd=case_path,
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                except OSError as exc:
-                    output_lines.append(f"{tool}: failed: {exc}")
-                    continue
-                output_lines.append(f"{tool} (exit {result.returncode})")
-                output_lines.extend((result.stdout or "").splitlines())
+            budget = max(0, height - 2 - stdscr.getyx()[0])
+            output_lines = _poll_job_lines(case_path, budget) if budget else []
 
             for line in output_lines:
                 if stdscr.getyx()[0] >= height - 2:
@@ -530,6 +605,54 @@ def job_status_poll_screen(stdscr: Any, case_path: Path) -> None:
         stdscr.timeout(-1)
 
 
+def _poll_job_lines(case_path: Path, limit: int) -> list[str]:
+    """
+    Run the job helpers in one bash process and return a status line per
+    tool followed by its output, at most `limit` lines in total. The shell
+    is stopped once the budget is filled.
+    """
+    script = "; ".join(f'{tool}; echo "{_JOB_POLL_MARK}$?"' for tool in _JOB_POLL_TOOLS)
+    try:
+        proc = subprocess.Popen(
+            ["bash", "--noprofile", "--norc", "-c", script],
+            cwd=case_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            env=_shell_env(),
+        )
+    except OSError as exc:
+        return [f"job status: failed: {exc}"]
+
+    lines: list[str] = []
+    pending: list[str] = []
+    done = 0
+    with proc:
+        assert proc.stdout is not None
+        for raw_line in proc.stdout:
+            line = raw_line.rstrip("\n")
+            output, mark, code = line.partition(_JOB_POLL_MARK)
+            if output:
+                pending.append(output)
+            if mark and done < len(_JOB_POLL_TOOLS):
+                tool = _JOB_POLL_TOOLS[done]
+                if code == "127":
+                    lines.append(f"{tool}: failed: command not found")
+                else:
+                    lines.append(f"{tool} (exit {code})")
+                lines.extend(pending)
+                pending = []
+                done += 1
+            if len(lines) + 1 + len(pending) > limit:
+                # Keep what fits (one row goes to the status line) and stop.
+                if done < len(_JOB_POLL_TOOLS):
+                    lines.append(f"{_JOB_POLL_TOOLS[done]} (output truncated)")
+                    lines.extend(pending)
+                proc.terminate()
+                break
+    return lines[:limit]
+
+
 def run_shell_script_screen(stdscr: Any, case_path: Path) -> None:
     """
     Discover and run *.sh scripts in the case directory.
@@ -537,7 +660,9 @@ def run_shell_script_screen(stdscr: Any, case_path: Path) -> None:
     Scripts are executed with the case directory as the current working
     directory, and their output is captured and shown in a viewer.
     """
-    scripts = sorted(p for p in case_path.glob("*.sh") if p.is_file())
+    scripts = sorted(
+        Path(entry.path) for entry in _scan_dir(case_path) if _is_shell_script(entry)
+    )
     if not scripts:
         _show_message(stdscr, "No *.sh scripts found in case directory.")
         return
@@ -561,23 +686,33 @@ def run_shell_script_screen(stdscr: Any, case_path: Path) -> None:
         _show_message(stdscr, f"Failed to run {path.name}: {exc}")
         return
 
-    status = "OK" if result.returncode == 0 else "ERROR"
-    lines = [
-        f"$ cd {case_path}",
-        f"$ sh {path.name}",
-        "",
-        f"status: {status} (exit code {result.returncode})",
-        "",
-        "stdout:",
-        result.stdout or "(empty)",
-        "",
-        "stderr:",
-        result.stderr or "(empty)",
-    ]
-    viewer = Viewer(stdscr, "\n".join(lines))
+    viewer = Viewer(
+        stdscr,
+        _command_output_text(
+            case_path,
+            f"sh {path.name}",
+            result.returncode,
+            result.stdout,
+            result.stderr,
+        ),
+    )
     viewer.display()
 
 
+def _scan_dir(path: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _is_shell_script(entry: os.DirEntry[str]) -> bool:
+    # Same matches as glob("*.sh"): no hidden files; is_file() uses d_type.
+    name = entry.name
+    return name.endswith(".sh") and not name.startswith(".") and entry.is_file()
+
+
 def rerun_last_tool(stdscr: Any, case_path: Path) -> None:
     if _LAST_TOOL_RUN is None:
         _show_message(stdscr, "No previous tool run recorded.")
@@ -594,27 +729,21 @@ def foam_dictionary_prompt(stdscr: Any, case_path: Path) -> None:
     """
     Prompt for a dictionary file and optional arguments to pass to foamDictionary.
     """
-    curses.echo()
-    stdscr.clear()
-    stdscr.addstr("Relative path to dictionary (default system/controlDict): ")
-    stdscr.refresh()
-    path_input = stdscr.getstr().decode().strip()
+    path_input = _prompt_line(stdscr, "Relative path to dictionary (default system/controlDict): ")
     if not path_input:
         path_input = "system/controlDict"
 
     dictionary_path = (case_path / path_input).resolve()
     if not dictionary_path.is_file():
-        curses.noecho()
         _show_message(stdscr, f"{dictionary_path} not found.")
         return
 
-    stdscr.addstr("foamDictionary args (e.g. -entry application): ")
-    stdscr.refresh()
-    args_line = stdscr.getstr().decode().strip()
-    curses.noecho()
+    args_line = _prompt_line(
+        stdscr, "foamDictionary args (e.g. -entry application): ", clear=False
+    )
 
     try:
-        args = shlex.split(args_line) if args_line else []
+        args = list(_split_args(args_line))
     except ValueError as exc:
         _show_message(stdscr, f"Invalid arguments: {exc}")
         return
@@ -632,20 +761,16 @@ def foam_dictionary_prompt(stdscr: Any, case_path: Path) -> None:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run foamDictionary: {exc}"))
         return
 
-    status = "OK" if result.returncode == 0 else "ERROR"
-    lines = [
-        f"$ cd {case_path}",
-        f"$ {' '.join(cmd)}",
-        "",
-        f"status: {status} (exit code {result.returncode})",
-        "",
-        "stdout:",
-        result.stdout or "(empty)",
-        "",
-        "stderr:",
-        result.stderr or "(empty)",
-    ]
-    viewer = Viewer(stdscr, "\n".join(lines))
+    viewer = Viewer(
+        stdscr,
+        _command_output_text(
+            case_path,
+            " ".join(cmd),
+            result.returncode,
+            result.stdout,
+            result.stderr,
+        ),
+    )
     viewer.display()
 
 
@@ -662,17 +787,14 @@ def post_process_prompt(stdscr: Any, case_path: Path) -> None:
         ["postProcess", "-list"],
     ):
         return
-    curses.echo()
-    stdscr.clear()
-    stdscr.addstr("postProcess args (e.g. -latestTime -funcs '(mag(U))'):\n")
-    stdscr.addstr(f"Tip: latest time detected = {latest}\n")
-    stdscr.addstr("> ")
-    stdscr.refresh()
-    args_line = stdscr.getstr().decode().strip()
-    curses.noecho()
+    args_line = _prompt_line(
+        stdscr,
+        "postProcess args (e.g. -latestTime -funcs '(mag(U))'):\n"
+        f"Tip: latest time detected = {latest}\n> ",
+    )
 
     try:
-        args = shlex.split(args_line) if args_line else ["-latestTime"]
+        args = list(_split_args(args_line)) if args_line else ["-latestTime"]
     except ValueError as exc:
         _show_message(stdscr, f"Invalid arguments: {exc}")
         return
@@ -694,21 +816,18 @@ def foam_calc_prompt(stdscr: Any, case_path: Path) -> None:
         ["foamCalc", "-help"],
     ):
         return
-    curses.echo()
-    stdscr.clear()
-    stdscr.addstr("foamCalc args (e.g. components U -latestTime):\n")
-    stdscr.addstr(f"Tip: latest time detected = {latest}\n")
-    stdscr.addstr("> ")
-    stdscr.refresh()
-    args_line = stdscr.getstr().decode().strip()
-    curses.noecho()
+    args_line = _prompt_line(
+        stdscr,
+        "foamCalc args (e.g. components U -latestTime):\n"
+        f"Tip: latest time detected = {latest}\n> ",
+    )
 
     if not args_line:
         _show_message(stdscr, "No arguments provided for foamCalc.")
         return
 
     try:
-        args = shlex.split(args_line)
+        args = list(_split_args(args_line))
     except ValueError as exc:
         _show_message(stdscr, f"Invalid arguments: {exc}")
         return
@@ -729,16 +848,10 @@ def topo_set_prompt(stdscr: Any, case_path: Path) -> None:
         ["topoSetDict"],
     ):
         return
-    curses.echo()
-    stdscr.clear()
-    stdscr.addstr("topoSet args (press Enter to run with defaults):\n")
-    stdscr.addstr("> ")
-    stdscr.refresh()
-    args_line = stdscr.getstr().decode().strip()
-    curses.noecho()
+    args_line = _prompt_line(stdscr, "topoSet args (press Enter to run with defaults):\n> ")
 
     try:
-        args = shlex.split(args_line) if args_line else []
+        args = list(_split_args(args_line))
     except ValueError as exc:
         _show_message(stdscr, f"Invalid arguments: {exc}")
         return
@@ -766,15 +879,14 @@ def run_current_solver(stdscr: Any, case_path: Path) -> None:
     runApplication (RunFunctions).
     """
     control_dict = case_path / "system" / "controlDict"
-    if not control_dict.is_file():
-        _show_message(stdscr, "system/controlDict not found in case directory.")
-        return
-
     try:
-        value = read_entry(control_dict, "application")
+        value = _read_application(control_dict)
     except OpenFOAMError as exc:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to read application: {exc}"))
         return
+    if value is None:
+        _show_message(stdscr, "system/controlDict not found in case directory.")
+        return
 
     solver_line = value.strip()
     if not solver_line:
@@ -788,27 +900,47 @@ def run_current_solver(stdscr: Any, case_path: Path) -> None:
 
     wm_dir = _require_wm_project_dir(stdscr)
     if wm_dir and get_config().use_runfunctions:
-        shell_cmd = f'. "{wm_dir}/bin/tools/RunFunctions"; runApplication {shlex.quote(solver)}'
+        shell_cmd = _RUN_APPLICATION_CMD.format(wm_dir=wm_dir, args=shlex.quote(solver))
         _run_shell_tool(stdscr, case_path, f"runApplication {solver}", shell_cmd)
         return
 
     _run_simple_tool(stdscr, case_path, solver, [solver])
 
 
+def _read_application(control_dict: Path) -> Optional[str]:
+    """
+    Return the raw `application` entry, or None when controlDict is missing.
+
+    The entry is reused until the file's mtime or size changes.
+    """
+    stamp = file_stamp(control_dict)
+    if stamp is None:
+        return None
+    cached = _APPLICATION_CACHE.get(control_dict)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = read_entry(control_dict, "application")
+    _APPLICATION_CACHE[control_dict] = (stamp, value)
+    return value
+
+
 def remove_all_logs(stdscr: Any, case_path: Path) -> None:
     """
     Remove log.* files using CleanFunctions helpers.
     """
     wm_dir = _require_wm_project_dir(stdscr)
     if wm_dir and get_config().use_cleanfunctions:
-        shell_cmd = f'. "{wm_dir}/bin/tools/CleanFunctions"; cleanApplicationLogs'
+        shell_cmd = _CLEAN_FUNCTION_CMD.format(wm_dir=wm_dir, function="cleanApplicationLogs")
         _run_shell_tool(stdscr, case_path, "cleanApplicationLogs", shell_cmd)
         return
 
     removed = 0
-    for path in case_path.glob("log.*"):
+    log_paths = [
+        entry.path for entry in _scan_dir(case_path) if entry.name.startswith("log.")
+    ]
+    for path in log_paths:
         try:
-            path.unlink()
+            os.unlink(path)
             removed += 1
         except OSError:
             continue
@@ -821,14 +953,13 @@ def clean_time_directories(stdscr: Any, case_path: Path) -> None:
     """
     wm_dir = _require_wm_project_dir(stdscr)
     if wm_dir and get_config().use_cleanfunctions:
-        shell_cmd = f'. "{wm_dir}/bin/tools/CleanFunctions"; cleanTimeDirectories'
+        shell_cmd = _CLEAN_FUNCTION_CMD.format(wm_dir=wm_dir, function="cleanTimeDirectories")
         _run_shell_tool(stdscr, case_path, "cleanTimeDirectories", shell_cmd)
         return
 
     removed = 0
-    for entry in case_path.iterdir():
-        if not entry.is_dir():
-            continue
+    time_dirs = [entry for entry in _scan_dir(case_path) if entry.is_dir()]
+    for entry in time_dirs:
         try:
             value = float(entry.name)
         except ValueError:
@@ -836,10 +967,7 @@ def clean_time_directories(stdscr: Any, case_path: Path) -> None:
         if value < 0:
             continue
         try:
-            for child in entry.rglob("*"):
-                if child.is_file():
-                    child.unlink()
-            entry.rmdir()
+            shutil.rmtree(entry.path)
             removed += 1
         except OSError:
             continue
@@ -852,7 +980,7 @@ def clean_case(stdscr: Any, case_path: Path) -> None:
     """
     wm_dir = _require_wm_project_dir(stdscr)
     if wm_dir and get_config().use_cleanfunctions:
-        shell_cmd = f'. "{wm_dir}/bin/tools/CleanFunctions"; cleanCase'
+        shell_cmd = _CLEAN_FUNCTION_CMD.format(wm_dir=wm_dir, function="cleanCase")
         _run_shell_tool(stdscr, case_path, "cleanCase", shell_cmd)
         return
 
@@ -861,16 +989,39 @@ def clean_case(stdscr: Any, case_path: Path) -> None:
 
 
 def _expand_command(cmd: list[str], case_path: Path) -> list[str]:
+    # Only look up the latest time (possibly running foamListTimes) when a
+    # part actually uses the placeholder.
+    if not any(_LATEST_TIME_TOKEN in part for part in cmd):
+        return list(cmd)
     latest = _latest_time(case_path)
-    return [part.replace("{{latestTime}}", latest) for part in cmd]
+    return [part.replace(_LATEST_TIME_TOKEN, latest) for part in cmd]
 
 
 def _expand_shell_command(shell_cmd: str, case_path: Path) -> str:
-    latest = _latest_time(case_path)
-    return shell_cmd.replace("{{latestTime}}", latest)
+    if _LATEST_TIME_TOKEN not in shell_cmd:
+        return shell_cmd
+    return shell_cmd.replace(_LATEST_TIME_TOKEN, _latest_time(case_path))
 
 
 def _latest_time(case_path: Path) -> str:
+    """
+    Latest time directory name, reused until the case directory's mtime
+    changes (time directories being added or removed).
+    """
+    try:
+        stamp: Optional[int] = case_path.stat().st_mtime_ns
+    except OSError:
+        stamp = None
+    cached = _LATEST_TIME_CACHE.get(case_path)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return cached[1]
+    latest = _find_latest_time(case_path)
+    if stamp is not None:
+        _LATEST_TIME_CACHE[case_path] = (stamp, latest)
+    return latest
+
+
+def _find_latest_time(case_path: Path) -> str:
     try:
         result = subprocess.run(
             ["foamListTimes", "-latestTime"],
@@ -887,7 +1038,9 @@ def _latest_time(case_path: Path) -> str:
             return value
     latest_value = 0.0
     found = False
-    for entry in case_path.iterdir():
+    # An unreadable case yields no entries and so falls back to "0".
+    for entry in _scan_dir(case_path):
+        # DirEntry.is_dir() reuses the d_type from readdir.
         if not entry.is_dir():
             continue
         try:
@@ -913,7 +1066,7 @@ def tool_dicts_screen(stdscr: Any, case_path: Path) -> None:
         return
 
     name, path, helper_cmd = items[choice]
-    if not _ensure_tool_dict(stdscr, case_path, name, path, helper_cmd):
+    if not path.is_file() and not _ensure_tool_dict(stdscr, case_path, name, path, helper_cmd):
         return
     _open_dict_preview(stdscr, path)
 
@@ -929,9 +1082,11 @@ def _ensure_tool_dict(
         return True
 
     stdscr.clear()
-    stdscr.addstr(f"{path.relative_to(case_path)} is missing.\n")
-    stdscr.addstr("Provide a dictionary to continue.\n")
-    stdscr.addstr("Generate template now? (y/N): ")
+    stdscr.addstr(
+        f"{path.relative_to(case_path)} is missing.\n"
+        "Provide a dictionary to continue.\n"
+        "Generate template now? (y/N): "
+    )
     stdscr.refresh()
     ch = stdscr.getch()
     if ch not in (ord("y"), ord("Y")):
@@ -954,47 +1109,65 @@ def _generate_tool_dict_with_helper(
             helper_cmd,
             cwd=case_path,
             capture_output=True,
-            text=True,
             check=False,
         )
     except OSError:
         return False
-    output = (result.stdout or "").strip()
-    if result.returncode == 0 and output and "FoamFile" in output:
+    # The generated dictionary is copied through as bytes, never decoded.
+    output = result.stdout.strip()
+    if result.returncode == 0 and output and b"FoamFile" in output:
         try:
-            path.write_text(output + "\n")
+            _write_file_atomic(path, (output, b"\n"))
         except OSError:
             return False
         return True
     return False
 
 
+def _write_file_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+    """
+    Replace `path` with the concatenated `chunks` via a sibling temp file
+    and os.replace, so readers never see a partly written file.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def _write_stub_dict(path: Path, tool_name: str) -> None:
-    template = [
-        "/*--------------------------------*- C++ -*----------------------------------*\\",
-        f"| OpenFOAM {tool_name} dictionary (stub)                           |",
-        "\\*---------------------------------------------------------------------------*/",
-        "FoamFile",
-        "{",
-        "    version     2.0;",
-        "    format      ascii;",
-        "    class       dictionary;",
-        f"    object      {path.name};",
-        "}",
-        "",
-        "// TODO: fill in tool configuration.",
-        "",
-    ]
-    path.write_text("\n".join(template))
+    text = _STUB_DICT_TEMPLATE.format(tool_name=tool_name, object_name=path.name)
+    _write_file_atomic(path, (text.encode(),))
 
 
 def _open_dict_preview(stdscr: Any, path: Path) -> None:
     try:
-        content = path.read_text()
+        with path.open("rb") as handle:
+            data = handle.read(_DICT_PREVIEW_BYTES + 1)
     except OSError as exc:
         _show_message(stdscr, f"Failed to read {path.name}: {exc}")
         return
-    viewer = Viewer(stdscr, content)
+
+    header_lines: list[str] = []
+    if len(data) > _DICT_PREVIEW_BYTES:
+        # Cut at a line end so no partial line or split character is shown.
+        data = data[:_DICT_PREVIEW_BYTES]
+        data = data[: data.rfind(b"\n") + 1] or data
+        header_lines = [f"Preview shows the first {len(data)} bytes of {path.name}.", ""]
+    viewer = Viewer(stdscr, data.decode("utf-8", errors="replace"), header_lines)
     viewer.display()
 
 
@@ -1002,54 +1175,34 @@ def foam_job_prompt(stdscr: Any, case_path: Path) -> None:
     """
     Prompt for foamJob arguments and run it.
     """
-    curses.echo()
-    stdscr.clear()
-    stdscr.addstr("foamJob arguments (e.g. simpleFoam -case .): ")
-    stdscr.refresh()
-    arg_line = stdscr.getstr().decode().strip()
-    curses.noecho()
+    arg_line = _prompt_line(stdscr, "foamJob arguments (e.g. simpleFoam -case .): ")
 
     if not arg_line:
         return
 
     try:
-        args = shlex.split(arg_line)
+        args = list(_split_args(arg_line))
     except ValueError as exc:
         _show_message(stdscr, f"Invalid arguments: {exc}")
         return
 
     try:
-        result = subprocess.run(
-            ["foamJob", *args],
-            cwd=case_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        returncode, stdout, stderr = _run_streaming(["foamJob", *args], case_path)
     except OSError as exc:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run foamJob: {exc}"))
         return
 
-    status = "OK" if result.returncode == 0 else "ERROR"
-    lines = [
-        f"$ cd {case_path}",
-        f"$ foamJob {' '.join(args)}",
-        "",
-        f"status: {status} (exit code {result.returncode})",
-        "",
-    ]
-    hint = _maybe_job_hint("foamJob")
-    if hint:
-        lines.append(hint)
-        lines.append("")
-    lines += [
-        "stdout:",
-        result.stdout or "(empty)",
-        "",
-        "stderr:",
-        result.stderr or "(empty)",
-    ]
-    viewer = Viewer(stdscr, "\n".join(lines))
+    viewer = Viewer(
+        stdscr,
+        _command_output_text(
+            case_path,
+            f"foamJob {' '.join(args)}",
+            returncode,
+            stdout,
+            stderr,
+            _maybe_job_hint("foamJob"),
+        ),
+    )
     viewer.display()
 
 
@@ -1057,54 +1210,34 @@ def foam_end_job_prompt(stdscr: Any, case_path: Path) -> None:
     """
     Prompt for foamEndJob arguments and run it.
     """
-    curses.echo()
-    stdscr.clear()
-    stdscr.addstr("foamEndJob arguments (e.g. simpleFoam): ")
-    stdscr.refresh()
-    arg_line = stdscr.getstr().decode().strip()
-    curses.noecho()
+    arg_line = _prompt_line(stdscr, "foamEndJob arguments (e.g. simpleFoam): ")
 
     if not arg_line:
         return
 
     try:
-        args = shlex.split(arg_line)
+        args = list(_split_args(arg_line))
     except ValueError as exc:
         _show_message(stdscr, f"Invalid arguments: {exc}")
         return
 
     try:
-        result = subprocess.run(
-            ["foamEndJob", *args],
-            cwd=case_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        returncode, stdout, stderr = _run_streaming(["foamEndJob", *args], case_path)
     except OSError as exc:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run foamEndJob: {exc}"))
         return
 
-    status = "OK" if result.returncode == 0 else "ERROR"
-    lines = [
-        f"$ cd {case_path}",
-        f"$ foamEndJob {' '.join(args)}",
-        "",
-        f"status: {status} (exit code {result.returncode})",
-        "",
-    ]
-    hint = _maybe_job_hint("foamEndJob")
-    if hint:
-        lines.append(hint)
-        lines.append("")
-    lines += [
-        "stdout:",
-        result.stdout or "(empty)",
-        "",
-        "stderr:",
-        result.stderr or "(empty)",
-    ]
-    viewer = Viewer(stdscr, "\n".join(lines))
+    viewer = Viewer(
+        stdscr,
+        _command_output_text(
+            case_path,
+            f"foamEndJob {' '.join(args)}",
+            returncode,
+            stdout,
+            stderr,
+            _maybe_job_hint("foamEndJob"),
+        ),
+    )
     viewer.display()
 
 
@@ -1112,115 +1245,222 @@ def diagnostics_screen(stdscr: Any, case_path: Path) -> None:
     """
     System and case diagnostics based on common OpenFOAM tools.
     """
-    tools = [
-        ("foamSystemCheck", ["foamSystemCheck"]),
-        ("foamInstallationTest", ["foamInstallationTest"]),
-        ("checkMesh", ["checkMesh"]),
-    ]
-    labels = [name for name, _ in tools] + ["View logs"]
-    menu = Menu(stdscr, "Diagnostics", labels + ["Back"])
+    menu = Menu(stdscr, "Diagnostics", _DIAG_MENU_LABELS)
     choice = menu.navigate()
-    if choice == -1 or choice == len(labels):
+    if choice == -1 or choice == len(_DIAG_MENU_LABELS) - 1:
         return
 
-    if choice == len(tools):
+    if choice == len(_DIAG_TOOLS):
         logs_screen(stdscr, case_path)
         return
 
-    name, cmd = tools[choice]
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=case_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except OSError as exc:
-        _show_message(stdscr, _with_no_foam_hint(f"Failed to run {name}: {exc}"))
-        return
+    name, cmd = _DIAG_TOOLS[choice]
+    # The full output is spilled to temp files for the log and the summary;
+    # only the bounded tails are kept in memory for display.
+    with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+        try:
+            returncode, stdout, stderr = _run_streaming(
+                list(cmd), case_path, stdout_sink=stdout_file, stderr_sink=stderr_file
+            )
+        except OSError as exc:
+            _show_message(stdscr, _with_no_foam_hint(f"Failed to run {name}: {exc}"))
+            return
 
-    _write_tool_log(case_path, name, result.stdout, result.stderr)
+        log_path = _write_tool_log(case_path, name, stdout_file, stderr_file)
+        if name == "checkMesh":
+            stdout_file.seek(0)
+            summary = _summarize_checkmesh(
+                line.decode("utf-8", "replace") for line in stdout_file
+            )
 
     if name == "checkMesh":
-        _show_checkmesh_summary(stdscr, result.stdout, result.stderr)
+        _show_checkmesh_summary(stdscr, summary, log_path)
         return
 
-    status = "OK" if result.returncode == 0 else "ERROR"
-    lines = [
-        f"$ cd {case_path}",
-        f"$ {' '.join(cmd)}",
-        "",
-        f"status: {status} (exit code {result.returncode})",
-        "",
-        "stdout:",
-        result.stdout or "(empty)",
-        "",
-        "stderr:",
-        result.stderr or "(empty)",
-    ]
-    viewer = Viewer(stdscr, "\n".join(lines))
+    viewer = Viewer(
+        stdscr,
+        _command_output_text(
+            case_path,
+            " ".join(cmd),
+            returncode,
+            stdout,
+            stderr,
+        ),
+    )
     viewer.display()
 
 
-def _write_tool_log(case_path: Path, name: str, stdout: str, stderr: str) -> None:
-    if not stdout and not stderr:
-        return
-    log_path = case_path / f"log.{name}"
-    content = "\n".join(
-        [
-            f"tool: {name}",
-            "",
-            "stdout:",
-            stdout or "(empty)",
-            "",
-            "stderr:",
-            stderr or "(empty)",
-            "",
-        ]
+def _run_streaming(
+    cmd: list[str],
+    cwd: Path,
+    limit: int = _STREAM_LINE_LIMIT,
+    stdout_sink: Optional[BinaryIO] = None,
+    stderr_sink: Optional[BinaryIO] = None,
+) -> tuple[int, str, str]:
+    """
+    Run `cmd` and return (returncode, stdout, stderr), keeping only the last
+    `limit` lines of each stream while the output is read. Lines are read as
+    bytes and each kept tail is decoded once. Every line is also written to
+    the matching sink, when given, so callers can keep the full output.
+    """
+    proc = subprocess.Popen(
+        [_resolve_tool(cmd[0]), *cmd[1:]],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
+    with proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        stderr_reader = _StreamTail(proc.stderr, limit, stderr_sink)
+        stderr_reader.start()
+        stdout = _StreamTail(proc.stdout, limit, stdout_sink)
+        stdout.run()
+        stderr_reader.join()
+        returncode = proc.wait()
+    return returncode, stdout.text(), stderr_reader.text()
+
+
+def _resolve_tool(name: str) -> str:
+    """
+    Absolute path of `name` on the current PATH, so the child skips the
+    lookup; `name` itself when it is a path or cannot be found.
+    """
+    if os.sep in name:
+        return name
+    key = (name, os.environ.get("PATH", os.defpath))
     try:
-        log_path.write_text(content)
+        resolved = _TOOL_PATH_CACHE[key]
+    except KeyError:
+        resolved = _TOOL_PATH_CACHE[key] = shutil.which(name, path=key[1])
+    return resolved or name
+
+
+class _StreamTail(threading.Thread):
+    def __init__(self, stream: Any, limit: int, sink: Optional[BinaryIO] = None) -> None:
+        super().__init__(daemon=True)
+        self._stream = stream
+        self._sink = sink
+        self._lines: deque[bytes] = deque(maxlen=limit)
+        self._dropped = 0
+
+    def run(self) -> None:
+        lines = self._lines
+        limit = lines.maxlen
+        sink = self._sink
+        for line in self._stream:
+            if sink is not None:
+                sink.write(line)
+            if len(lines) == limit:
+                self._dropped += 1
+            lines.append(line)
+
+    def text(self) -> str:
+        body = b"".join(self._lines).decode("utf-8", "replace")
+        if self._dropped:
+            return f"... ({self._dropped} earlier lines omitted)\n{body}"
+        return body
+
+
+def _write_tool_log(
+    case_path: Path, name: str, stdout: BinaryIO, stderr: BinaryIO
+) -> Optional[Path]:
+    """
+    Save a tool's full output, given as seekable binary files, as
+    log.<name>; return the log path when it holds this output, or None
+    when there was nothing to write or writing failed.
+    """
+    if not _stream_size(stdout) and not _stream_size(stderr):
+        return None
+    log_path = case_path / f"log.{name}"
+    hasher = hashlib.blake2b(digest_size=16)
+    for chunk in _tool_log_chunks(name, stdout, stderr):
+        hasher.update(chunk)
+    digest = hasher.digest()
+    # Skip rewriting identical output unless the file was touched since.
+    cached = _LOG_DIGESTS.get(log_path)
+    if cached is not None and cached[0] == digest and cached[1] == file_stamp(log_path):
+        return log_path
+    try:
+        _write_file_atomic(log_path, _tool_log_chunks(name, stdout, stderr))
     except OSError:
-        pass
+        _LOG_DIGESTS.pop(log_path, None)
+        return None
+    stamp = file_stamp(log_path)
+    if stamp is None:
+        _LOG_DIGESTS.pop(log_path, None)
+    else:
+        _LOG_DIGESTS[log_path] = (digest, stamp)
+    return log_path
+
+
+def _stream_size(stream: BinaryIO) -> int:
+    return stream.seek(0, os.SEEK_END)
+
+
+def _tool_log_chunks(name: str, stdout: BinaryIO, stderr: BinaryIO) -> Iterator[bytes]:
+    yield f"tool: {name}\n\nstdout:\n".encode()
+    yield from _stream_chunks(stdout)
+    yield b"\n\nstderr:\n"
+    yield from _stream_chunks(stderr)
+    yield b"\n"
 
 
-def _show_checkmesh_summary(stdscr: Any, stdout: str, stderr: str) -> None:
-    output = stdout or ""
-    summary = _format_checkmesh_summary(output)
+def _stream_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    stream.seek(0)
+    chunk = stream.read(_LOG_COPY_BYTES)
+    if not chunk:
+        yield b"(empty)"
+        return
+    while chunk:
+        yield chunk
+        chunk = stream.read(_LOG_COPY_BYTES)
+
+
+def _show_checkmesh_summary(stdscr: Any, summary: str, log_path: Optional[Path]) -> None:
+    """
+    Show the checkMesh summary; the raw output is read back from the log
+    only when asked for, so it is not held in memory meanwhile.
+    """
     stdscr.clear()
-    stdscr.addstr(summary + "\n")
-    stdscr.addstr("Press r for raw output, any other key to return.\n")
+    stdscr.addstr(f"{summary}\nPress r for raw output, any other key to return.\n")
     stdscr.refresh()
     ch = stdscr.getch()
-    if ch in (ord("r"), ord("R")):
-        lines = [
-            "checkMesh raw output",
-            "",
-            "stdout:",
-            stdout or "(empty)",
-            "",
-            "stderr:",
-            stderr or "(empty)",
-        ]
-        Viewer(stdscr, "\n".join(lines)).display()
+    if ch not in (ord("r"), ord("R")):
+        return
+    if log_path is None:
+        _show_message(stdscr, "No checkMesh output was logged.")
+        return
+    try:
+        raw = log_path.read_text(errors="replace")
+    except OSError as exc:
+        _show_message(stdscr, f"Failed to read {log_path.name}: {exc}")
+        return
+    Viewer(stdscr, f"checkMesh raw output\n\n{raw}").display()
 
 
 def _format_checkmesh_summary(output: str) -> str:
-    cells = _match_first(
-        output,
-        [
-            r"(?i)number of cells\\s*:\\s*(\\d+)",
-            r"(?i)cells\\s*:\\s*(\\d+)",
-        ],
-    )
-    non_ortho = _match_first(
-        output,
-        [r"(?i)max\\s+non-orthogonality\\s*=\\s*([0-9eE.+-]+)"],
-    )
-    skew = _match_first(output, [r"(?i)max\\s+skewness\\s*=\\s*([0-9eE.+-]+)"])
-    failed = _match_first(output, [r"(?i)failed\\s+(\\d+)\\s+mesh checks"])
-    mesh_ok = "mesh ok" in output.lower()
+    return _summarize_checkmesh(output.splitlines())
+
+
+def _summarize_checkmesh(lines: Iterable[str]) -> str:
+    cells = cells_any = non_ortho = skew = failed = None
+    mesh_ok = False
+    for line in lines:
+        lower = line.lower()
+        if "mesh ok" in lower:
+            mesh_ok = True
+        elif "number of cells" in lower:
+            cells = cells or _checkmesh_value(line, ":", _CHECKMESH_INT_RE)
+        elif lower.lstrip().startswith("cells"):
+            cells_any = cells_any or _checkmesh_value(line, ":", _CHECKMESH_INT_RE)
+        elif "max non-orthogonality" in lower:
+            non_ortho = non_ortho or _checkmesh_value(line, "=", _CHECKMESH_FLOAT_RE)
+        elif "max skewness" in lower:
+            skew = skew or _checkmesh_value(line, "=", _CHECKMESH_FLOAT_RE)
+        elif "mesh checks" in lower and failed is None:
+            match = _CHECKMESH_FAILED_RE.search(lower)
+            failed = match.group(1) if match else None
+    cells = cells or cells_any
 
     errors = "0" if mesh_ok and not failed else failed or "1"
     status = "OK" if mesh_ok and errors == "0" else "FAIL"
@@ -1235,31 +1475,73 @@ def _format_checkmesh_summary(output: str) -> str:
     return _ascii_kv_table("checkMesh summary", rows)
 
 
-def _match_first(text: str, patterns: list[str]) -> Optional[str]:
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(1)
-    return None
+def _checkmesh_value(line: str, sep: str, pattern: re.Pattern[str]) -> Optional[str]:
+    """
+    Leading match of `pattern` in the first token after `sep`, if any.
+    """
+    tail = line.partition(sep)[2].split(None, 1)
+    if not tail:
+        return None
+    match = pattern.match(tail[0])
+    return match.group(0) if match else None
 
 
 def _ascii_kv_table(title: str, rows: list[tuple[str, str]]) -> str:
     if not rows:
         return title
-    left_width = max(len(label) for label, _value in rows)
-    right_width = max(len(value) for _label, value in rows)
+    left_width = right_width = 0
+    for label, value in rows:
+        if len(label) > left_width:
+            left_width = len(label)
+        if len(value) > right_width:
+            right_width = len(value)
     header_width = max(len(title), left_width + right_width + 3)
     left_width = max(left_width, header_width - right_width - 3)
 
-    top = "+" + "-" * (left_width + 2) + "+" + "-" * (right_width + 2) + "+"
-    lines = [top]
-    lines.append(
-        f"| {title.ljust(left_width + right_width + 1)} |".ljust(
-            left_width + right_width + 5
-        )
-    )
-    lines.append(top)
-    for label, value in rows:
-        lines.append(f"| {label.ljust(left_width)} | {value.ljust(right_width)} |")
+    top = f"+{'-' * (left_width + 2)}+{'-' * (right_width + 2)}+"
+    lines = [top, f"| {title.ljust(left_width + right_width + 3)} |", top]
+    lines += [
+        f"| {label.ljust(left_width)} | {value.ljust(right_width)} |" for label, value in rows
+    ]
     lines.append(top)
-    return "\\n".join(lines)
+    return "\n".join(lines)
+
+
+# Normalized command name -> screen for tools that are not simple presets.
+# These take precedence over presets with the same name.
+_SPECIAL_HANDLERS: dict[str, Callable[[Any, Path], None]] = {
+    "rerun": rerun_last_tool,
+    "last": rerun_last_tool,
+    "foamjob": foam_job_prompt,
+    "foamendjob": foam_end_job_prompt,
+    "jobstatus": job_status_poll_screen,
+    "job_status": job_status_poll_screen,
+    "runscript": run_shell_script_screen,
+    "foamdictionary": foam_dictionary_prompt,
+    "postprocess": post_process_prompt,
+    "foamcalc": foam_calc_prompt,
+    "toposet": topo_set_prompt,
+    "tool_dicts": tool_dicts_screen,
+    "tooldicts": tool_dicts_screen,
+    "runcurrentsolver": run_current_solver,
+    "removelogs": remove_all_logs,
+    "cleantimedirs": clean_time_directories,
+    "cleancase": clean_case,
+}
+
+# tools_screen entries after the simple tools, in _SPECIAL_LABELS order.
+_SPECIAL_ACTIONS: tuple[Callable[[Any, Path], None], ...] = (
+    job_status_poll_screen,
+    foam_job_prompt,
+    foam_end_job_prompt,
+    run_shell_script_screen,
+    foam_dictionary_prompt,
+    post_process_prompt,
+    foam_calc_prompt,
+    topo_set_prompt,
+    tool_dicts_screen,
+    run_current_solver,
+    remove_all_logs,
+    clean_time_directories,
+    clean_case,
+)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import subprocess
+from collections import deque
 from pathlib import Path
 
 import of_tui.app as app
 from of_tui import browser
 from of_tui.editor import autoformat_value
+from of_tui.openfoam import EntryBundle
 
 
 def test_color_from_name_defaults() -> None:
@@ -33,3 +36,340 @@ def test_next_significant_line_skips_block(tmp_path: Path) -> None:
     content = "\n".join(["simpleCoeffs", "{", "value 1;", "}"])
     warnings = app._find_suspicious_lines(content)
     assert not warnings
+
+
+def test_prompt_command_drains_pasted_burst() -> None:
+    class FakeScreen:
+        def __init__(self, keys):
+            self._keys = deque(keys)
+            self.blocking = True
+            self.refreshes = 0
+
+        def getmaxyx(self):
+            return (10, 80)
+
+        def nodelay(self, flag):
+            self.blocking = not flag
+
+        def getch(self):
+            return self._keys.popleft() if self._keys else -1
+
+        def move(self, *_args):
+            pass
+
+        def clrtoeol(self):
+            pass
+
+        def addstr(self, *_args):
+            pass
+
+        def refresh(self):
+            self.refreshes += 1
+
+    screen = FakeScreen([ord(ch) for ch in "check"] + [10])
+    assert app._prompt_command(screen, []) == "check"
+    assert screen.refreshes == 2
+    assert screen.blocking
+
+
+def test_parse_mesh_stats_from_checkmesh_log() -> None:
+    assert app._parse_cells_count("Number of cells: 12345") == "12345"
+    assert app._parse_cells_count("    cells:            42") == "42"
+    assert app._parse_max_skewness("Max skewness = 0.85 OK.") == "0.85"
+
+
+def test_detect_openfoam_version_is_cached(monkeypatch) -> None:
+    app._detect_openfoam_version.cache_clear()
+    monkeypatch.setenv("WM_PROJECT_VERSION", "v2312")
+    assert app._detect_openfoam_version() == "v2312"
+    monkeypatch.setenv("WM_PROJECT_VERSION", "v2406")
+    assert app._detect_openfoam_version() == "v2312"
+    app._detect_openfoam_version.cache_clear()
+
+
+def test_case_metadata_reuses_results_until_files_change(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    case_dir = tmp_path / "case"
+    control = case_dir / "system" / "controlDict"
+    control.parent.mkdir(parents=True)
+    control.write_text("application simpleFoam;")
+    reads: list[str] = []
+
+    def fake_read_entry(_path: Path, key: str) -> str:
+        reads.append(key)
+        return "simpleFoam;"
+
+    monkeypatch.setattr(app, "read_entry", fake_read_entry)
+    monkeypatch.setattr(app, "_detect_openfoam_version", lambda: "v2312")
+
+    assert app._case_metadata(case_dir)["solver"] == "simpleFoam"
+    assert app._case_metadata(case_dir)["solver"] == "simpleFoam"
+    assert reads == ["application"]
+
+    stat = control.stat()
+    os.utime(control, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    app._case_metadata(case_dir)
+    assert reads == ["application", "application"]
+
+
+def test_run_fzf_streams_lines_to_picker(tmp_path: Path, monkeypatch) -> None:
+    fake_fzf = tmp_path / "fzf"
+    fake_fzf.write_text("#!/bin/sh\nhead -n 1\n")
+    fake_fzf.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:/usr/bin:/bin")
+
+    procs: list[subprocess.Popen] = []
+    real_popen = subprocess.Popen
+
+    def tracking_popen(*args, **kwargs):
+        proc = real_popen(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(app.subprocess, "Popen", tracking_popen)
+
+    lines = [f"system/controlDict\tkey{i}\n" for i in range(50000)]
+    assert app._run_fzf(lines) == "system/controlDict\tkey0\n"
+    assert procs[0].stdin.closed
+
+
+def test_global_search_indexes_files_in_case_order(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    (case_dir / "system").mkdir(parents=True)
+    for name in ("controlDict", "fvSchemes"):
+        (case_dir / "system" / name).write_text("FoamFile {}")
+    captured: list[list[str]] = []
+
+    class FakeScreen:
+        def clear(self):
+            pass
+
+        def refresh(self):
+            pass
+
+    monkeypatch.setattr(app, "list_keywords", lambda path: [f"{path.name}Key"])
+    monkeypatch.setattr(app, "status_message", lambda *_args: None)
+    monkeypatch.setattr(app.curses, "def_prog_mode", lambda: None)
+    monkeypatch.setattr(app.curses, "endwin", lambda: None)
+    monkeypatch.setattr(app.curses, "reset_prog_mode", lambda: None)
+    monkeypatch.setattr(app, "_run_fzf", lambda lines: captured.append(lines))
+    monkeypatch.setattr(app, "fzf_enabled", lambda: True)
+    state = app.AppState()
+
+    app._global_search_screen(FakeScreen(), case_dir.resolve(), state)
+    assert captured == [
+        ["system/controlDict\tcontrolDictKey\n", "system/fvSchemes\tfvSchemesKey\n"]
+    ]
+
+
+def test_search_entries_uses_cached_haystacks(tmp_path: Path, monkeypatch) -> None:
+    from of_tui import entry_meta
+
+    calls: list[str] = []
+
+    def fake_get_entry_bundle(_file_path: Path, key: str) -> EntryBundle:
+        calls.append(key)
+        return EntryBundle("Gauss Linear" if key == "div" else "1")
+
+    monkeypatch.setattr(entry_meta, "get_entry_bundle", fake_get_entry_bundle)
+    monkeypatch.setattr(entry_meta, "get_entry_info", lambda *_args: [])
+    monkeypatch.setattr(entry_meta, "get_entry_enum_values", lambda *_args: [])
+
+    cache: entry_meta.EntryCache = {}
+    keywords = ["a", "div", "b"]
+    assert browser._search_entries(tmp_path, tmp_path, cache, keywords, 0, "(") is None
+    reads = len(calls)
+    assert browser._search_entries(tmp_path, tmp_path, cache, keywords, 0, "linear") == 1
+    assert browser._search_entries(tmp_path, tmp_path, cache, keywords, 2, "GAUSS") == 1
+    assert len(calls) == reads
+
+
+def test_draw_entry_browser_writes_clipped_rows() -> None:
+    import curses
+
+    class FakeScreen:
+        def __init__(self) -> None:
+            self.writes: list[tuple[int, str]] = []
+
+        def getmaxyx(self):
+            return (8, 40)
+
+        def derwin(self, *_args):
+            raise curses.error("no subwindows")
+
+        def clear(self) -> None:
+            pass
+
+        def erase(self) -> None:
+            pass
+
+        def addnstr(self, row: int, _col: int, text: str, width: int) -> None:
+            self.writes.append((row, text[:width]))
+
+        def addstr(self, row: int, _col: int, text: str) -> None:
+            self.writes.append((row, text))
+
+        def attron(self, _attr: int) -> None:
+            pass
+
+        def attroff(self, _attr: int) -> None:
+            pass
+
+        def noutrefresh(self) -> None:
+            pass
+
+        def refresh(self) -> None:
+            pass
+
+    screen = FakeScreen()
+    browser._draw_entry_browser(
+        screen,
+        "cavity",
+        "system/controlDict",
+        None,
+        ["application", "startTime"],
+        1,
+        0,
+        "startTime",
+        "0",
+        "integer",
+        [],
+        [],
+        [],
+        "",
+    )
+
+    assert (5, ">> startTime") in screen.writes
+    assert (4, "Current value:") in screen.writes
+    assert (5, "0") in screen.writes
+    assert (0, "system/controlDict") in screen.writes
+    assert all(row < 7 for row, text in screen.writes if not text.startswith("case: "))
+
+
+def test_external_editor_reads_renamed_file_and_cleans_up(tmp_path: Path, monkeypatch) -> None:
+    import curses
+
+    class FakeScreen:
+        def clear(self) -> None:
+            pass
+
+        def refresh(self) -> None:
+            pass
+
+    seen: list[Path] = []
+
+    def fake_run(cmd, check=False):
+        path = Path(cmd[1])
+        seen.append(path)
+        assert path.read_text() == "1;"
+        replacement = tmp_path / "swap"
+        replacement.write_text("2;")
+        replacement.replace(path)
+
+    monkeypatch.setattr(curses, "endwin", lambda: None)
+    monkeypatch.setattr(browser.subprocess, "run", fake_run)
+    callbacks = browser.BrowserCallbacks(
+        show_message=lambda *_args: None,
+        view_file=lambda *_args: None,
+        prompt_command=lambda *_args: "",
+        command_suggestions=lambda _path: (),
+        handle_command=lambda *_args: None,
+        mode_status=lambda _state: "",
+    )
+
+    assert browser._open_in_external_editor(FakeScreen(), "1;", callbacks) == "2;"
+    assert not seen[0].exists()
+
+
+def test_latest_checkmesh_log_picks_newest(tmp_path: Path) -> None:
+    import os
+
+    assert app._latest_checkmesh_log(tmp_path / "missing") is None
+    older = tmp_path / "log.checkMesh"
+    newer = tmp_path / "log.checkMesh.2"
+    older.write_text("old")
+    newer.write_text("new")
+    (tmp_path / "log.blockMesh").write_text("other")
+    os.utime(older, (1, 1))
+    os.utime(newer, (2, 2))
+    assert app._latest_checkmesh_log(tmp_path) == newer
+
+
+def test_browser_windows_reused_until_resize() -> None:
+    class FakeScreen:
+        def __init__(self) -> None:
+            self.created = 0
+
+        def derwin(self, *_args):
+            self.created += 1
+            return object()
+
+    screen = FakeScreen()
+    windows: dict = {}
+    first = browser._browser_windows(screen, windows, 24, 80, 40)
+    assert browser._browser_windows(screen, windows, 24, 80, 40) == first
+    assert screen.created == 2
+    browser._browser_windows(screen, windows, 30, 100, 50)
+    assert screen.created == 4
+
+
+def test_entry_metadata_cache_hit_keeps_enum_validator(tmp_path: Path, monkeypatch) -> None:
+    from of_tui import entry_meta
+
+    monkeypatch.setattr(entry_meta, "get_entry_bundle", lambda *_args: EntryBundle("simpleFoam"))
+    monkeypatch.setattr(entry_meta, "get_entry_info", lambda *_args: [])
+    monkeypatch.setattr(
+        entry_meta, "get_entry_enum_values", lambda *_args: ["simpleFoam", "pisoFoam"]
+    )
+
+    cache: entry_meta.EntryCache = {}
+    first = entry_meta.get_entry_metadata(cache, tmp_path, tmp_path, "application")
+    second = entry_meta.get_entry_metadata(cache, tmp_path, tmp_path, "application")
+    assert second[1] == "enum"
+    assert second[5] is first[5]
+    assert second[5]("icoFoam") is not None
+
+
+def test_boundary_condition_info_reads_patch_once(tmp_path: Path, monkeypatch) -> None:
+    from of_tui import entry_meta
+
+    field = tmp_path / "U"
+    field.write_text("dummy")
+    calls: list[str] = []
+
+    def fake_read_entry(_file_path: Path, key: str) -> str:
+        calls.append(key)
+        return (
+            "inlet\n{\n    type            fixedValue;\n"
+            "    coeffs { value 1; }\n    value           uniform (1 0 0);\n}"
+        )
+
+    monkeypatch.setattr(entry_meta, "read_entry", fake_read_entry)
+    info = entry_meta.boundary_condition_info(field, "boundaryField.inlet.type")
+    assert info == ["BC inlet type: fixedValue;", "BC inlet value: uniform (1 0 0);"]
+    entry_meta.boundary_condition_info(field, "boundaryField.inlet.value")
+    assert calls == ["boundaryField.inlet"]
+
+    entry_meta._invalidate_patch_bc(field, "boundaryField.inlet.value")
+    entry_meta.boundary_condition_info(field, "boundaryField.inlet.value")
+    assert len(calls) == 2
+
+
+def test_boundary_condition_info_skips_strings_comments_and_directives(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from of_tui import entry_meta
+
+    field = tmp_path / "U"
+    field.write_text("dummy")
+
+    def fake_read_entry(_file_path: Path, _key: str) -> str:
+        return (
+            'outlet\n{\n    // old; type slip;\n    #include "bc"\n    type fixedValue;\n'
+            '    note "a; b { c";\n    value uniform 0;\n}'
+        )
+
+    monkeypatch.setattr(entry_meta, "read_entry", fake_read_entry)
+    info = entry_meta.boundary_condition_info(field, "boundaryField.outlet.type")
+    assert info == ["BC outlet type: fixedValue;", "BC outlet value: uniform 0;"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import of_tui.app as app
@@ -17,6 +18,44 @@ def test_command_suggestions_include_tools(monkeypatch) -> None:
     assert "blockMesh" in suggestions
 
 
+def test_command_suggestions_follow_preset_edits(tmp_path: Path) -> None:
+    presets = tmp_path / "of_tui.tools"
+    presets.write_text("custom: echo ok\n")
+    assert "tool custom" in commands.command_suggestions(tmp_path)
+    assert "tool added" not in commands.command_suggestions(tmp_path)
+
+    presets.write_text("custom: echo ok\nadded: echo new tool\n")
+
+    suggestions = commands.command_suggestions(tmp_path)
+    assert "tool added" in suggestions
+    assert "run added" in suggestions
+
+
+def test_handle_command_resolves_aliases(monkeypatch) -> None:
+    calls: list[str] = []
+    callbacks = commands.CommandCallbacks(
+        check_syntax=lambda *_args: calls.append("check"),
+        tools_screen=lambda *_args: calls.append("tools"),
+        diagnostics_screen=lambda *_args: calls.append("diag"),
+        run_current_solver=lambda *_args: calls.append("run"),
+        show_message=lambda _screen, text: calls.append(text),
+    )
+    monkeypatch.setattr(commands, "run_tool_by_name", lambda *_args: False)
+    state = app.AppState(no_foam=True)
+
+    assert commands.handle_command(None, Path("."), state, ":q", callbacks) == "quit"
+    for command in ("syntax", "tool", "diagnostics", "solver", "tool foo", "bogus"):
+        assert commands.handle_command(None, Path("."), state, command, callbacks) == "handled"
+    assert calls == [
+        "check",
+        "tools",
+        "diag",
+        "run",
+        "Unknown tool: foo",
+        "Unknown command: bogus",
+    ]
+
+
 def test_mode_status_includes_env(monkeypatch) -> None:
     state = app.AppState(no_foam=True)
     monkeypatch.setenv("WM_PROJECT_DIR", "/WM")
@@ -27,11 +66,9 @@ def test_mode_status_includes_env(monkeypatch) -> None:
 
 def test_check_status_line_when_running(monkeypatch) -> None:
     state = app.AppState(no_foam=False)
-    with state.check_lock:
-        state.check_in_progress = True
-        state.check_done = 2
-        state.check_total = 5
-        state.check_current = Path("system/controlDict")
+    state.check_snapshot = app.CheckSnapshot(
+        in_progress=True, done=2, total=5, current=Path("system/controlDict")
+    )
     line = state.check_status_line()
     assert "check:" in line
     assert "controlDict" in line
@@ -59,13 +96,9 @@ def test_check_labels_with_results(tmp_path: Path) -> None:
 
 
 def test_menu_scroll_bounds(monkeypatch) -> None:
-    class FakeScreen:
-        def getmaxyx(self):
-            return (10, 80)
-
-    screen = FakeScreen()
-    assert app._menu_scroll(0, 0, screen, 100, header_rows=3) == 0
-    assert app._menu_scroll(50, 0, screen, 100, header_rows=3) > 0
+    visible = 6
+    assert app._menu_scroll(0, 0, visible, 100) == 0
+    assert app._menu_scroll(50, 0, visible, 100) > 0
 
 
 def test_start_check_thread_updates_state(tmp_path: Path, monkeypatch) -> None:
@@ -75,16 +108,105 @@ def test_start_check_thread_updates_state(tmp_path: Path, monkeypatch) -> None:
     path.write_text("application simpleFoam;")
     state = app.AppState()
 
-    def fake_verify(_case, progress=None):
+    def fake_verify(_case, progress=None, result_callback=None, sections=None):
         if progress:
             progress(path)
-        return {path: FileCheckResult(checked=True)}
+        result = FileCheckResult(checked=True)
+        if result_callback:
+            result_callback(path, result)
+        return {path: result}
 
     monkeypatch.setattr(app, "verify_case", fake_verify)
-    monkeypatch.setattr(app, "discover_case_files", lambda _case: {"system": [path]})
+    monkeypatch.setattr(app, "discover_case_files", lambda _case, stat_cache=None: {"system": [path]})
 
     app._start_check_thread(case_dir, state)
     assert state.check_thread is not None
     state.check_thread.join(timeout=1.0)
     assert state.check_results is not None
-    assert state.check_in_progress is False
+    assert state.check_snapshot.in_progress is False
+    assert state.check_snapshot.done == 1
+    assert state.check_results_version > 0
+
+
+def test_get_sections_reuses_scan_until_layout_changes(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    (case_dir / "system").mkdir(parents=True)
+    (case_dir / "system" / "controlDict").write_text("application simpleFoam;")
+    calls: list[Path] = []
+    real_discover = app.discover_case_files
+
+    def counting_discover(case: Path, stat_cache=None):
+        calls.append(case)
+        return real_discover(case, stat_cache=stat_cache)
+
+    monkeypatch.setattr(app, "discover_case_files", counting_discover)
+    state = app.AppState()
+
+    first = state.get_sections(case_dir)
+    assert state.get_sections(case_dir) is first
+    assert len(calls) == 1
+
+    state.invalidate_sections()
+    state.get_sections(case_dir)
+    assert len(calls) == 2
+
+    orig_dir = case_dir / "0.orig"
+    orig_dir.mkdir()
+    state.get_sections(case_dir)
+    assert len(calls) == 3
+    stat = orig_dir.stat()
+    (orig_dir / "U").write_text("dimensions [0 1 -1 0 0 0 0];")
+    os.utime(orig_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    sections = state.get_sections(case_dir)
+    assert len(calls) == 4
+    assert sections["0*"] == [(orig_dir / "U").resolve()]
+
+
+def test_app_state_reuses_callbacks() -> None:
+    state = app.AppState()
+    assert state.command_callbacks() is state.command_callbacks()
+    browser = state.browser_callbacks()
+    assert browser is state.browser_callbacks()
+    assert browser.handle_command.keywords["callbacks"] is state.command_callbacks()
+
+
+def test_file_labels_are_case_relative(tmp_path: Path) -> None:
+    case_dir = (tmp_path / "case").resolve()
+    (case_dir / "system").mkdir(parents=True)
+    path = case_dir / "system" / "controlDict"
+    path.write_text("application simpleFoam;")
+    state = app.AppState()
+    labels = state.file_labels(case_dir)
+    assert labels == {path: "system/controlDict"}
+    assert state.file_labels(case_dir) is labels
+
+
+def test_draw_check_menu_paints_rows_in_one_block() -> None:
+    class FakeScreen:
+        def __init__(self):
+            self.writes: list[tuple[int, str]] = []
+            self.bold_rows: list[int] = []
+
+        def getmaxyx(self):
+            return (10, 40)
+
+        def erase(self):
+            pass
+
+        def addstr(self, row, _col, text):
+            self.writes.append((row, text))
+
+        def chgat(self, row, _col, _width, _attr):
+            self.bold_rows.append(row)
+
+        def attron(self, _attr):
+            pass
+
+        def attroff(self, _attr):
+            pass
+
+    screen = FakeScreen()
+    checks = [FileCheckResult(checked=True), None]
+    app._draw_check_menu(screen, ["a: OK", "b: Not checked"], checks, 1, 0, "status")
+    assert (3, "   a: OK\n>> b: Not checked") in screen.writes
+    assert screen.bold_rows == [3]
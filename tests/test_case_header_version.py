@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import of_tui.app as app_module
 from of_tui.app import _detect_case_header_version
 
 
@@ -45,3 +46,54 @@ def test_detect_case_header_returns_unknown_when_missing(tmp_path: Path) -> None
     )
     case = _write_control_dict(tmp_path, text)
     assert _detect_case_header_version(case) == "unknown"
+
+
+def test_detect_case_header_reads_only_file_head(tmp_path: Path) -> None:
+    text = "// no header\n" + "x\n" * 4096 + "| Version:  v9999 |\n"
+    case = _write_control_dict(tmp_path, text)
+    assert _detect_case_header_version(case) == "unknown"
+
+
+def _foamfile(version: str) -> str:
+    return f"FoamFile\n{{\n    version     {version};\n}}\n"
+
+
+def test_detect_case_header_counts_later_majority(tmp_path: Path) -> None:
+    case = _write_control_dict(tmp_path, _foamfile("2.0"))
+    for name in ("a", "b"):
+        (case / "system" / name).write_text(_foamfile("2.0"))
+    zero = case / "0"
+    zero.mkdir()
+    for name in ("T", "U", "k", "p"):
+        (zero / name).write_text(_foamfile("3.0"))
+    assert _detect_case_header_version(case) == "3.0"
+
+
+def test_detect_case_header_stops_once_result_is_decided(
+    tmp_path: Path, monkeypatch
+) -> None:
+    case = _write_control_dict(tmp_path, _foamfile("2.0"))
+    for name in ("a", "b", "c", "d", "e"):
+        (case / "system" / name).write_text(_foamfile("2.0"))
+    zero = case / "0"
+    zero.mkdir()
+    for name in ("T", "U"):
+        (zero / name).write_text(_foamfile("3.0"))
+    read: list[str] = []
+    original = app_module._extract_header_version
+
+    def tracking(path, stat_cache=None):
+        read.append(path.name)
+        return original(path, stat_cache)
+
+    monkeypatch.setattr(app_module, "_extract_header_version", tracking)
+    assert _detect_case_header_version(case) == "2.0"
+    assert read == ["controlDict", "a", "b", "c"]
+
+
+def test_detect_case_header_skips_large_files(tmp_path: Path) -> None:
+    case = _write_control_dict(tmp_path, "FoamFile\n{\n}\n")
+    zero = case / "0"
+    zero.mkdir()
+    (zero / "U").write_text(_foamfile("9.0") + "x" * (64 * 1024))
+    assert _detect_case_header_version(case) == "unknown"
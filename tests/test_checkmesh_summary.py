@@ -31,3 +31,49 @@ def test_checkmesh_summary_table_has_borders() -> None:
     assert lines[0].startswith("+")
     assert lines[0].endswith("+")
     assert any("| Cells" in line for line in lines)
+
+
+def test_checkmesh_summary_reports_failed_checks() -> None:
+    output = "\n".join(
+        [
+            "    Number of cells: 8",
+            "    Max skewness = 4.5",
+            "Failed 2 mesh checks.",
+        ]
+    )
+    summary = _format_checkmesh_summary(output)
+    assert "| Errors" in summary
+    assert "2" in summary
+    assert "FAIL" in summary
+    assert "8" in summary
+
+
+def test_checkmesh_summary_prefers_number_of_cells_line() -> None:
+    output = "    cells:            3\nNumber of cells: 777\nMesh OK."
+    summary = _format_checkmesh_summary(output)
+    assert "777" in summary
+    assert "| 3 " not in summary
+
+
+def test_checkmesh_summary_takes_value_token_only() -> None:
+    output = "\n".join(
+        [
+            "    cells:            4200",
+            "    Max skewness = 0.52 OK.",
+            "",
+            "Mesh OK.",
+        ]
+    )
+    summary = _format_checkmesh_summary(output)
+    assert "4200" in summary
+    assert "| 0.52 " in summary
+    assert "OK." not in summary
+
+
+def test_checkmesh_summary_rows_share_border_width() -> None:
+    summary = _format_checkmesh_summary("Number of cells: 10\nMax skewness = 1.0\nMesh OK.")
+    lines = summary.splitlines()
+    assert len(lines) == 9
+    assert "\\n" not in summary
+    assert len({len(line) for line in lines}) == 1
+    assert lines[1].startswith("| checkMesh summary")
@@ -28,3 +28,30 @@ def test_choose_validator_uses_int_for_scalar_integer() -> None:
     validator, label = choose_validator("startFrom", value)
     assert validator is as_int
     assert label == "integer"
+
+
+def test_choose_validator_memoizes_key_value_pairs() -> None:
+    choose_validator.cache_clear()
+    first = choose_validator("deltaT", "0.001;")
+    assert choose_validator("deltaT", "0.001;") is first
+    assert choose_validator.cache_info().hits == 1
+
+
+def test_choose_validator_skips_vector_parse_for_non_numeric_parentheses(monkeypatch) -> None:
+    import of_tui.entry_meta as entry_meta
+
+    calls: list[str] = []
+
+    def fake_vector_values(value: str):
+        calls.append(value)
+        return None
+
+    monkeypatch.setattr(entry_meta, "vector_values", fake_vector_values)
+    entry_meta.choose_validator.cache_clear()
+    try:
+        entry_meta.choose_validator("laplacian", "laplacian(nu,U) Gauss linear corrected;")
+        assert calls == []
+        entry_meta.choose_validator("U", "uniform (0 0 -9.81);")
+        assert calls == ["uniform (0 0 -9.81);"]
+    finally:
+        entry_meta.choose_validator.cache_clear()
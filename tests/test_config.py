@@ -25,6 +25,13 @@ def test_key_in_handles_basic_keys() -> None:
     assert config.key_in(ord("x"), ["k"]) is False
 
 
+def test_key_codes_match_key_in() -> None:
+    labels = ["k", "\n", "", "ab"]
+    codes = config.key_codes(labels)
+    assert codes == frozenset({ord("k"), 10, 13})
+    assert all(config.key_in(code, labels) for code in codes)
+
+
 def test_fzf_enabled_respects_env(tmp_path: Path, monkeypatch) -> None:
     cfg = tmp_path / "cfg.toml"
     cfg.write_text('fzf = "off"\n')
@@ -68,3 +75,61 @@ def test_load_config_from_file_and_env(tmp_path: Path, monkeypatch) -> None:
     assert cfg_obj.colors["focus_fg"] == "red"
     assert cfg_obj.colors["focus_bg"] == "blue"
     assert cfg_obj.keys["up"] == ["w"]
+    assert cfg_obj.keys_up == frozenset({ord("w")})
+    assert cfg_obj.keys_select == frozenset({ord("l"), 10, 13})
+
+
+def test_editor_read_from_env_once(monkeypatch) -> None:
+    monkeypatch.setenv("EDITOR", "nano")
+    _reset_config()
+    assert config.get_config().editor == "nano"
+
+    monkeypatch.delenv("EDITOR")
+    assert config.get_config().editor == "nano"
+    _reset_config()
+    assert config.get_config().editor == "vi"
+
+
+def test_config_file_edits_apply_on_reload(tmp_path: Path, monkeypatch) -> None:
+    cfg = tmp_path / "cfg.toml"
+    cfg.write_text('fzf = "off"\n')
+    monkeypatch.setenv("OF_TUI_CONFIG", str(cfg))
+    monkeypatch.delenv("OF_TUI_FZF", raising=False)
+
+    _reset_config()
+    assert config.get_config().fzf == "off"
+
+    cfg.write_text('fzf = "on"\n')
+    _reset_config()
+    assert config.get_config().fzf == "on"
+
+
+def test_fzf_lookup_cached(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(config.shutil, "which", lambda name: calls.append(name) or "/bin/fzf")
+    monkeypatch.delenv("OF_TUI_FZF", raising=False)
+    monkeypatch.setenv("OF_TUI_CONFIG", "/nonexistent/of_tui.toml")
+    _reset_config()
+    config._which_fzf.cache_clear()
+    try:
+        assert config.fzf_enabled() is True
+        assert config.fzf_enabled() is True
+        assert calls == ["fzf"]
+    finally:
+        config._which_fzf.cache_clear()
+
+
+def test_config_uses_slots() -> None:
+    cfg_obj = config.Config()
+    assert not hasattr(cfg_obj, "__dict__")
+    assert cfg_obj.keys_up == frozenset({ord("k")})
+
+
+def test_env_flags_accept_common_truthy_spellings(monkeypatch) -> None:
+    monkeypatch.setenv("OF_TUI_CONFIG", "/nonexistent/of_tui.toml")
+    monkeypatch.setenv("OF_TUI_USE_RUNFUNCTIONS", " Yes ")
+    monkeypatch.setenv("OF_TUI_USE_CLEANFUNCTIONS", "off")
+    _reset_config()
+    cfg_obj = config.get_config()
+    assert cfg_obj.use_runfunctions is True
+    assert cfg_obj.use_cleanfunctions is False
@@ -1,10 +1,12 @@
+from collections import deque
+
 from of_tui.editor import Entry, EntryEditor
 
 
 class FakeScreen:
     def __init__(self, keys):
         # sequence of key codes to return from getch()
-        self._keys = list(keys)
+        self._keys = deque(keys)
         self.lines = []
         self.height = 24
         self.width = 80
@@ -32,7 +34,7 @@ class FakeScreen:
 
     def getch(self):
         if self._keys:
-            return self._keys.pop(0)
+            return self._keys.popleft()
         # Default to 'q' if keys exhausted to avoid infinite loops.
         return ord("q")
 
@@ -1,11 +1,14 @@
 """Command line prompt behavior in menus."""
 
-from of_tui.menus import Menu
+import curses
+from collections import deque
+
+from of_tui.menus import Menu, _prompt_command
 
 
 class FakeScreen:
     def __init__(self, keys) -> None:
-        self._keys = list(keys)
+        self._keys = deque(keys)
         self.height = 24
         self.width = 80
         self.lines = []
@@ -13,6 +16,9 @@ class FakeScreen:
     def clear(self) -> None:
         self.lines.clear()
 
+    def erase(self) -> None:
+        self.lines.clear()
+
     def getmaxyx(self):
         return (self.height, self.width)
 
@@ -36,7 +42,7 @@ class FakeScreen:
 
     def getch(self) -> int:
         if self._keys:
-            return self._keys.pop(0)
+            return self._keys.popleft()
         return ord("q")
 
 
@@ -60,3 +66,53 @@ def test_menu_command_prompt_tab_completion_cycles() -> None:
     menu.navigate()
 
     assert captured == ["tools"]
+
+
+def test_prompt_command_edits_at_cursor_and_skips_unchanged_redraws() -> None:
+    keys = [
+        ord("a"),
+        ord("b"),
+        curses.KEY_LEFT,
+        ord("X"),
+        curses.KEY_RIGHT,
+        curses.KEY_RIGHT,
+        ord("c"),
+        127,
+        10,
+    ]
+    screen = FakeScreen(keys=keys)
+
+    assert _prompt_command(screen, None) == "aXb"
+    # The second KEY_RIGHT is a no-op at the end of the line and is not redrawn.
+    assert screen.lines == [":", ":a", ":ab", ":ab", ":aXb", ":aXb", ":aXbc", ":aXb"]
+
+
+def test_fzf_pick_option_returns_first_matching_index(tmp_path, monkeypatch) -> None:
+    from of_tui import menus
+
+    fake_fzf = tmp_path / "fzf"
+    fake_fzf.write_text("#!/bin/sh\nsed -n 2p\n")
+    fake_fzf.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:/usr/bin:/bin")
+    monkeypatch.setattr(menus, "fzf_enabled", lambda: True)
+    for name in ("def_prog_mode", "endwin", "reset_prog_mode"):
+        monkeypatch.setattr(curses, name, lambda: None)
+
+    menu = Menu(FakeScreen(keys=[]), "Title", ["alpha", "beta", "beta"])
+    assert menus._fzf_pick_option(menu.stdscr, menu.options, menu._positions()) == 1
+
+
+def test_completion_matches_keep_suggestion_order() -> None:
+    from of_tui.menus import build_completion_index, completion_matches
+
+    index = build_completion_index(["tools", "check", "tool blockMesh", "tool_dicts", "to"])
+    assert completion_matches(index, "to") == ["tools", "tool blockMesh", "tool_dicts", "to"]
+    assert completion_matches(index, "tool ") == ["tool blockMesh"]
+    assert completion_matches(index, "x") == []
+    assert completion_matches(index, "") == [
+        "tools",
+        "check",
+        "tool blockMesh",
+        "tool_dicts",
+        "to",
+    ]
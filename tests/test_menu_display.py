@@ -10,6 +10,9 @@ class FakeScreen:
     def clear(self) -> None:
         self.lines.clear()
 
+    def erase(self) -> None:
+        self.lines.clear()
+
     def getmaxyx(self):
         return (self.height, self.width)
 
@@ -42,3 +45,58 @@ def test_menu_display_truncates_long_options() -> None:
     # All printed lines should respect the screen width.
     for line in screen.lines:
         assert len(line.rstrip("\n")) <= screen.width
+
+
+def test_menu_display_reuses_rendered_lines_until_resize() -> None:
+    screen = FakeScreen(width=30)
+    menu = Menu(screen, "Title", ["alpha", "beta"], extra_lines=["extra"])
+
+    menu.display()
+    cached = menu._render_cache
+    menu.current_option = 1
+    menu.display()
+    assert menu._render_cache is cached
+    assert "     alpha" in screen.lines
+
+    screen.width = 8
+    menu.display()
+    assert menu._render_cache is not cached
+    assert all(len(line) <= 7 for line in screen.lines)
+
+
+def test_menu_display_skips_unchanged_frames() -> None:
+    screen = FakeScreen(width=30)
+    menu = Menu(screen, "Title", ["alpha", "beta"])
+
+    menu.display()
+    screen.lines.append("sentinel")
+    menu.display()
+    assert screen.lines[-1] == "sentinel"
+
+    menu.current_option = 1
+    menu.display()
+    assert "sentinel" not in screen.lines
+
+    screen.lines.append("sentinel")
+    menu.invalidate()
+    menu.display()
+    assert "sentinel" not in screen.lines
+
+
+def test_menu_display_erases_between_frames_and_clears_after_invalidate() -> None:
+    calls: list[str] = []
+
+    class RecordingScreen(FakeScreen):
+        def clear(self) -> None:
+            calls.append("clear")
+
+        def erase(self) -> None:
+            calls.append("erase")
+
+    menu = Menu(RecordingScreen(width=30), "Title", ["alpha", "beta"])
+    menu.display()
+    menu.current_option = 1
+    menu.display()
+    menu.invalidate()
+    menu.display()
+    assert calls == ["clear", "erase", "clear"]
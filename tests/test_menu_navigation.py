@@ -1,11 +1,13 @@
 """Menu navigation behavior for back/quit keys."""
 
+from collections import deque
+
 from of_tui.menus import Menu, RootMenu
 
 
 class FakeScreen:
     def __init__(self, keys) -> None:
-        self._keys = list(keys)
+        self._keys = deque(keys)
         self.height = 24
         self.width = 80
         self.lines = []
@@ -13,6 +15,9 @@ class FakeScreen:
     def clear(self) -> None:
         self.lines.clear()
 
+    def erase(self) -> None:
+        self.lines.clear()
+
     def getmaxyx(self):
         return (self.height, self.width)
 
@@ -30,7 +35,7 @@ class FakeScreen:
 
     def getch(self) -> int:
         if self._keys:
-            return self._keys.pop(0)
+            return self._keys.popleft()
         return ord("q")
 
 
@@ -44,3 +49,11 @@ def test_root_menu_back_with_h_returns_minus_one() -> None:
     screen = FakeScreen(keys=[ord("h")])
     menu = RootMenu(screen, "Title", ["Only"])
     assert menu.navigate() == -1
+
+
+def test_menu_up_and_down_wrap_around() -> None:
+    screen = FakeScreen(keys=[ord("k"), ord("l")])
+    assert Menu(screen, "Title", ["a", "b", "c"]).navigate() == 2
+
+    screen = FakeScreen(keys=[ord("G"), ord("j"), ord("l")])
+    assert Menu(screen, "Title", ["a", "b", "c"]).navigate() == 0
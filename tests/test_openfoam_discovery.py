@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from of_tui.openfoam import discover_case_files
+from of_tui.openfoam import StatCache, discover_case_files, file_stamp
 
 
 def test_discover_case_files_basic(tmp_path: Path) -> None:
@@ -25,3 +25,27 @@ def test_discover_case_files_basic(tmp_path: Path) -> None:
     assert (constant / "thermophysicalProperties") in result["constant"]
     assert (zero / "p") in result["0*"]
     assert all((later / "T") not in files for files in result.values())
+
+
+def test_stat_cache_remembers_until_invalidated(tmp_path: Path) -> None:
+    path = tmp_path / "controlDict"
+    cache = StatCache()
+    assert not cache.is_file(path)
+
+    path.write_text("application simpleFoam;")
+    assert not cache.is_file(path)
+
+    cache.invalidate(path)
+    assert cache.is_file(path)
+    assert not cache.is_dir(path)
+
+
+def test_file_stamp_tracks_regular_files_only(tmp_path: Path) -> None:
+    path = tmp_path / "controlDict"
+    assert file_stamp(path) is None
+    assert file_stamp(tmp_path) is None
+
+    path.write_text("application simpleFoam;")
+    info = path.stat()
+    assert file_stamp(path) == (info.st_mtime_ns, info.st_size)
+    assert file_stamp(path, StatCache()) == file_stamp(path)
@@ -6,7 +6,9 @@ import pytest
 from of_tui.openfoam import (
     OpenFOAMError,
     ensure_environment,
+    get_entry_bundle,
     get_entry_comments,
+    keyword_index,
     list_keywords,
     list_subkeys,
     missing_required_entries,
@@ -14,6 +16,7 @@ from of_tui.openfoam import (
     parse_required_entries,
     read_entry,
     verify_case,
+    write_entry,
 )
 
 
@@ -35,6 +38,37 @@ def test_list_keywords_parses_output(tmp_path: Path) -> None:
         assert result == ["a", "b"]
 
 
+def test_list_keywords_reuses_result_until_written(tmp_path: Path) -> None:
+    fake_file = tmp_path / "dict"
+    fake_file.write_text("dummy;")
+
+    completed = mock.Mock()
+    completed.returncode = 0
+    completed.stdout = "a\nb\n"
+    with mock.patch("of_tui.openfoam.run_foam_dictionary", return_value=completed) as run:
+        assert list_keywords(fake_file) == ["a", "b"]
+        assert list_keywords(fake_file) == ["a", "b"]
+        assert run.call_count == 1
+
+        write_entry(fake_file, "a", "1")
+        list_keywords(fake_file)
+        assert run.call_count == 3
+
+
+def test_keyword_index_prefers_first_occurrence(tmp_path: Path) -> None:
+    fake_file = tmp_path / "dict"
+    fake_file.write_text("dummy;")
+
+    completed = mock.Mock()
+    completed.returncode = 0
+    completed.stdout = "a\nb\na\n"
+    with mock.patch("of_tui.openfoam.run_foam_dictionary", return_value=completed) as run:
+        assert keyword_index(fake_file, "a") == 0
+        assert keyword_index(fake_file, "b") == 1
+        assert keyword_index(fake_file, "missing") is None
+        assert run.call_count == 1
+
+
 def test_list_subkeys_handles_dictionary_entry(tmp_path: Path) -> None:
     fake_file = tmp_path / "dict"
     fake_file.write_text("dummy;")
@@ -59,6 +93,52 @@ def test_list_subkeys_non_dict_returns_empty(tmp_path: Path) -> None:
         assert result == []
 
 
+def test_get_entry_bundle_reads_entry_once(tmp_path: Path) -> None:
+    fake_file = tmp_path / "dict"
+    fake_file.write_text("// solver settings\nPISO\n{\n    nCorrectors 2;\n}\n")
+
+    completed = mock.Mock()
+    completed.returncode = 0
+    completed.stdout = (
+        "PISO\n{\n    nCorrectors     2;\n    div(phi,U)      Gauss linear;\n"
+        "    residualControl\n    {\n        p 1e-3;\n    }\n    refPoint (0 0 0);\n}\n"
+    )
+    with mock.patch("of_tui.openfoam.run_foam_dictionary", return_value=completed) as run:
+        bundle = get_entry_bundle(fake_file, "PISO")
+
+    assert run.call_count == 1
+    assert bundle.subkeys == ["nCorrectors", "div(phi,U)", "residualControl", "refPoint"]
+    assert bundle.comments == ["// solver settings"]
+    assert bundle.value.startswith("PISO")
+
+
+def test_get_entry_bundle_scalar_has_no_subkeys(tmp_path: Path) -> None:
+    fake_file = tmp_path / "dict"
+    fake_file.write_text("dummy;")
+
+    completed = mock.Mock()
+    completed.returncode = 0
+    completed.stdout = "regions ( a { x 1; } );\n"
+    with mock.patch("of_tui.openfoam.run_foam_dictionary", return_value=completed):
+        assert get_entry_bundle(fake_file, "regions").subkeys == []
+
+
+def test_get_entry_bundle_subkeys_skip_strings_and_comments(tmp_path: Path) -> None:
+    fake_file = tmp_path / "dict"
+    fake_file.write_text("dummy;")
+
+    completed = mock.Mock()
+    completed.returncode = 0
+    completed.stdout = (
+        "functions\n{\n    label \"a;b\";\n    // disabled { enabled no; }\n"
+        "    /* old;\n    entry 1; */\n    \"(U|k)\" { type x; }\n    last 1;\n}\n"
+    )
+    with mock.patch("of_tui.openfoam.run_foam_dictionary", return_value=completed):
+        bundle = get_entry_bundle(fake_file, "functions")
+
+    assert bundle.subkeys == ["label", '"(U|k)"', "last"]
+
+
 def test_get_entry_comments_picks_preceding_comment_block(tmp_path: Path) -> None:
     case_file = tmp_path / "dict"
     case_file.write_text(
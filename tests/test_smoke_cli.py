@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
 
 import of_tui.app as app
@@ -9,7 +10,7 @@ import of_tui.app as app
 
 class FakeScreen:
     def __init__(self, keys=None) -> None:
-        self._keys = list(keys or [])
+        self._keys = deque(keys or [])
         self.height = 24
         self.width = 80
 
@@ -24,7 +25,7 @@ class FakeScreen:
 
     def getch(self) -> int:
         if self._keys:
-            return self._keys.pop(0)
+            return self._keys.popleft()
         return ord("q")
 
     def getmaxyx(self):
@@ -58,3 +58,16 @@ def test_find_suspicious_lines_ignore_block_comments() -> None:
     )
     warnings = _find_suspicious_lines(content)
     assert warnings == []
+
+
+def test_find_suspicious_lines_keeps_line_numbers_after_block_comment() -> None:
+    content = (
+        "FoamFile\n"
+        "{\n"
+        "    /* first\n"
+        "       second */\n"
+        "    startFrom latestTime\n"
+        "}\n"
+    )
+    warnings = _find_suspicious_lines(content)
+    assert warnings == ["Line 5: missing ';'? -> startFrom latestTime"]
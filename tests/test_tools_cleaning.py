@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
 
 import of_tui.tools as tools
@@ -10,7 +11,7 @@ import of_tui.config as config
 
 class FakeScreen:
     def __init__(self, keys=None) -> None:
-        self._keys = list(keys or [])
+        self._keys = deque(keys or [])
         self.lines: list[str] = []
         self.height = 24
         self.width = 80
@@ -26,7 +27,7 @@ class FakeScreen:
 
     def getch(self) -> int:
         if self._keys:
-            return self._keys.pop(0)
+            return self._keys.popleft()
         return ord("q")
 
     def getmaxyx(self):
@@ -42,6 +43,7 @@ def test_remove_all_logs_fallback(tmp_path: Path, monkeypatch) -> None:
     case_dir.mkdir()
     (case_dir / "log.a").write_text("a")
     (case_dir / "log.b").write_text("b")
+    (case_dir / "notes.log").write_text("keep")
 
     monkeypatch.delenv("WM_PROJECT_DIR", raising=False)
     monkeypatch.setenv("OF_TUI_USE_CLEANFUNCTIONS", "0")
@@ -51,6 +53,8 @@ def test_remove_all_logs_fallback(tmp_path: Path, monkeypatch) -> None:
     tools.remove_all_logs(screen, case_dir)
 
     assert not list(case_dir.glob("log.*"))
+    assert (case_dir / "notes.log").exists()
+    assert "Removed 2 log files.\nPress any key to continue.\n" in screen.lines
 
 
 def test_clean_time_directories_fallback(tmp_path: Path, monkeypatch) -> None:
@@ -60,6 +64,8 @@ def test_clean_time_directories_fallback(tmp_path: Path, monkeypatch) -> None:
     (case_dir / "1.5").mkdir()
     (case_dir / "ignore").mkdir()
     (case_dir / "1.5" / "data.txt").write_text("x")
+    (case_dir / "1.5" / "uniform").mkdir()
+    (case_dir / "1.5" / "uniform" / "time").write_text("t")
 
     monkeypatch.delenv("WM_PROJECT_DIR", raising=False)
     monkeypatch.setenv("OF_TUI_USE_CLEANFUNCTIONS", "0")
@@ -73,6 +79,21 @@ def test_clean_time_directories_fallback(tmp_path: Path, monkeypatch) -> None:
     assert (case_dir / "ignore").exists()
 
 
+def test_cleanup_fallbacks_tolerate_missing_case(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "gone"
+
+    monkeypatch.delenv("WM_PROJECT_DIR", raising=False)
+    monkeypatch.setenv("OF_TUI_USE_CLEANFUNCTIONS", "0")
+    _reset_config()
+
+    screen = FakeScreen()
+    tools.remove_all_logs(screen, case_dir)
+    assert "Removed 0 log files.\nPress any key to continue.\n" in screen.lines
+
+    tools.clean_time_directories(screen, case_dir)
+    assert "Removed 0 time directories.\nPress any key to continue.\n" in screen.lines
+
+
 def test_run_current_solver_fallback(tmp_path: Path, monkeypatch) -> None:
     case_dir = tmp_path / "case"
     (case_dir / "system").mkdir(parents=True)
@@ -111,3 +132,89 @@ def test_ensure_tool_dict_decline(tmp_path: Path) -> None:
 
     assert ok is False
     assert not target.exists()
+
+
+def test_tool_dicts_screen_reads_existing_dict_without_prompt(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    (case_dir / "system").mkdir(parents=True)
+    (case_dir / "system" / "postProcessDict").write_text("functions {}\n")
+    shown: list[str] = []
+
+    class FakeMenu:
+        def __init__(self, *_args, **_kwargs) -> None:
+            pass
+
+        def navigate(self) -> int:
+            return 0
+
+    class FakeViewer:
+        def __init__(self, _stdscr, content: str, header_lines=None) -> None:
+            shown.append(content)
+
+        def display(self) -> None:
+            pass
+
+    def fail_ensure(*_args, **_kwargs) -> bool:
+        raise AssertionError("existing dict should not be checked again")
+
+    monkeypatch.setattr(tools, "Menu", FakeMenu)
+    monkeypatch.setattr(tools, "Viewer", FakeViewer)
+    monkeypatch.setattr(tools, "_ensure_tool_dict", fail_ensure)
+
+    tools.tool_dicts_screen(FakeScreen(), case_dir)
+
+    assert shown == ["functions {}\n"]
+
+
+def test_open_dict_preview_reads_only_leading_lines(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "blockMeshDict"
+    path.write_text("line one\nline two\nline three\n")
+    shown: list[tuple[str, list[str]]] = []
+
+    class FakeViewer:
+        def __init__(self, _stdscr, content: str, header_lines=None) -> None:
+            shown.append((content, header_lines))
+
+        def display(self) -> None:
+            pass
+
+    monkeypatch.setattr(tools, "Viewer", FakeViewer)
+    monkeypatch.setattr(tools, "_DICT_PREVIEW_BYTES", 14)
+
+    tools._open_dict_preview(FakeScreen(), path)
+    monkeypatch.setattr(tools, "_DICT_PREVIEW_BYTES", 1024)
+    tools._open_dict_preview(FakeScreen(), path)
+
+    assert shown[0] == ("line one\n", ["Preview shows the first 9 bytes of blockMeshDict.", ""])
+    assert shown[1] == ("line one\nline two\nline three\n", [])
+
+
+def test_tool_dicts_screen_truncates_large_existing_dict(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    (case_dir / "system").mkdir(parents=True)
+    (case_dir / "system" / "postProcessDict").write_text("entry 1;\n" * 10)
+    shown: list[tuple[str, list[str]]] = []
+
+    class FakeMenu:
+        def __init__(self, *_args, **_kwargs) -> None:
+            pass
+
+        def navigate(self) -> int:
+            return 0
+
+    class FakeViewer:
+        def __init__(self, _stdscr, content: str, header_lines=None) -> None:
+            shown.append((content, header_lines))
+
+        def display(self) -> None:
+            pass
+
+    monkeypatch.setattr(tools, "Menu", FakeMenu)
+    monkeypatch.setattr(tools, "Viewer", FakeViewer)
+    monkeypatch.setattr(tools, "_DICT_PREVIEW_BYTES", 20)
+
+    tools.tool_dicts_screen(FakeScreen(), case_dir)
+
+    assert shown == [
+        ("entry 1;\nentry 1;\n", ["Preview shows the first 18 bytes of postProcessDict.", ""])
+    ]
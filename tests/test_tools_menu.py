@@ -1,8 +1,12 @@
 """Tool menu behavior and integration points."""
 
+import curses
+import shlex
+from collections import deque
 from pathlib import Path
 from unittest import mock
 
+import of_tui.tools as tools_module
 from of_tui.tools import (
     run_shell_script_screen,
     diagnostics_screen,
@@ -16,8 +20,8 @@ from of_tui.tools import (
 
 class FakeScreen:
     def __init__(self, keys, string_inputs=None) -> None:
-        self._keys = list(keys)
-        self._strings = [s.encode() for s in (string_inputs or [])]
+        self._keys = deque(keys)
+        self._strings = deque(s.encode() for s in (string_inputs or []))
         self.lines: list[str] = []
         self.height = 24
         self.width = 80
@@ -52,13 +56,13 @@ class FakeScreen:
 
     def getch(self) -> int:
         if self._keys:
-            return self._keys.pop(0)
+            return self._keys.popleft()
         # Default to 'q' to avoid infinite loops.
         return ord("q")
 
     def getstr(self):
         if self._strings:
-            return self._strings.pop(0)
+            return self._strings.popleft()
         return b""
 
 
@@ -68,16 +72,23 @@ def test_run_shell_script_screen_runs_script_and_shows_output(tmp_path: Path) ->
     case_dir.mkdir()
     script = case_dir / "hello.sh"
     script.write_text("#!/bin/sh\necho hello-from-script\n")
+    (case_dir / ".hidden.sh").write_text("echo hidden\n")
+    (case_dir / "dir.sh").mkdir()
 
     # Select first script, then 'q' to exit viewer.
     screen = FakeScreen(keys=[ord("\n"), ord("q")])
 
-    run_shell_script_screen(screen, case_dir)
+    completed = mock.Mock(returncode=0, stdout="hello-from-script\n", stderr="")
+    with mock.patch("of_tui.tools.subprocess.run", return_value=completed) as run:
+        run_shell_script_screen(screen, case_dir)
 
+    assert run.call_args.args[0] == ["sh", str(script)]
+    assert run.call_args.kwargs["cwd"] == case_dir
     # Expect the command and output to have been written to the screen.
     joined = "\n".join(screen.lines)
     assert "sh hello.sh" in joined
     assert "hello-from-script" in joined
+    assert "hidden" not in joined
 
 
 def test_run_shell_script_screen_handles_no_scripts(tmp_path: Path) -> None:
@@ -101,22 +112,44 @@ def test_diagnostics_screen_runs_selected_tool(tmp_path: Path) -> None:
     # Select first diagnostics entry, then 'q' to exit viewer.
     screen = FakeScreen(keys=[ord("\n"), ord("q")])
 
-    completed = mock.Mock()
-    completed.returncode = 0
-    completed.stdout = "ok\n"
-    completed.stderr = ""
-
-    with mock.patch("of_tui.tools.subprocess.run", return_value=completed) as run:
+    with mock.patch("of_tui.tools._run_streaming", return_value=(0, "ok\n", "")) as run:
         diagnostics_screen(screen, case_dir)
 
-    # Ensure a diagnostics command was invoked.
-    assert run.called
+    # Ensure the first diagnostics command was invoked.
+    assert run.call_args.args[0] == ["foamSystemCheck"]
     # And that output was sent to the viewer.
     joined = "\n".join(screen.lines)
     assert "stdout:" in joined
     assert "ok" in joined
 
 
+def test_diagnostics_checkmesh_raw_view_reads_log(tmp_path: Path) -> None:
+    """Show the checkMesh summary and load raw output from log.checkMesh."""
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    keys = [curses.KEY_DOWN, curses.KEY_DOWN, ord("\n"), ord("r"), ord("q")]
+    screen = FakeScreen(keys=keys)
+
+    # The tail returned for display lacks the header; the sink has it all.
+    def fake_run(_cmd, _cwd, stdout_sink=None, stderr_sink=None):
+        stdout_sink.write(b"Number of cells: 42\n" + b"...\n" * 10 + b"Mesh OK.\n")
+        return 0, "... (1 earlier lines omitted)\nMesh OK.\n", ""
+
+    show = mock.Mock(wraps=tools_module._show_checkmesh_summary)
+    with mock.patch("of_tui.tools._run_streaming", side_effect=fake_run) as run, mock.patch(
+        "of_tui.tools._show_checkmesh_summary", show
+    ):
+        diagnostics_screen(screen, case_dir)
+
+    assert run.call_args.args[0] == ["checkMesh"]
+    assert "| 42 " in show.call_args.args[1]
+    assert "Number of cells: 42" in (case_dir / "log.checkMesh").read_text()
+    joined = "\n".join(screen.lines)
+    assert "checkMesh raw output" in joined
+    assert "Number of cells: 42" in joined
+    assert "omitted" not in joined
+
+
 def test_run_current_solver_uses_runfunctions(tmp_path: Path, monkeypatch) -> None:
     """Use RunFunctions to launch the solver when available."""
     case_dir = tmp_path / "case"
@@ -219,3 +252,28 @@ def test_load_postprocessing_presets(tmp_path: Path) -> None:
     presets = load_postprocessing_presets(case_dir)
 
     assert presets == [("foamToVTK", ["foamToVTK", "-latestTime"])]
+
+
+def test_load_postprocessing_presets_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    cfg = case_dir / "of_tui.postprocessing"
+    cfg.write_text("sample: postProcess -func sample\n")
+
+    with mock.patch("of_tui.tools.shlex.split", wraps=shlex.split) as split:
+        first = load_postprocessing_presets(case_dir)
+        second = load_postprocessing_presets(case_dir)
+        assert first == second == [("sample", ["postProcess", "-func", "sample"])]
+        assert split.call_count == 1
+
+        cfg.write_text("sample: postProcess -func sample -latestTime\n")
+        assert load_postprocessing_presets(case_dir)[0][1][-1] == "-latestTime"
+        assert split.call_count == 2
+
+
+def test_load_postprocessing_presets_blank_file(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    (case_dir / "of_tui.postprocessing").write_text("\n   \n\t\n")
+
+    assert load_postprocessing_presets(case_dir) == []
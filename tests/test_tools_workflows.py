@@ -1,5 +1,8 @@
 """Tool workflow tests to raise coverage over tool helpers."""
 
+import io
+import os
+from collections import deque
 from pathlib import Path
 from unittest import mock
 
@@ -8,8 +11,8 @@ import of_tui.tools as tools
 
 class FakeScreen:
     def __init__(self, keys=None, string_inputs=None) -> None:
-        self._keys = list(keys or [])
-        self._strings = [s.encode() for s in (string_inputs or [])]
+        self._keys = deque(keys or [])
+        self._strings = deque(s.encode() for s in (string_inputs or []))
         self.lines: list[str] = []
         self.height = 24
         self.width = 80
@@ -46,18 +49,19 @@ class FakeScreen:
 
     def getch(self) -> int:
         if self._keys:
-            return self._keys.pop(0)
+            return self._keys.popleft()
         return ord("q")
 
     def getstr(self):
         if self._strings:
-            return self._strings.pop(0)
+            return self._strings.popleft()
         return b""
 
 
 def test_normalize_tool_name() -> None:
     assert tools._normalize_tool_name("  FoamCalc  ") == "foamcalc"
     assert tools._normalize_tool_name("post:sample") == "post:sample"
+    assert tools._normalize_tool_name("[post] foam ToVTK!") == "postfoamtovtk"
 
 
 def test_list_tool_commands_includes_presets(tmp_path: Path) -> None:
@@ -73,6 +77,29 @@ def test_list_tool_commands_includes_presets(tmp_path: Path) -> None:
     assert "post:posta" in commands
 
 
+def test_list_tool_commands_rebuilds_only_after_preset_change(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    presets = case_dir / "of_tui.tools"
+    presets.write_text("custom: echo ok\n")
+    builds: list[Path] = []
+    original = tools._tool_alias_keys
+
+    def counting_alias_keys(path: Path) -> list[str]:
+        builds.append(path)
+        return original(path)
+
+    monkeypatch.setattr(tools, "_tool_alias_keys", counting_alias_keys)
+
+    first = tools.list_tool_commands(case_dir)
+    assert tools.list_tool_commands(case_dir) == first
+    assert len(builds) == 1
+
+    presets.write_text("custom: echo ok\nother: echo again\n")
+    assert "other" in tools.list_tool_commands(case_dir)
+    assert len(builds) == 2
+
+
 def test_run_tool_by_name_dispatches_simple_tool(tmp_path: Path, monkeypatch) -> None:
     case_dir = tmp_path / "case"
     case_dir.mkdir()
@@ -88,6 +115,22 @@ def test_run_tool_by_name_dispatches_simple_tool(tmp_path: Path, monkeypatch) ->
     assert called and called[0][0] == "blockMesh"
 
 
+def test_run_tool_by_name_dispatches_special_without_loading_presets(
+    tmp_path: Path, monkeypatch
+) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    called: list[Path] = []
+
+    monkeypatch.setitem(
+        tools._SPECIAL_HANDLERS, "foamcalc", lambda _stdscr, case: called.append(case)
+    )
+    monkeypatch.setattr(tools, "_gather_tool_lists", mock.Mock(side_effect=AssertionError))
+
+    assert tools.run_tool_by_name(FakeScreen(), case_dir, " foamCalc ") is True
+    assert called == [case_dir]
+
+
 def test_rerun_last_tool_replays_shell(tmp_path: Path, monkeypatch) -> None:
     case_dir = tmp_path / "case"
     case_dir.mkdir()
@@ -172,15 +215,168 @@ def test_tool_dicts_screen_generates_and_opens(tmp_path: Path, monkeypatch) -> N
 
     completed = mock.Mock()
     completed.returncode = 0
-    completed.stdout = "FoamFile\n{\n}\n"
-    completed.stderr = ""
+    completed.stdout = b"FoamFile\n{\n}\n"
+    completed.stderr = b""
 
     monkeypatch.setattr(tools.subprocess, "run", lambda *args, **kwargs: completed)
 
     tools.tool_dicts_screen(screen, case_dir)
 
     target = case_dir / "system" / "postProcessDict"
-    assert target.is_file()
+    assert target.read_bytes() == b"FoamFile\n{\n}\n"
+
+
+def test_poll_job_lines_runs_both_helpers_in_one_shell(tmp_path: Path, monkeypatch) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "foamCheckJobs").write_text("#!/bin/sh\necho checked\nexit 3\n")
+    (bin_dir / "foamPrintJobs").write_text("#!/bin/sh\nfor i in 1 2 3 4 5; do echo job$i; done\n")
+    for script in bin_dir.iterdir():
+        script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+
+    assert tools._poll_job_lines(tmp_path, 20) == [
+        "foamCheckJobs (exit 3)",
+        "checked",
+        "foamPrintJobs (exit 0)",
+        "job1",
+        "job2",
+        "job3",
+        "job4",
+        "job5",
+    ]
+    assert tools._poll_job_lines(tmp_path, 4) == [
+        "foamCheckJobs (exit 3)",
+        "checked",
+        "foamPrintJobs (output truncated)",
+        "job1",
+    ]
+
+
+def test_run_streaming_keeps_tail_of_each_stream(tmp_path: Path) -> None:
+    script = "for i in 1 2 3 4 5; do echo out$i; echo err$i >&2; done; exit 2"
+
+    code, stdout, stderr = tools._run_streaming(["sh", "-c", script], tmp_path, limit=2)
+
+    assert code == 2
+    assert stdout == "... (3 earlier lines omitted)\nout4\nout5\n"
+    assert stderr == "... (3 earlier lines omitted)\nerr4\nerr5\n"
+    assert tools._run_streaming(["sh", "-c", "echo hi"], tmp_path) == (0, "hi\n", "")
+
+
+def test_command_output_text_layout(tmp_path: Path) -> None:
+    text = tools._command_output_text(tmp_path, "foamJob simpleFoam", 1, "out", "", "hint")
+
+    assert text.split("\n") == [
+        f"$ cd {tmp_path}",
+        "$ foamJob simpleFoam",
+        "",
+        "status: ERROR (exit code 1)",
+        "",
+        "hint",
+        "",
+        "stdout:",
+        "out",
+        "",
+        "stderr:",
+        "(empty)",
+    ]
+    assert "hint" not in tools._command_output_text(tmp_path, "ls", 0, "", "")
+
+
+def test_split_args_matches_shlex_and_caches() -> None:
+    tools._split_args.cache_clear()
+
+    assert tools._split_args("simpleFoam  -case .") == ("simpleFoam", "-case", ".")
+    assert tools._split_args("-funcs '(mag(U))' \"a b\"") == ("-funcs", "(mag(U))", "a b")
+    assert tools._split_args("") == ()
+    tools._split_args("simpleFoam  -case .")
+    assert tools._split_args.cache_info().hits == 1
+
+
+def test_write_tool_log_replaces_file_without_leftovers(tmp_path: Path) -> None:
+    log_path = tmp_path / "log.checkMesh"
+    log_path.write_text("old contents that are longer\n")
+
+    tools._write_tool_log(tmp_path, "checkMesh", io.BytesIO(b"Mesh OK."), io.BytesIO())
+
+    assert log_path.read_text() == "tool: checkMesh\n\nstdout:\nMesh OK.\n\nstderr:\n(empty)\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["log.checkMesh"]
+
+
+def test_write_tool_log_keeps_full_output(tmp_path: Path) -> None:
+    stdout = io.BytesIO(b"".join(b"line %d\n" % i for i in range(20000)))
+
+    log_path = tools._write_tool_log(tmp_path, "checkMesh", stdout, io.BytesIO(b"warn\n"))
+
+    assert log_path == tmp_path / "log.checkMesh"
+    text = log_path.read_text()
+    assert text.startswith("tool: checkMesh\n\nstdout:\nline 0\nline 1\n")
+    assert text.endswith("line 19999\n\n\nstderr:\nwarn\n\n")
+    assert tools._write_tool_log(tmp_path, "empty", io.BytesIO(), io.BytesIO()) is None
+
+
+def test_run_streaming_writes_every_line_to_sinks(tmp_path: Path) -> None:
+    script = "for i in 1 2 3 4 5; do echo out$i; echo err$i >&2; done"
+    stdout_sink, stderr_sink = io.BytesIO(), io.BytesIO()
+
+    _code, stdout, _stderr = tools._run_streaming(
+        ["sh", "-c", script], tmp_path, limit=2, stdout_sink=stdout_sink, stderr_sink=stderr_sink
+    )
+
+    assert stdout.endswith("out4\nout5\n")
+    assert stdout_sink.getvalue() == b"out1\nout2\nout3\nout4\nout5\n"
+    assert stderr_sink.getvalue() == b"err1\nerr2\nerr3\nerr4\nerr5\n"
+
+
+def test_write_tool_log_skips_identical_content(tmp_path: Path, monkeypatch) -> None:
+    log_path = tmp_path / "log.checkMesh"
+    writes = []
+    real_write = tools._write_file_atomic
+    monkeypatch.setattr(
+        tools, "_write_file_atomic", lambda path, data: writes.append(path) or real_write(path, data)
+    )
+
+    tools._write_tool_log(tmp_path, "checkMesh", io.BytesIO(b"Mesh OK."), io.BytesIO())
+    tools._write_tool_log(tmp_path, "checkMesh", io.BytesIO(b"Mesh OK."), io.BytesIO())
+    assert len(writes) == 1
+
+    log_path.unlink()
+    tools._write_tool_log(tmp_path, "checkMesh", io.BytesIO(b"Mesh OK."), io.BytesIO())
+    tools._write_tool_log(tmp_path, "checkMesh", io.BytesIO(b"Failed 1 mesh checks."), io.BytesIO())
+    assert len(writes) == 3
+    assert "Failed 1 mesh checks." in log_path.read_text()
+
+
+def test_resolve_tool_caches_per_path(tmp_path: Path, monkeypatch) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "checkMesh"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setattr(tools, "_TOOL_PATH_CACHE", {})
+
+    assert tools._resolve_tool("checkMesh") == str(tool)
+    tool.unlink()
+    assert tools._resolve_tool("checkMesh") == str(tool)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert tools._resolve_tool("checkMesh") == "checkMesh"
+    assert tools._resolve_tool("./run.sh") == "./run.sh"
+
+
+def test_prompt_line_reads_echoed_input(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(tools.curses, "echo", lambda: calls.append("echo"))
+    monkeypatch.setattr(tools.curses, "noecho", lambda: calls.append("noecho"))
+    screen = FakeScreen(keys=[], string_inputs=["  -entry application  "])
+    screen.lines.append("previous")
+
+    value = tools._prompt_line(screen, "args: ", clear=False)
+
+    assert value == "-entry application"
+    assert screen.lines == ["previous", "args: "]
+    assert calls == ["echo", "noecho"]
 
 
 def test_latest_time_picks_max_directory(tmp_path: Path) -> None:
@@ -192,9 +388,119 @@ def test_latest_time_picks_max_directory(tmp_path: Path) -> None:
     assert tools._latest_time(case_dir) == "2"
 
 
+def test_latest_time_reuses_result_until_case_dir_changes(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    (case_dir / "1").mkdir()
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        raise OSError("foamListTimes missing")
+
+    monkeypatch.setattr(tools.subprocess, "run", fake_run)
+
+    assert tools._latest_time(case_dir) == "1"
+    assert tools._latest_time(case_dir) == "1"
+    assert len(calls) == 1
+
+    (case_dir / "3").mkdir()
+    assert tools._latest_time(case_dir) == "3"
+    assert len(calls) == 2
+
+
+def test_latest_time_falls_back_when_case_is_unreadable(tmp_path: Path) -> None:
+    assert tools._find_latest_time(tmp_path / "missing") == "0"
+
+
 def test_write_stub_dict_creates_file(tmp_path: Path) -> None:
     path = tmp_path / "topoSetDict"
     tools._write_stub_dict(path, "topoSet")
 
     text = path.read_text()
     assert "FoamFile" in text
+
+
+def test_shell_env_drops_startup_hooks(monkeypatch) -> None:
+    monkeypatch.setenv("BASH_ENV", "/tmp/rc")
+    monkeypatch.setenv("ENV", "/tmp/rc")
+    monkeypatch.setenv("OF_TUI_NO_FOAM", "1")
+
+    env = tools._shell_env()
+
+    assert "BASH_ENV" not in env and "ENV" not in env
+    assert env["OF_TUI_NO_FOAM"] == "1"
+
+
+def test_tools_screen_dispatches_special_actions_in_label_order(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    called: list[str] = []
+
+    class FakeMenu:
+        def __init__(self, _stdscr, _title, options, **_kwargs) -> None:
+            self.options = options
+
+        def navigate(self) -> int:
+            return self.options.index("Remove all logs (CleanFunctions)")
+
+    def recorder(name: str):
+        return lambda _stdscr, _case: called.append(name)
+
+    monkeypatch.setattr(tools, "Menu", FakeMenu)
+    monkeypatch.setattr(
+        tools,
+        "_SPECIAL_ACTIONS",
+        tuple(recorder(fn.__name__) for fn in tools._SPECIAL_ACTIONS),
+    )
+
+    tools.tools_screen(FakeScreen(), case_dir)
+
+    assert called == ["remove_all_logs"]
+
+
+def test_tools_screen_reads_status_mode_once(tmp_path: Path, monkeypatch) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    hints: list[str] = []
+    status_calls: list[int] = []
+
+    class FakeMenu:
+        def __init__(self, _stdscr, _title, options, hint_provider=None, **_kwargs) -> None:
+            self.options = options
+            self.hint_provider = hint_provider
+
+        def navigate(self) -> int:
+            hints.extend(self.hint_provider(idx) for idx in range(len(self.options)))
+            return -1
+
+    def fake_status() -> str:
+        status_calls.append(1)
+        return "mode: foam"
+
+    monkeypatch.setattr(tools, "Menu", FakeMenu)
+    monkeypatch.setattr(tools, "tool_status_mode", fake_status)
+
+    tools.tools_screen(FakeScreen(), case_dir)
+
+    assert len(status_calls) == 1
+    assert hints[0].endswith(" | mode: foam")
+    assert hints[-2] == "Clean case (logs + time dirs) | mode: foam"
+
+
+def test_expand_command_looks_up_latest_time_only_for_placeholder(tmp_path: Path, monkeypatch) -> None:
+    lookups: list[Path] = []
+
+    def fake_latest(case: Path) -> str:
+        lookups.append(case)
+        return "0.5"
+
+    monkeypatch.setattr(tools, "_latest_time", fake_latest)
+
+    assert tools._expand_command(["blockMesh"], tmp_path) == ["blockMesh"]
+    assert tools._expand_shell_command("cleanCase", tmp_path) == "cleanCase"
+    assert lookups == []
+
+    assert tools._expand_command(["foamToVTK", "-time", "{{latestTime}}"], tmp_path)[-1] == "0.5"
+    assert tools._expand_shell_command("ls {{latestTime}}", tmp_path) == "ls 0.5"
+    assert len(lookups) == 2